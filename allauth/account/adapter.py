@@ -5,7 +5,7 @@ import inspect
 import json
 import warnings
 from http import HTTPStatus
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable, Iterable
 from urllib.parse import urlparse
 
 from django.conf import settings
@@ -63,6 +63,7 @@ if TYPE_CHECKING:
     from django.forms import BaseForm
 
     from allauth.account.models import EmailAddress, EmailConfirmation, Login
+    from allauth.core.internal.mailkit import BulkMailProgress
 
 
 class DefaultAccountAdapter(BaseAdapter):
@@ -937,6 +938,41 @@ class DefaultAccountAdapter(BaseAdapter):
             ctx.update(context)
         self.send_mail(template_prefix, email, ctx)
 
+    def send_bulk_notification_mail(
+        self,
+        template_prefix: str,
+        users: Iterable[AbstractBaseUser],
+        context: dict[str, Any] | None = None,
+        *,
+        batch_size: int = 100,
+        workers: int = 0,
+        on_batch: Callable[[BulkMailProgress], None] | None = None,
+    ) -> BulkMailProgress:
+        """
+        Sends a notification mail to (the primary email address of) each of
+        the given users, e.g. when notifying all of your users of a security
+        policy change. Contrary to ``send_notification_mail()``, the messages
+        are sent in batches over a single mail backend connection, and
+        ``send_mail()`` is not invoked. As the notification does not originate
+        from a request, the ``ip`` and ``user_agent`` template variables are
+        only available when passed explicitly via ``context``.
+        """
+        from allauth.core.internal.mailkit import BulkMailProgress, send_bulk_mail
+
+        if not app_settings.EMAIL_NOTIFICATIONS:
+            return BulkMailProgress()
+        ctx = {"timestamp": timezone.now()}
+        if context:
+            ctx.update(context)
+        return send_bulk_mail(
+            template_prefix,
+            users,
+            ctx,
+            batch_size=batch_size,
+            workers=workers,
+            on_batch=on_batch,
+        )
+
     def generate_login_code(self) -> str:
         """
         Generates a new login code.
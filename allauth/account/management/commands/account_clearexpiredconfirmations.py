@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from allauth.account.models import EmailConfirmation
+from allauth.core.internal.modelkit import ChunkedDeleteProgress
+
+
+class Command(BaseCommand):
+    help = "Deletes expired email confirmations."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--chunk-size", type=int, default=1000)
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=0,
+            help="Seconds to sleep in between chunks.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        def on_chunk(progress: ChunkedDeleteProgress) -> None:
+            if options["verbosity"] > 1:
+                self.stdout.write(
+                    f"{progress.deleted} deleted in {progress.elapsed:.1f}s "
+                    f"({progress.rate:.1f} rows/s)."
+                )
+
+        count = EmailConfirmation.objects.delete_expired_confirmations(
+            chunk_size=options["chunk_size"],
+            sleep=options["sleep"],
+            on_chunk=on_chunk,
+        )
+        self.stdout.write(f"{count} expired email confirmation(s) deleted.")
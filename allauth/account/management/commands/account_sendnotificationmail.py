@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import FieldDoesNotExist
+from django.core.management.base import BaseCommand, CommandError
+
+from allauth.account import app_settings
+from allauth.account.adapter import get_adapter
+from allauth.core.internal.mailkit import BulkMailProgress
+
+
+class Command(BaseCommand):
+    help = "Sends a notification mail to all (active) users."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "template_prefix",
+            help='The mail to send, e.g. "account/email/password_policy_changed".',
+        )
+        parser.add_argument("--batch-size", type=int, default=100)
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=0,
+            help="The number of processes to render the mails in.",
+        )
+        parser.add_argument(
+            "--state-file",
+            help="Records the progress, so that an interrupted run can be resumed.",
+        )
+        parser.add_argument(
+            "--context",
+            action="append",
+            default=[],
+            metavar="KEY=VALUE",
+            help="Additional template context.",
+        )
+        parser.add_argument("--include-inactive", action="store_true")
+
+    def handle(self, *args, **options) -> None:
+        if not app_settings.EMAIL_NOTIFICATIONS:
+            raise CommandError("ACCOUNT_EMAIL_NOTIFICATIONS is disabled.")
+        template_prefix = options["template_prefix"]
+        context = {}
+        for item in options["context"]:
+            key, sep, value = item.partition("=")
+            if not sep:
+                raise CommandError(f"Invalid context: {item!r}")
+            context[key] = value
+        state_file = options["state_file"]
+        state = self.load_state(state_file, template_prefix)
+
+        users = self.get_users(options["include_inactive"])
+        if state["last_pk"] is not None:
+            users = users.filter(pk__gt=state["last_pk"])
+
+        def on_batch(progress: BulkMailProgress) -> None:
+            if state_file:
+                self.save_state(
+                    state_file,
+                    {
+                        "template_prefix": template_prefix,
+                        "last_pk": progress.last_pk,
+                        "sent": state["sent"] + progress.sent,
+                        "skipped": state["skipped"] + progress.skipped,
+                    },
+                )
+            if options["verbosity"] > 1:
+                self.write_progress(progress)
+
+        progress = get_adapter().send_bulk_notification_mail(
+            template_prefix,
+            users.iterator(chunk_size=options["batch_size"]),
+            context,
+            batch_size=options["batch_size"],
+            workers=options["workers"],
+            on_batch=on_batch,
+        )
+        self.write_progress(progress)
+
+    def get_users(self, include_inactive: bool):
+        User = get_user_model()
+        users = User._default_manager.order_by("pk")
+        if not include_inactive:
+            try:
+                User._meta.get_field("is_active")
+            except FieldDoesNotExist:
+                pass
+            else:
+                users = users.filter(is_active=True)
+        return users
+
+    def load_state(self, state_file: str | None, template_prefix: str) -> dict:
+        state = {"last_pk": None, "sent": 0, "skipped": 0}
+        if state_file and os.path.exists(state_file):
+            state.update(json.loads(Path(state_file).read_text()))
+            if state.get("template_prefix") != template_prefix:
+                raise CommandError(
+                    f"State file {state_file} belongs to a different mail: {state.get('template_prefix')}"
+                )
+            self.stdout.write(f"Resuming after user pk {state['last_pk']}.")
+        return state
+
+    def save_state(self, state_file: str, state: dict) -> None:
+        # Write-then-rename, so that the state file is never left half written.
+        tmp_file = f"{state_file}.tmp"
+        Path(tmp_file).write_text(json.dumps(state, default=str))
+        os.replace(tmp_file, state_file)
+
+    def write_progress(self, progress: BulkMailProgress) -> None:
+        self.stdout.write(
+            f"{progress.sent} mail(s) sent, {progress.skipped} user(s) skipped, "
+            f"{progress.batches} batch(es) in {progress.elapsed:.1f}s "
+            f"({progress.rate:.1f} mails/s)."
+        )
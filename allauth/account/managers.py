@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import timedelta
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 
 from django.contrib.auth.base_user import AbstractBaseUser
 from django.db import models, transaction
@@ -9,6 +9,8 @@ from django.db.models import Q
 from django.http import HttpRequest
 from django.utils import timezone
 
+from allauth.core.internal.modelkit import ChunkedDeleteProgress, delete_in_chunks
+
 from . import app_settings
 
 
@@ -108,6 +110,25 @@ class EmailAddressManager(models.Manager["EmailAddress"]):
             email = user_email(user)
         return email
 
+    def get_primary_emails(self, users: list[AbstractBaseUser]) -> dict:
+        """
+        Bulk version of ``get_primary_email()``, returning a mapping of user
+        primary key to email address, using a single query.
+        """
+        from allauth.account.utils import user_email
+
+        ret = dict(
+            self.filter(user_id__in=[user.pk for user in users], primary=True)
+            .values_list("user_id", "email")
+            .order_by()
+        )
+        for user in users:
+            if user.pk not in ret:
+                email = user_email(user)
+                if email:
+                    ret[user.pk] = email
+        return ret
+
     def get_users_for(self, email) -> list[AbstractBaseUser]:
         # this is a list rather than a generator because we probably want to
         # do a len() on it right away
@@ -160,5 +181,21 @@ class EmailConfirmationManager(models.Manager):
         )
         return Q(sent__lt=sent_threshold)
 
-    def delete_expired_confirmations(self) -> None:
-        self.all_expired().delete()
+    def delete_expired_confirmations(
+        self,
+        *,
+        chunk_size: int | None = None,
+        sleep: float = 0,
+        on_chunk: Callable[[ChunkedDeleteProgress], None] | None = None,
+    ) -> int:
+        """
+        Deletes all expired confirmations, returning the number of deleted
+        confirmations. By default, this is done in a single statement. On large
+        tables, pass ``chunk_size`` to delete in bounded chunks instead.
+        """
+        if chunk_size is None:
+            return self.all_expired().delete()[1].get(self.model._meta.label, 0)
+        progress = delete_in_chunks(
+            self.all_expired(), chunk_size=chunk_size, sleep=sleep, on_chunk=on_chunk
+        )
+        return progress.deleted
@@ -54,13 +54,19 @@ class LazyModule:
         # never shadows _resolve/_lazy_* which live in the instance/class dict.
         module = self._resolve()
         try:
-            return getattr(module, attr)
+            value = getattr(module, attr)
         except AttributeError:
             name = object.__getattribute__(self, "_lazy_name")
             full = f"{name}.{attr}"
             if importlib.util.find_spec(full) is not None:
                 return LazyModule(full)
             raise
+        if isinstance(value, ModuleType):
+            # An already imported submodule need not have its own submodules
+            # imported, so keep it lazy as well (and remember it).
+            value = LazyModule(value.__name__)
+            object.__setattr__(self, attr, value)
+        return value
 
     def __repr__(self) -> str:
         name = object.__getattribute__(self, "_lazy_name")
@@ -76,6 +82,8 @@ if TYPE_CHECKING:
     # importing nothing at runtime. Submodules are spelled out because an
     # ``import cryptography`` alone does not make them resolvable.
     import cryptography.hazmat.backends
+    import cryptography.hazmat.primitives.asymmetric.ec
+    import cryptography.hazmat.primitives.asymmetric.ed25519
     import cryptography.hazmat.primitives.asymmetric.rsa
     import cryptography.hazmat.primitives.ciphers
     import cryptography.hazmat.primitives.serialization
@@ -1,21 +1,26 @@
 from __future__ import annotations
 
 import base64
+import hashlib
 import ipaddress
 import json
+from dataclasses import dataclass
 from urllib.parse import parse_qs, quote, urlencode, urlparse, urlunparse
 
 from django import shortcuts
 from django.contrib.auth.models import AbstractBaseUser
 from django.core.exceptions import ImproperlyConfigured, PermissionDenied
+from django.core.serializers.json import DjangoJSONEncoder
 from django.http import (
     HttpRequest,
+    HttpResponse,
     HttpResponseRedirect,
     HttpResponseServerError,
     QueryDict,
 )
 from django.http.request import split_domain_port
 from django.urls import NoReverseMatch, reverse
+from django.utils.cache import get_conditional_response
 
 from allauth import app_settings as allauth_settings
 
@@ -241,3 +246,40 @@ def extract_basic_auth(headers: dict) -> tuple[str | None, str | None]:
     if not client_id or not client_secret:
         return None, None
     return client_id, client_secret
+
+
+@dataclass(frozen=True)
+class JSONDocument:
+    """
+    A serialized JSON payload, along with its (strong) ETag, so that it can be
+    served over and over again without having to serialize it each time.
+    """
+
+    body: bytes
+    etag: str
+
+    @classmethod
+    def from_data(cls, data) -> JSONDocument:
+        body = json.dumps(data, cls=DjangoJSONEncoder).encode("utf-8")
+        return cls(body=body, etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"')
+
+
+def json_document_response(
+    request: HttpRequest, document: JSONDocument, headers: dict[str, str] | None = None
+) -> HttpResponse:
+    """
+    Serves the document, responding with a 304 (Not Modified) in case the
+    client already has the current version (``If-None-Match``).
+    """
+    response = HttpResponse(document.body, content_type="application/json")
+    response["ETag"] = document.etag
+    for header, value in (headers or {}).items():
+        response[header] = value
+    conditional_response = get_conditional_response(
+        request, etag=document.etag, response=response
+    )
+    if conditional_response is not response:
+        # Not all headers are retained on the 304 response (e.g. CORS).
+        for header, value in (headers or {}).items():
+            conditional_response[header] = value
+    return conditional_response
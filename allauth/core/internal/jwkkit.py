@@ -12,6 +12,7 @@ from allauth.core.internal.deferred import cryptography, jwt
 # In lexicographic order as described in RFC7638
 JWK_REQUIRED_MEMBERS = {
     "EC": ("crv", "kty", "x", "y"),
+    "OKP": ("crv", "kty", "x"),
     "RSA": ("e", "kty", "n"),
     "oct": ("k", "kty"),
 }
@@ -30,11 +31,36 @@ def jwk_thumbprint(jwk_dict: dict[str, Any]) -> str:
     return base64.urlsafe_b64encode(json_hash).rstrip(b"=").decode()
 
 
-def load_pem(pem: str) -> cryptography.hazmat.primitives.asymmetric.rsa.RSAPrivateKey:
+def load_private_key(
+    pem: str,
+) -> (
+    cryptography.hazmat.primitives.asymmetric.rsa.RSAPrivateKey
+    | cryptography.hazmat.primitives.asymmetric.ec.EllipticCurvePrivateKey
+    | cryptography.hazmat.primitives.asymmetric.ed25519.Ed25519PrivateKey
+):
+    """
+    Loads an RSA, EC or Ed25519 private key. Raises ``ValueError`` for other
+    key types.
+    """
+    asymmetric = cryptography.hazmat.primitives.asymmetric
     private_key = cryptography.hazmat.primitives.serialization.load_pem_private_key(
         pem.encode("utf8"),
         password=None,
     )
+    if not isinstance(
+        private_key,
+        (
+            asymmetric.rsa.RSAPrivateKey,
+            asymmetric.ec.EllipticCurvePrivateKey,
+            asymmetric.ed25519.Ed25519PrivateKey,
+        ),
+    ):
+        raise ValueError
+    return private_key
+
+
+def load_pem(pem: str) -> cryptography.hazmat.primitives.asymmetric.rsa.RSAPrivateKey:
+    private_key = load_private_key(pem)
     if not isinstance(
         private_key, cryptography.hazmat.primitives.asymmetric.rsa.RSAPrivateKey
     ):
@@ -42,11 +68,25 @@ def load_pem(pem: str) -> cryptography.hazmat.primitives.asymmetric.rsa.RSAPriva
     return private_key
 
 
+def private_key_to_jwk(private_key) -> dict[str, Any]:
+    """
+    Returns the JWK of the public part of the given (RSA, EC or Ed25519)
+    private key, including its thumbprint as the ``kid``.
+    """
+    asymmetric = cryptography.hazmat.primitives.asymmetric
+    if isinstance(private_key, asymmetric.rsa.RSAPrivateKey):
+        algorithm = jwt.algorithms.RSAAlgorithm
+    elif isinstance(private_key, asymmetric.ec.EllipticCurvePrivateKey):
+        algorithm = jwt.algorithms.ECAlgorithm
+    else:
+        algorithm = jwt.algorithms.OKPAlgorithm
+    jwk_dict = json.loads(algorithm.to_jwk(private_key.public_key()))
+    jwk_dict["kid"] = jwk_thumbprint(jwk_dict)
+    return jwk_dict
+
+
 def load_jwk_from_pem(
     pem: str,
 ) -> tuple[dict[str, Any], cryptography.hazmat.primitives.asymmetric.rsa.RSAPrivateKey]:
     private_key = load_pem(pem)
-    public_key = private_key.public_key()
-    jwk_dict = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(public_key))
-    jwk_dict["kid"] = jwk_thumbprint(jwk_dict)
-    return jwk_dict, private_key
+    return private_key_to_jwk(private_key), private_key
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import multiprocessing
+import pickle  # nosec
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator
+
+from django.contrib.sites.shortcuts import get_current_site
+from django.core.mail import EmailMessage, get_connection
+
+from allauth.core import context as core_context
+
+
+if TYPE_CHECKING:
+    from django.contrib.auth.base_user import AbstractBaseUser
+
+# Note that this module is imported by the worker processes before Django is
+# set up, so no models may be imported at module level.
+
+
+@dataclass
+class BulkMailProgress:
+    sent: int = 0
+    skipped: int = 0
+    batches: int = 0
+    last_pk: Any = None
+    elapsed: float = 0.0
+
+    @property
+    def rate(self) -> float:
+        """
+        Throughput, in messages sent per second.
+        """
+        if not self.elapsed:
+            return 0.0
+        return self.sent / self.elapsed
+
+
+def iter_batches(iterable: Iterable, size: int) -> Iterator[list]:
+    it = iter(iterable)
+    while batch := list(islice(it, size)):
+        yield batch
+
+
+def render_mails(
+    template_prefix: str,
+    recipients: list[tuple[AbstractBaseUser, str]],
+    context: dict[str, Any],
+) -> list[EmailMessage]:
+    from allauth.account.adapter import get_adapter
+
+    adapter = get_adapter()
+    ret = []
+    for user, email in recipients:
+        ctx = dict(context)
+        ctx.update({"user": user, "email": email})
+        ret.append(adapter.render_mail(template_prefix, email, ctx))
+    return ret
+
+
+def _init_worker(pickled_site: bytes) -> None:
+    import django
+
+    django.setup()
+    site = pickle.loads(pickled_site)  # nosec
+    if getattr(site, "pk", None) is not None:
+        from django.contrib.sites.models import SITE_CACHE
+
+        # Avoid a database roundtrip (from a process that may not even be
+        # able to reach the database) when the subject prefix is formatted.
+        SITE_CACHE[site.pk] = site
+
+
+def send_bulk_mail(
+    template_prefix: str,
+    users: Iterable[AbstractBaseUser],
+    context: dict[str, Any],
+    *,
+    batch_size: int = 100,
+    workers: int = 0,
+    connection=None,
+    on_batch: Callable[[BulkMailProgress], None] | None = None,
+) -> BulkMailProgress:
+    """
+    Renders and sends a mail to the primary email address of each of the
+    given users.  Users are consumed lazily, in batches of ``batch_size``.  All
+    messages are sent over the same connection, one ``send_messages()`` call
+    per batch.  When ``workers`` is set, rendering is offloaded to that many
+    worker processes, while the sending remains in the current process.
+
+    After each batch has been sent, ``on_batch`` is invoked with the progress
+    so far.  As ``progress.last_pk`` then refers to the last user of a batch
+    that was fully handed over to the mail backend, it can be persisted in
+    order to resume an interrupted run.
+    """
+    from allauth.account.models import EmailAddress
+
+    progress = BulkMailProgress()
+    started_at = time.monotonic()
+    site = get_current_site(core_context.request)
+    context = {"current_site": site, **context}
+    if connection is None:
+        connection = get_connection()
+    executor = None
+    if workers:
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(pickle.dumps(site),),
+        )
+    # Rendered (or being rendered) batches, in order, that still need to be
+    # sent. Bounded, so that we never consume (much) more of the users than we
+    # are able to process.
+    pending: deque[tuple[Any, Future | list[EmailMessage]]] = deque()
+    max_pending = max(workers * 2, 1)
+
+    def send_pending() -> None:
+        last_pk, messages = pending.popleft()
+        if isinstance(messages, Future):
+            messages = messages.result()
+        if messages:
+            progress.sent += connection.send_messages(messages) or 0
+        progress.batches += 1
+        progress.last_pk = last_pk
+        progress.elapsed = time.monotonic() - started_at
+        if on_batch:
+            on_batch(progress)
+
+    connection.open()
+    try:
+        for batch in iter_batches(users, batch_size):
+            emails = EmailAddress.objects.get_primary_emails(batch)
+            recipients = []
+            for user in batch:
+                email = emails.get(user.pk)
+                if email:
+                    recipients.append((user, email))
+                else:
+                    progress.skipped += 1
+            messages: Future | list[EmailMessage]
+            if executor:
+                messages = executor.submit(
+                    render_mails, template_prefix, recipients, context
+                )
+            else:
+                messages = render_mails(template_prefix, recipients, context)
+            pending.append((batch[-1].pk, messages))
+            while len(pending) >= max_pending:
+                send_pending()
+        while pending:
+            send_pending()
+    finally:
+        connection.close()
+        if executor:
+            executor.shutdown(cancel_futures=True)
+    progress.elapsed = time.monotonic() - started_at
+    return progress
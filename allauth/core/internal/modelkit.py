@@ -1,10 +1,15 @@
 import base64
 import json
+import time
+from dataclasses import dataclass
+from typing import Callable
 
 from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
 from django.core.files.base import ContentFile
 from django.core.serializers.json import DjangoJSONEncoder
-from django.db.models import FileField
+from django.db import connections
+from django.db.models import FileField, QuerySet
+from django.db.models.deletion import Collector
 from django.db.models.fields import BinaryField, DateField, DateTimeField, TimeField
 from django.utils import dateparse
 from django.utils.encoding import force_bytes, force_str
@@ -87,3 +92,116 @@ def deserialize_instance(model, data):
                 pass
         setattr(ret, k, v)
     return ret
+
+
+@dataclass
+class ChunkedDeleteProgress:
+    deleted: int = 0
+    chunks: int = 0
+    elapsed: float = 0.0
+    finished: bool = False
+
+    @property
+    def rate(self) -> float:
+        """
+        Throughput, in rows deleted per second.
+        """
+        if not self.elapsed:
+            return 0.0
+        return self.deleted / self.elapsed
+
+
+def raw_delete_chunk(queryset: QuerySet, chunk_size: int, order_by: str) -> int:
+    """
+    Deletes the first ``chunk_size`` rows of the queryset (as ordered by
+    ``order_by``) using a single ``DELETE`` statement, bypassing signals and
+    cascades.
+    """
+    model = queryset.model
+    connection = connections[queryset.db]
+    qn = connection.ops.quote_name
+    pk_field = model._meta.pk
+    select = queryset.order_by(order_by).values(pk_field.attname)[:chunk_size]
+    sql, params = select.query.sql_with_params()
+    table = qn(model._meta.db_table)
+    pk = qn(pk_field.column)
+    # Not all databases support ``DELETE ... LIMIT``, and MySQL does not
+    # support ``LIMIT`` in an ``IN`` subquery, hence the derived table.
+    stmt = f"DELETE FROM {table} WHERE {pk} IN (SELECT chunk.{pk} FROM ({sql}) chunk)"  # nosec
+    with connection.cursor() as cursor:
+        cursor.execute(stmt, params)
+        return cursor.rowcount
+
+
+def delete_in_chunks(
+    queryset: QuerySet,
+    *,
+    chunk_size: int = 1000,
+    order_by: str = "pk",
+    raw: bool = False,
+    sleep: float = 0,
+    max_runtime: float | None = None,
+    on_chunk: Callable[[ChunkedDeleteProgress], None] | None = None,
+    before_chunk: Callable[[QuerySet], None] | None = None,
+) -> ChunkedDeleteProgress:
+    """
+    Deletes the rows matching the queryset in chunks of (at most)
+    ``chunk_size`` rows, ordered by ``order_by`` (preferably an indexed
+    column), each chunk in its own (short) transaction.  In between chunks, it
+    optionally sleeps to reduce the load on the database.  When
+    ``max_runtime`` (seconds) is exceeded no further chunks are deleted, in
+    which case ``finished`` of the resulting progress is ``False``.
+
+    If the deletion does not need to be collected (no delete signal receivers
+    attached, and no relations to cascade), the chunk is deleted straight away
+    without loading the model instances. Otherwise, the regular ``delete()``
+    is used, so that signals are sent and cascades are handled. Pass ``raw``
+    to unconditionally delete each chunk using a single statement.
+
+    ``before_chunk`` is passed the rows of each chunk (as a queryset) right
+    before these are deleted, e.g. to find out what is affected. It is not
+    called in ``raw`` mode.
+    """
+    model = queryset.model
+    db = queryset.db
+    fast = Collector(using=db).can_fast_delete(queryset)
+    progress = ChunkedDeleteProgress()
+    started_at = time.monotonic()
+    last_pk = None
+    while True:
+        if raw:
+            deleted = count = raw_delete_chunk(queryset, chunk_size, order_by)
+        else:
+            qs = queryset.order_by(order_by)
+            if last_pk is not None:
+                # Keyset pagination, so that we do not need to skip over the
+                # (possibly not yet vacuumed) rows we already deleted.
+                qs = qs.filter(pk__gt=last_pk)
+            pks = list(qs.values_list("pk", flat=True)[:chunk_size])
+            count = len(pks)
+            if order_by == "pk" and pks:
+                last_pk = pks[-1]
+            chunk = model._base_manager.using(db).filter(pk__in=pks)
+            if pks and before_chunk:
+                before_chunk(chunk)
+            if not pks:
+                deleted = 0
+            elif fast:
+                deleted = chunk._raw_delete(db)
+            else:
+                deleted = chunk.delete()[1].get(model._meta.label, 0)
+        progress.elapsed = time.monotonic() - started_at
+        if count:
+            progress.deleted += deleted
+            progress.chunks += 1
+            if on_chunk:
+                on_chunk(progress)
+        if count < chunk_size:
+            progress.finished = True
+            break
+        if max_runtime is not None and progress.elapsed >= max_runtime:
+            break
+        if sleep:
+            time.sleep(sleep)
+    progress.elapsed = time.monotonic() - started_at
+    return progress
@@ -1,7 +1,15 @@
+from __future__ import annotations
+
+from importlib import import_module
+from typing import Iterable
+
+from django.conf import settings
 from django.contrib.auth import get_user
 from django.contrib.auth.base_user import AbstractBaseUser
 from django.contrib.sessions.backends.base import SessionBase
+from django.core.cache import caches
 from django.http import HttpRequest
+from django.utils import timezone
 
 
 def get_session_user(session: SessionBase) -> AbstractBaseUser | None:
@@ -11,3 +19,70 @@ def get_session_user(session: SessionBase) -> AbstractBaseUser | None:
     if not user or user.is_anonymous:
         return None
     return user
+
+
+def get_session_store_class() -> type[SessionBase]:
+    engine = import_module(settings.SESSION_ENGINE)
+    return engine.SessionStore
+
+
+def load_sessions(session_keys: Iterable[str]) -> dict[str, SessionBase]:
+    """
+    Loads the sessions for the given keys in bulk, returning the (loaded)
+    session stores by key.  Sessions that do not exist (anymore) are omitted.
+    For the database backed session engines, this takes one query, for the
+    cache based ones, one ``get_many()``.  Other session engines fall back to
+    loading the sessions one by one.
+    """
+    from django.contrib.sessions.backends import (
+        cache as cache_backend,
+        cached_db as cached_db_backend,
+        db as db_backend,
+    )
+
+    SessionStore = get_session_store_class()
+    keys = list(dict.fromkeys(key for key in session_keys if key))
+    data: dict[str, dict] = {}
+    is_cached = issubclass(
+        SessionStore, (cache_backend.SessionStore, cached_db_backend.SessionStore)
+    )
+    is_db = issubclass(SessionStore, db_backend.SessionStore)
+    if is_cached:
+        cache = caches[settings.SESSION_CACHE_ALIAS]
+        prefix = SessionStore.cache_key_prefix  # type: ignore[attr-defined]
+        try:
+            hits = cache.get_many([prefix + key for key in keys])
+        except Exception:
+            # Mirror ``load()``, which treats invalid cache keys as misses.
+            hits = {}
+        for key in keys:
+            if hits.get(prefix + key) is not None:
+                data[key] = hits[prefix + key]
+    if is_db:
+        missing = [key for key in keys if key not in data]
+        if missing:
+            decoder = SessionStore()
+            rows = (
+                SessionStore.get_model_class()  # type: ignore[attr-defined]
+                ._default_manager.filter(
+                    session_key__in=missing, expire_date__gt=timezone.now()
+                )
+                .values_list("session_key", "session_data")
+            )
+            for key, session_data in rows:
+                data[key] = decoder.decode(session_data)
+    elif not is_cached:
+        ret = {}
+        for key in keys:
+            store = SessionStore(key)
+            store._session_cache = store.load()  # type: ignore[attr-defined]
+            # Backends reset the session key when the session does not exist.
+            if store.session_key == key:
+                ret[key] = store
+        return ret
+    ret = {}
+    for key, session_data in data.items():
+        store = SessionStore(key)
+        store._session_cache = session_data  # type: ignore[attr-defined]
+        ret[key] = store
+    return ret
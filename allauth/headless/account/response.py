@@ -38,9 +38,11 @@ class VerifyEmailResponse(APIResponse):
 
 
 class EmailAddressesResponse(APIResponse):
-    def __init__(self, request: HttpRequest, email_addresses) -> None:
+    def __init__(
+        self, request: HttpRequest, email_addresses, session_meta: dict | None = None
+    ) -> None:
         data = [email_address_data(addr) for addr in email_addresses]
-        super().__init__(request, data=data)
+        super().__init__(request, data=data, session_meta=session_meta)
 
 
 class PhoneNumbersResponse(APIResponse):
@@ -63,7 +63,7 @@ from allauth.headless.base.response import (
     RateLimitResponse,
 )
 from allauth.headless.base.views import APIView, AuthenticatedAPIView
-from allauth.headless.internal import authkit
+from allauth.headless.internal import authkit, etagkit
 from allauth.headless.internal.restkit.inputs import Input
 from allauth.headless.internal.restkit.response import APIResponse, ErrorResponse
 
@@ -447,11 +447,23 @@ class ManageEmailView(APIView):
         return super().dispatch(request, *args, **kwargs)
 
     def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
-        return self._respond_email_list()
+        pending_email = None
+        if account_settings.EMAIL_VERIFICATION_BY_CODE_ENABLED:
+            # The email address pending verification is listed as well.
+            process = EmailVerificationProcess.resume(request)
+            if process:
+                pending_email = process.email_address.email
+        return etagkit.respond(
+            request, etagkit.EMAIL, self._respond_email_list, pending_email
+        )
 
-    def _respond_email_list(self) -> response.EmailAddressesResponse:
+    def _respond_email_list(
+        self, session_meta: dict | None = None
+    ) -> response.EmailAddressesResponse:
         addrs = manage_email.list_email_addresses(self.request, self.user)
-        return response.EmailAddressesResponse(self.request, addrs)
+        return response.EmailAddressesResponse(
+            self.request, addrs, session_meta=session_meta
+        )
 
     def post(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
         if self.verification_stage_process:
@@ -42,6 +42,10 @@ class AppSettings:
             "SPECIFICATION_TEMPLATE_NAME", "headless/spec/redoc_cdn.html"
         )
 
+    @property
+    def SPECIFICATION_CACHE_MAX_AGE(self) -> int:
+        return self._setting("SPECIFICATION_CACHE_MAX_AGE", 60 * 60)
+
     @property
     def CLIENTS(self) -> tuple[str, ...]:
         return tuple(self._setting("CLIENTS", ("browser", "app")))
@@ -50,6 +54,22 @@ class AppSettings:
     def FRONTEND_URLS(self) -> dict:
         return self._setting("FRONTEND_URLS", {})
 
+    @property
+    def CONFIG_CACHE_TIMEOUT(self) -> int:
+        return self._setting("CONFIG_CACHE_TIMEOUT", 0)
+
+    @property
+    def CONFIG_MAX_AGE(self) -> int | None:
+        return self._setting("CONFIG_MAX_AGE", None)
+
+    @property
+    def CONDITIONAL_REQUESTS(self) -> bool:
+        return self._setting("CONDITIONAL_REQUESTS", False)
+
+    @property
+    def USER_CACHE_TIMEOUT(self) -> int:
+        return self._setting("USER_CACHE_TIMEOUT", 0)
+
     @property
     def JWT_ALGORITHM(self) -> str:
         return self._setting("JWT_ALGORITHM", "RS256")
@@ -74,10 +94,22 @@ class AppSettings:
     def JWT_STATEFUL_VALIDATION_ENABLED(self) -> bool:
         return self._setting("JWT_STATEFUL_VALIDATION_ENABLED", False)
 
+    @property
+    def JWT_STATEFUL_VALIDATION_CACHE_TIMEOUT(self) -> int:
+        return self._setting("JWT_STATEFUL_VALIDATION_CACHE_TIMEOUT", 0)
+
     @property
     def JWT_ROTATE_REFRESH_TOKEN(self) -> bool:
         return self._setting("JWT_ROTATE_REFRESH_TOKEN", True)
 
+    @property
+    def JWT_MAX_REFRESH_TOKENS_PER_SESSION(self) -> int:
+        return self._setting("JWT_MAX_REFRESH_TOKENS_PER_SESSION", 10)
+
+    @property
+    def JWT_REFRESH_TOKEN_STATE_STORAGE(self) -> str:
+        return self._setting("JWT_REFRESH_TOKEN_STATE_STORAGE", "session")
+
 
 _app_settings = AppSettings("HEADLESS_")
 
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from django.apps import AppConfig
+from django.apps import AppConfig, apps
 from django.utils.translation import gettext_lazy as _
 
 
@@ -9,4 +9,37 @@ class HeadlessConfig(AppConfig):
     verbose_name = _("Headless")
 
     def ready(self) -> None:
+        from django.conf import settings
+        from django.contrib.auth.signals import user_logged_out
+        from django.db.models.signals import post_delete, post_save
+
+        from allauth.account.models import EmailAddress
         from allauth.headless import checks  # noqa
+        from allauth.headless.internal import configcache, etagkit, usercache
+        from allauth.headless.tokens.strategies.jwt import revocation
+
+        user_logged_out.connect(revocation.on_user_logged_out)
+        for signal in [post_save, post_delete]:
+            signal.connect(usercache.on_user_changed, sender=settings.AUTH_USER_MODEL)
+        for signal in [post_save, post_delete]:
+            signal.connect(etagkit.on_email_address_changed, sender=EmailAddress)
+        if apps.is_installed("allauth.socialaccount"):
+            from django.db.models.signals import m2m_changed
+
+            from allauth.socialaccount.models import SocialAccount, SocialApp
+
+            for signal in [post_save, post_delete]:
+                signal.connect(configcache.on_social_app_changed, sender=SocialApp)
+                signal.connect(etagkit.on_social_account_changed, sender=SocialAccount)
+            m2m_changed.connect(
+                configcache.on_social_app_changed, sender=SocialApp.sites.through
+            )
+        if apps.is_installed("allauth.mfa"):
+            from allauth.mfa.models import Authenticator
+
+            for signal in [post_save, post_delete]:
+                signal.connect(etagkit.on_authenticator_changed, sender=Authenticator)
+        if apps.is_installed("allauth.usersessions"):
+            from allauth.usersessions.signals import sessions_ended
+
+            sessions_ended.connect(revocation.on_sessions_ended)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from http import HTTPStatus
 
 from django.http import HttpRequest
@@ -11,15 +12,22 @@ from allauth.account.app_settings import LoginMethod
 from allauth.account.authentication import get_authentication_records
 from allauth.account.internal import flows
 from allauth.account.internal.stagekit import LOGIN_SESSION_KEY
+from allauth.core.internal.httpkit import JSONDocument
 from allauth.headless.adapter import get_adapter
 from allauth.headless.constants import Flow
-from allauth.headless.internal import authkit
+from allauth.headless.internal import authkit, configcache
 from allauth.headless.internal.restkit.response import APIResponse
 from allauth.mfa import app_settings as mfa_settings
 
 
 class BaseAuthenticationResponse(APIResponse):
-    def __init__(self, request: HttpRequest, user=None, status=None) -> None:
+    def __init__(
+        self,
+        request: HttpRequest,
+        user=None,
+        status=None,
+        session_meta: dict | None = None,
+    ) -> None:
         data: dict = {}
         if user and user.is_authenticated:
             adapter = get_adapter()
@@ -38,6 +46,7 @@ class BaseAuthenticationResponse(APIResponse):
             data=data,
             meta=meta,
             status=status,
+            session_meta=session_meta,
         )
 
     def _get_flows(self, request: HttpRequest, user) -> list:
@@ -114,8 +123,8 @@ class BaseAuthenticationResponse(APIResponse):
 
 
 class AuthenticationResponse(BaseAuthenticationResponse):
-    def __init__(self, request: HttpRequest) -> None:
-        super().__init__(request, user=request.user)
+    def __init__(self, request: HttpRequest, session_meta: dict | None = None) -> None:
+        super().__init__(request, user=request.user, session_meta=session_meta)
 
     @classmethod
     def from_response(cls, request: HttpRequest, response) -> AuthenticationResponse:
@@ -171,28 +180,76 @@ def get_config_data(request: HttpRequest) -> dict:
     return {"account": data}
 
 
+def get_config(request: HttpRequest) -> dict:
+    data = get_config_data(request)
+    if allauth_settings.SOCIALACCOUNT_ENABLED:
+        from allauth.headless.socialaccount.response import (
+            get_config_data as get_socialaccount_config_data,
+        )
+
+        data.update(get_socialaccount_config_data(request))
+    if allauth_settings.MFA_ENABLED:
+        from allauth.headless.mfa.response import get_config_data as get_mfa_config_data
+
+        data.update(get_mfa_config_data(request))
+    if allauth_settings.USERSESSIONS_ENABLED:
+        from allauth.headless.usersessions.response import (
+            get_config_data as get_usersessions_config_data,
+        )
+
+        data.update(get_usersessions_config_data(request))
+    return data
+
+
+def get_config_document(request: HttpRequest) -> JSONDocument:
+    return configcache.get_config_document(
+        request, lambda: {"status": HTTPStatus.OK, "data": get_config(request)}
+    )
+
+
 class ConfigResponse(APIResponse):
-    def __init__(self, request: HttpRequest) -> None:
-        data = get_config_data(request)
-        if allauth_settings.SOCIALACCOUNT_ENABLED:
-            from allauth.headless.socialaccount.response import (
-                get_config_data as get_socialaccount_config_data,
-            )
+    def __init__(self, request: HttpRequest, session_meta: dict | None = None) -> None:
+        return super().__init__(
+            request, data=get_config(request), session_meta=session_meta
+        )
 
-            data.update(get_socialaccount_config_data(request))
-        if allauth_settings.MFA_ENABLED:
-            from allauth.headless.mfa.response import (
-                get_config_data as get_mfa_config_data,
-            )
 
-            data.update(get_mfa_config_data(request))
-        if allauth_settings.USERSESSIONS_ENABLED:
-            from allauth.headless.usersessions.response import (
-                get_config_data as get_usersessions_config_data,
-            )
+class BootstrapResponse(APIResponse):
+    """
+    Combines the payloads of the endpoints a frontend requests on start up,
+    each one exactly as the respective endpoint would have responded. Any
+    newly issued tokens are exposed once, in the meta of the bootstrap
+    response itself, so the embedded payloads are built without.
+    """
 
-            data.update(get_usersessions_config_data(request))
-        return super().__init__(request, data=data)
+    def __init__(self, request: HttpRequest) -> None:
+        data = {
+            "config": json.loads(get_config_document(request).body),
+            "session": AuthenticationResponse(request, session_meta={}).payload,
+        }
+        user = request.user
+        if user.is_authenticated:
+            from allauth.account.internal.flows.manage_email import list_email_addresses
+            from allauth.headless.account.response import EmailAddressesResponse
+
+            data["email"] = EmailAddressesResponse(
+                request, list_email_addresses(request, user), session_meta={}
+            ).payload
+            if allauth_settings.MFA_ENABLED:
+                from allauth.headless.mfa.response import AuthenticatorsResponse
+                from allauth.mfa.models import Authenticator
+
+                data["authenticators"] = AuthenticatorsResponse(
+                    request, Authenticator.objects.filter(user=user), session_meta={}
+                ).payload
+            if allauth_settings.USERSESSIONS_ENABLED:
+                from allauth.headless.usersessions.response import SessionsResponse
+                from allauth.usersessions.models import UserSession
+
+                data["sessions"] = SessionsResponse(
+                    request, UserSession.objects.purge_and_list(user), session_meta={}
+                ).payload
+        super().__init__(request, data=data)
 
 
 class RateLimitResponse(APIResponse):
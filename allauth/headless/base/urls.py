@@ -13,4 +13,9 @@ def build_urlpatterns(client: Client) -> list[URLPattern]:
             views.ConfigView.as_api_view(client=client),
             name="config",
         ),
+        path(
+            "bootstrap",
+            views.BootstrapView.as_api_view(client=client),
+            name="bootstrap",
+        ),
     ]
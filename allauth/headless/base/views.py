@@ -4,13 +4,17 @@ from collections.abc import Callable
 from typing import Any
 
 from django.http import HttpRequest, HttpResponse, HttpResponseBase
+from django.utils.cache import add_never_cache_headers, patch_cache_control
 from django.utils.decorators import classonlymethod
 
 from allauth.account.stages import LoginStage, LoginStageController
 from allauth.core.exceptions import ReauthenticationRequired
+from allauth.core.internal.httpkit import json_document_response
+from allauth.headless import app_settings
 from allauth.headless.base import response
 from allauth.headless.constants import Client
 from allauth.headless.internal import decorators
+from allauth.headless.internal.restkit.response import get_session_meta
 from allauth.headless.internal.restkit.views import RESTView
 
 
@@ -69,4 +73,25 @@ class ConfigView(APIView):
         The frontend queries (GET) this endpoint, expecting to receive
         either a 401 if no user is authenticated, or user information.
         """
-        return response.ConfigResponse(request)
+        session_meta = get_session_meta(request)
+        if session_meta:
+            # Tokens are per request, so this response cannot be shared.
+            return response.ConfigResponse(request, session_meta=session_meta)
+        resp = json_document_response(request, response.get_config_document(request))
+        max_age = app_settings.CONFIG_MAX_AGE
+        if max_age is None:
+            add_never_cache_headers(resp)
+        elif max_age > 0:
+            patch_cache_control(resp, max_age=max_age)
+        else:
+            patch_cache_control(resp, no_cache=True)
+        return resp
+
+
+class BootstrapView(APIView):
+    def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        """
+        Returns the configuration, the authentication state and, if
+        authenticated, the account state, in one go.
+        """
+        return response.BootstrapResponse(request)
@@ -17,4 +17,10 @@ def settings_check(app_configs, **kwargs) -> list:
                     msg="HEADLESS_SERVE_SPECIFICATION requires the django-allauth[headless-spec] extra to be installed"
                 )
             )
+    if app_settings.JWT_REFRESH_TOKEN_STATE_STORAGE not in ("session", "cache"):
+        ret.append(
+            Critical(
+                msg='HEADLESS_JWT_REFRESH_TOKEN_STATE_STORAGE must be either "session" or "cache"'
+            )
+        )
     return ret
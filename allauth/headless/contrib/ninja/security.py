@@ -21,7 +21,7 @@ class XSessionTokenAuth(AuthBase):
     def __call__(self, request: HttpRequest):
         token = self.get_session_token(request)
         if token:
-            user_session = authenticate_by_x_session_token(token)
+            user_session = authenticate_by_x_session_token(token, request)
             if user_session:
                 return user_session[0]
         return None
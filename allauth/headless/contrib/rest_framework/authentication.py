@@ -18,7 +18,7 @@ class XSessionTokenAuthentication(authentication.BaseAuthentication):
     def authenticate(self, request: HttpRequest):
         token = self.get_session_token(request)
         if token:
-            return authenticate_by_x_session_token(token)
+            return authenticate_by_x_session_token(token, request)
         return None
 
     def get_session_token(self, request: HttpRequest) -> str | None:
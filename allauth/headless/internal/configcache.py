@@ -0,0 +1,75 @@
+"""
+The ``/config`` endpoint is requested by each and every frontend on start up,
+yet, its payload only varies by the settings, the site, the client, and the
+configured social apps. With ``HEADLESS_CONFIG_CACHE_TIMEOUT`` set, the payload
+is serialized once and served from memory for that many seconds. Changing a
+social app bumps a version kept in the (shared) Django cache, invalidating the
+payloads remembered by all processes.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable
+
+from django.contrib.sites.shortcuts import get_current_site
+from django.core.cache import cache
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.http import HttpRequest
+from django.utils.crypto import get_random_string
+
+from allauth.core.internal.httpkit import JSONDocument
+from allauth.headless import app_settings
+
+
+VERSION_KEY = "allauth.headless.config.version"
+# Bounded, as the site may be derived from the (client controlled) host.
+_MAX_DOCUMENTS = 32
+# (site, client) -> (expires at, version seen, document).
+_documents: dict[tuple[str, str], tuple[float, Any, JSONDocument]] = {}
+_lock = threading.Lock()
+
+
+def get_config_document(
+    request: HttpRequest, build: Callable[[], dict[str, Any]]
+) -> JSONDocument:
+    timeout = app_settings.CONFIG_CACHE_TIMEOUT
+    if timeout <= 0:
+        return JSONDocument.from_data(build())
+    key = (
+        get_current_site(request).domain,
+        request.allauth.headless.client,  # type: ignore[attr-defined]
+    )
+    version = cache.get(VERSION_KEY)
+    now = time.monotonic()
+    with _lock:
+        entry = _documents.get(key)
+    if entry is not None and entry[0] > now and entry[1] == version:
+        return entry[2]
+    document = JSONDocument.from_data(build())
+    with _lock:
+        if len(_documents) >= _MAX_DOCUMENTS:
+            _documents.clear()
+        _documents[key] = (now + timeout, version, document)
+    return document
+
+
+def invalidate() -> None:
+    with _lock:
+        _documents.clear()
+    # A random version, rather than a counter, as a counter that got evicted
+    # would restart at a version that some process may have seen already.
+    cache.set(VERSION_KEY, get_random_string(12), timeout=None)
+
+
+def on_social_app_changed(**kwargs: Any) -> None:
+    if app_settings.CONFIG_CACHE_TIMEOUT > 0:
+        invalidate()
+
+
+@receiver(setting_changed)
+def clear(**kwargs: Any) -> None:
+    with _lock:
+        _documents.clear()
@@ -0,0 +1,135 @@
+"""
+Frontends, mobile apps in particular, poll the account resources of the user,
+such as the list of email addresses. With ``HEADLESS_CONDITIONAL_REQUESTS``
+enabled, each resource carries a version per user, kept in the (shared)
+Django cache and bumped whenever the resource changes (and, once more, when
+the transaction at hand commits). The ETag is derived from that version, so
+that conditional requests can be answered without querying (and serializing)
+the resource.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Any, Callable
+
+from django.core.cache import cache
+from django.db import transaction
+from django.http import HttpRequest, HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.crypto import get_random_string
+
+from allauth.headless import app_settings
+from allauth.headless.internal.restkit.response import get_session_meta
+
+
+EMAIL = "email"
+AUTHENTICATORS = "authenticators"
+PROVIDER_ACCOUNTS = "provider_accounts"
+
+
+def _version_key(resource: str, user_id: Any) -> str:
+    return f"allauth.headless.etag.{resource}[{user_id}]"
+
+
+def _make_etag(*parts: Any) -> str:
+    value = ":".join(str(part) for part in parts)
+    return f'"{hashlib.sha256(value.encode()).hexdigest()[:32]}"'
+
+
+def _get_version(resource: str, user_id: Any) -> str | None:
+    key = _version_key(resource, user_id)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, get_random_string(12), timeout=None)
+        # Still ``None`` in case of a dummy cache.
+        version = cache.get(key)
+    return version
+
+
+def _is_enabled(session_meta: dict) -> bool:
+    # Newly exposed (session/access) tokens would be lost in a 304 response.
+    return app_settings.CONDITIONAL_REQUESTS and not session_meta
+
+
+def _patch_response(response: HttpResponse, etag: str) -> HttpResponse:
+    response["ETag"] = etag
+    # Replaces the never cache headers, as the response needs to be stored
+    # in order to be revalidated.
+    del response["Expires"]
+    del response["Cache-Control"]
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+def respond(
+    request: HttpRequest,
+    resource: str,
+    build: Callable[[dict], HttpResponse],
+    *discriminators: Any,
+) -> HttpResponse:
+    """
+    Responds with a 304 (Not Modified) in case the client already has the
+    current version of the resource, or with the response as built otherwise.
+    Any ``discriminators`` (state the response depends on, other than the
+    resource itself) are factored into the ETag. The response is built by
+    calling ``build(session_meta)``.
+    """
+    session_meta = get_session_meta(request)
+    if not _is_enabled(session_meta):
+        return build(session_meta)
+    version = _get_version(resource, request.user.pk)
+    if version is None:
+        return build(session_meta)
+    etag = _make_etag(
+        resource,
+        request.user.pk,
+        version,
+        request.allauth.headless.client,  # type: ignore[attr-defined]
+        *discriminators,
+    )
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        response = build(session_meta)
+    return _patch_response(response, etag)
+
+
+def respond_by_content(
+    request: HttpRequest, build: Callable[[dict], HttpResponse]
+) -> HttpResponse:
+    """
+    For resources that change without any signal (e.g. as sessions expire),
+    the ETag is derived from the content instead, which only spares the
+    client from downloading the response again.
+    """
+    session_meta = get_session_meta(request)
+    response = build(session_meta)
+    if not _is_enabled(session_meta):
+        return response
+    etag = _make_etag(hashlib.sha256(response.content).hexdigest())
+    response = _patch_response(response, etag)
+    return get_conditional_response(request, etag=etag, response=response)
+
+
+def _bump(resource: str, user_id: Any) -> None:
+    cache.set(_version_key(resource, user_id), get_random_string(12), timeout=None)
+
+
+def invalidate(resource: str, user_id: Any) -> None:
+    _bump(resource, user_id)
+    transaction.on_commit(lambda: _bump(resource, user_id))
+
+
+def on_email_address_changed(sender, instance, **kwargs) -> None:
+    if app_settings.CONDITIONAL_REQUESTS:
+        invalidate(EMAIL, instance.user_id)
+
+
+def on_authenticator_changed(sender, instance, **kwargs) -> None:
+    if app_settings.CONDITIONAL_REQUESTS:
+        invalidate(AUTHENTICATORS, instance.user_id)
+
+
+def on_social_account_changed(sender, instance, **kwargs) -> None:
+    if app_settings.CONDITIONAL_REQUESTS:
+        invalidate(PROVIDER_ACCOUNTS, instance.user_id)
@@ -10,6 +10,23 @@ from django.utils.cache import add_never_cache_headers
 from allauth.headless.internal import authkit, sessionkit
 
 
+def get_session_meta(request: HttpRequest) -> dict[str, Any]:
+    """
+    Returns the newly issued session token and/or access token, if any, to be
+    exposed in the response meta. Note that these are (potentially) created on
+    the fly, so, pass the outcome on as the ``session_meta`` of the response
+    instead of calling this twice.
+    """
+    meta: dict[str, Any] = {}
+    session_token = sessionkit.expose_session_token(request)
+    access_token_payload = authkit.expose_access_token(request)
+    if session_token:
+        meta["session_token"] = session_token
+    if access_token_payload:
+        meta.update(access_token_payload)
+    return meta
+
+
 class APIResponse(JsonResponse):
     def __init__(
         self,
@@ -18,29 +35,24 @@ class APIResponse(JsonResponse):
         data=None,
         meta: dict | None = None,
         status: int = HTTPStatus.OK,
+        session_meta: dict | None = None,
     ) -> None:
         d: dict[str, Any] = {"status": status}
         if data is not None:
             d["data"] = data
-        meta = self._add_session_meta(request, meta)
+        if session_meta is None:
+            session_meta = get_session_meta(request)
+        if session_meta:
+            meta = {**(meta or {}), **session_meta}
         if meta is not None:
             d["meta"] = meta
         if errors:
             d["errors"] = errors
+        # The payload as is, e.g. for embedding it in another response.
+        self.payload = d
         super().__init__(d, status=status)
         add_never_cache_headers(self)
 
-    def _add_session_meta(self, request: HttpRequest, meta: dict | None) -> dict | None:
-        session_token = sessionkit.expose_session_token(request)
-        access_token_payload = authkit.expose_access_token(request)
-        if session_token:
-            meta = meta or {}
-            meta["session_token"] = session_token
-        if access_token_payload:
-            meta = meta or {}
-            meta.update(access_token_payload)
-        return meta
-
 
 class ErrorResponse(APIResponse):
     def __init__(
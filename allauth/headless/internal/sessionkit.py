@@ -9,6 +9,7 @@ from django.http import HttpRequest
 
 from allauth.headless import app_settings
 from allauth.headless.constants import Client
+from allauth.headless.internal import usercache
 
 
 def session_store(session_key=None) -> SessionBase:
@@ -34,7 +35,26 @@ def expose_session_token(request: HttpRequest) -> str | None:
     return None
 
 
-def authenticate_by_x_session_token(token: str) -> tuple | None:
+def authenticate_by_x_session_token(
+    token: str, request: HttpRequest | None = None
+) -> tuple | None:
+    """
+    Returns the ``(user, session)`` pair for the given session token, if
+    valid.  When a ``request`` is passed, the outcome is cached on it, so that
+    authenticating the same token again as part of the same request is free.
+    """
+    if request is not None:
+        request = getattr(request, "_request", request)
+        cached = getattr(request, "_allauth_x_session_token", None)
+        if cached is not None and cached[0] == token:
+            return cached[1]
+    ret = _authenticate_by_x_session_token(token)
+    if request is not None:
+        request._allauth_x_session_token = (token, ret)  # type: ignore[attr-defined]
+    return ret
+
+
+def _authenticate_by_x_session_token(token: str) -> tuple | None:
     session = app_settings.TOKEN_STRATEGY.lookup_session(token)
     if not session:
         return None
@@ -43,13 +63,21 @@ def authenticate_by_x_session_token(token: str) -> tuple | None:
         meta_pk = get_user_model()._meta.pk
         if meta_pk:
             user_id = meta_pk.to_python(user_id_str)
-            user = get_user_model().objects.filter(pk=user_id).first()
+            user = usercache.get_user(user_id)
             if user and user.is_active:
                 return (user, session)
     return None
 
 
 def lookup_session(session_key: str) -> SessionBase | None:
-    if session_store().exists(session_key):
-        return session_store(session_key)
-    return None
+    """
+    Loads the session in one go, instead of first checking whether it exists.
+    """
+    store = session_store(session_key)
+    data = store.load()  # type: ignore[attr-defined]
+    # Backends load missing (or expired) sessions as empty, resetting the
+    # session key.
+    if store.session_key != session_key:
+        return None
+    store._session_cache = data  # type: ignore[attr-defined]
+    return store
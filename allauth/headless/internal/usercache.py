@@ -0,0 +1,65 @@
+"""
+Token authenticated API requests need the user, which would take a query on
+each and every request. With ``HEADLESS_USER_CACHE_TIMEOUT`` set, users are
+cached instead. Each entry carries the version of the user at the time it was
+cached, and saving or deleting the user bumps that version, invalidating the
+entry. The version is bumped once more when the transaction commits, so that
+entries cached by concurrent requests in the meantime do not outlive it.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.base_user import AbstractBaseUser
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.crypto import get_random_string
+
+from allauth.headless import app_settings
+
+
+def _user_key(user_id: Any) -> str:
+    return f"allauth.headless.user[{user_id}]"
+
+
+def _version_key(user_id: Any) -> str:
+    return f"allauth.headless.user.version[{user_id}]"
+
+
+def get_user(user_id: Any) -> AbstractBaseUser | None:
+    """
+    Returns the user with the given ID, or ``None`` if it does not exist.
+    """
+    timeout = app_settings.USER_CACHE_TIMEOUT
+    if timeout <= 0:
+        return get_user_model()._default_manager.filter(pk=user_id).first()
+    user_key = _user_key(user_id)
+    version_key = _version_key(user_id)
+    hits = cache.get_many([user_key, version_key])
+    version = hits.get(version_key)
+    entry = hits.get(user_key)
+    if entry is not None and version is not None and entry[0] == version:
+        return entry[1]
+    if version is None:
+        cache.add(version_key, get_random_string(12), timeout=None)
+        version = cache.get(version_key)
+    user = get_user_model()._default_manager.filter(pk=user_id).first()
+    if user is not None and version is not None:
+        cache.set(user_key, (version, user), timeout=timeout)
+    return user
+
+
+def _bump(user_id: Any) -> None:
+    cache.set(_version_key(user_id), get_random_string(12), timeout=None)
+
+
+def invalidate(user_id: Any) -> None:
+    _bump(user_id)
+    transaction.on_commit(lambda: _bump(user_id))
+
+
+def on_user_changed(sender, instance, **kwargs) -> None:
+    if app_settings.USER_CACHE_TIMEOUT:
+        invalidate(instance.pk)
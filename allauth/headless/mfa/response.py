@@ -78,9 +78,11 @@ class TOTPResponse(APIResponse):
 
 
 class AuthenticatorsResponse(APIResponse):
-    def __init__(self, request: HttpRequest, authenticators) -> None:
+    def __init__(
+        self, request: HttpRequest, authenticators, session_meta: dict | None = None
+    ) -> None:
         data = [_authenticator_data(authenticator) for authenticator in authenticators]
-        super().__init__(request, data=data)
+        super().__init__(request, data=data, session_meta=session_meta)
 
 
 class AuthenticatorResponse(APIResponse):
@@ -16,6 +16,7 @@ from allauth.headless.base.views import (
     AuthenticatedAPIView,
     AuthenticationStageAPIView,
 )
+from allauth.headless.internal import etagkit
 from allauth.headless.internal.restkit.response import ErrorResponse
 from allauth.headless.mfa import response
 from allauth.headless.mfa.inputs import (
@@ -80,8 +81,15 @@ class ReauthenticateView(AuthenticatedAPIView):
 class AuthenticatorsView(AuthenticatedAPIView):
     def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
         assert request.user.is_authenticated  # nosec
-        authenticators = Authenticator.objects.filter(user=request.user)
-        return response.AuthenticatorsResponse(request, authenticators)
+        return etagkit.respond(
+            request,
+            etagkit.AUTHENTICATORS,
+            lambda session_meta: response.AuthenticatorsResponse(
+                request,
+                Authenticator.objects.filter(user=request.user),
+                session_meta=session_meta,
+            ),
+        )
 
 
 class ManageTOTPView(AuthenticatedAPIView):
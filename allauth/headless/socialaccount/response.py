@@ -107,9 +107,11 @@ def get_config_data(request: HttpRequest) -> dict:
 
 
 class SocialAccountsResponse(APIResponse):
-    def __init__(self, request: HttpRequest, accounts) -> None:
+    def __init__(
+        self, request: HttpRequest, accounts, session_meta: dict | None = None
+    ) -> None:
         data = [_socialaccount_data(request, account) for account in accounts]
-        super().__init__(request, data=data)
+        super().__init__(request, data=data, session_meta=session_meta)
 
 
 class SocialLoginResponse(APIResponse):
@@ -12,6 +12,7 @@ from allauth.headless.base.response import (
     ForbiddenResponse,
 )
 from allauth.headless.base.views import APIView, AuthenticatedAPIView
+from allauth.headless.internal import etagkit
 from allauth.headless.internal.restkit.response import ErrorResponse
 from allauth.headless.socialaccount.forms import RedirectToProviderForm
 from allauth.headless.socialaccount.inputs import (
@@ -88,13 +89,21 @@ class ManageProvidersView(AuthenticatedAPIView):
     }
 
     def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
-        return self.respond_provider_accounts(request)
+        return etagkit.respond(
+            request,
+            etagkit.PROVIDER_ACCOUNTS,
+            lambda session_meta: self.respond_provider_accounts(
+                request, session_meta=session_meta
+            ),
+        )
 
     @classmethod
-    def respond_provider_accounts(self, request: HttpRequest) -> SocialAccountsResponse:
+    def respond_provider_accounts(
+        self, request: HttpRequest, session_meta: dict | None = None
+    ) -> SocialAccountsResponse:
         assert request.user.is_authenticated  # nosec
         accounts = SocialAccount.objects.filter(user=request.user)
-        return SocialAccountsResponse(request, accounts)
+        return SocialAccountsResponse(request, accounts, session_meta=session_meta)
 
     def delete(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
         flows.connect.disconnect(request, self.input.cleaned_data["account"])
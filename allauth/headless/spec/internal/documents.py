@@ -0,0 +1,95 @@
+"""
+Generating the specification (walking the forms, and dumping YAML in case of
+``openapi.yaml``) is expensive, yet, the outcome only varies by the settings
+and by the URL the API is mounted on. Hence, it is generated once and served
+from memory from then on, including a precompressed (gzip) variant.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import threading
+from dataclasses import dataclass
+from typing import Any
+
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.urls import reverse
+
+from allauth.headless.spec.internal.schema import get_schema
+
+
+@dataclass(frozen=True)
+class SpecDocument:
+    body: bytes
+    etag: str
+    gzip_body: bytes
+    gzip_etag: str
+    content_type: str
+    filename: str
+
+    @classmethod
+    def from_content(
+        cls, content: str, content_type: str, filename: str
+    ) -> SpecDocument:
+        body = content.encode("utf-8")
+        digest = hashlib.sha256(body).hexdigest()[:32]
+        return cls(
+            body=body,
+            etag=f'"{digest}"',
+            # mtime=0 keeps the compressed body (and, its ETag) stable.
+            gzip_body=gzip.compress(body, mtime=0),
+            gzip_etag=f'"{digest}-gzip"',
+            content_type=content_type,
+            filename=filename,
+        )
+
+
+# Bounded, in case the API is mounted on many (script) prefixes.
+_MAX_DOCUMENTS = 32
+_documents: dict[tuple[str, str], SpecDocument] = {}
+_lock = threading.Lock()
+
+
+def _build_document(fmt: str) -> SpecDocument:
+    spec = get_schema()
+    if fmt == "yaml":
+        import yaml
+
+        # The C based dumper, if available, is an order of magnitude faster.
+        dumper = getattr(yaml, "CDumper", yaml.Dumper)
+        return SpecDocument.from_content(
+            yaml.dump(spec, Dumper=dumper),
+            content_type="application/vnd.oai.openapi",
+            filename="allauth-openapi.yaml",
+        )
+    return SpecDocument.from_content(
+        json.dumps(spec),
+        content_type="application/vnd.oai.openapi+json",
+        filename="allauth-openapi.json",
+    )
+
+
+def get_spec_document(fmt: str) -> SpecDocument:
+    """
+    Returns the specification in the given format (``"json"`` or
+    ``"yaml"``).
+    """
+    key = (reverse("headless:openapi_yaml"), fmt)
+    with _lock:
+        document = _documents.get(key)
+    if document is None:
+        document = _build_document(fmt)
+        with _lock:
+            if len(_documents) >= _MAX_DOCUMENTS:
+                _documents.clear()
+            _documents[key] = document
+    return document
+
+
+@receiver(setting_changed)
+def clear_spec_documents(**kwargs: Any) -> None:
+    with _lock:
+        _documents.clear()
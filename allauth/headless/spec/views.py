@@ -1,40 +1,72 @@
 from __future__ import annotations
 
-import json
-
 from django.http import HttpRequest, HttpResponse
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    patch_vary_headers,
+)
 from django.utils.decorators import method_decorator
 from django.views.generic import TemplateView, View
 
 from allauth.account.internal.decorators import login_not_required
 from allauth.headless import app_settings
-from allauth.headless.spec.internal.schema import get_schema
+from allauth.headless.spec.internal.documents import get_spec_document
+
+
+def _accepts_gzip(request: HttpRequest) -> bool:
+    """
+    Whether the client accepts gzip, honoring quality values (``q=0`` means
+    not acceptable), as well as the ``*`` wildcard.
+    """
+    qualities = {}
+    for item in request.META.get("HTTP_ACCEPT_ENCODING", "").split(","):
+        coding, *params = (part.strip() for part in item.split(";"))
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding.lower()] = quality
+    quality = qualities.get("gzip", qualities.get("*", 0.0))
+    return quality > 0
+
+
+def _serve_spec_document(request: HttpRequest, fmt: str) -> HttpResponse:
+    document = get_spec_document(fmt)
+    accepts_gzip = _accepts_gzip(request)
+    if accepts_gzip:
+        body, etag = document.gzip_body, document.gzip_etag
+    else:
+        body, etag = document.body, document.etag
+    response = HttpResponse(
+        body,
+        content_type=document.content_type,
+        headers={"Content-Disposition": f"inline; filename={document.filename}"},
+    )
+    if accepts_gzip:
+        response["Content-Encoding"] = "gzip"
+    response["ETag"] = etag
+    patch_vary_headers(response, ["Accept-Encoding"])
+    max_age = app_settings.SPECIFICATION_CACHE_MAX_AGE
+    if max_age > 0:
+        patch_cache_control(response, public=True, max_age=max_age)
+    return get_conditional_response(request, etag=etag, response=response)
 
 
 @method_decorator(login_not_required, name="dispatch")
 class OpenAPIYAMLView(View):
     def get(self, request: HttpRequest) -> HttpResponse:
-        import yaml
-
-        spec = get_schema()
-        content = yaml.dump(spec, Dumper=yaml.Dumper)
-        return HttpResponse(
-            content,
-            content_type="application/vnd.oai.openapi",
-            headers={"Content-Disposition": "inline; filename=allauth-openapi.yaml"},
-        )
+        return _serve_spec_document(request, "yaml")
 
 
 @method_decorator(login_not_required, name="dispatch")
 class OpenAPIJSONView(View):
     def get(self, request: HttpRequest) -> HttpResponse:
-        spec = get_schema()
-        content = json.dumps(spec)
-        return HttpResponse(
-            content,
-            content_type="application/vnd.oai.openapi+json",
-            headers={"Content-Disposition": "inline; filename=allauth-openapi.json"},
-        )
+        return _serve_spec_document(request, "json")
 
 
 @method_decorator(login_not_required, name="dispatch")
@@ -13,6 +13,9 @@ from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.base_user import AbstractBaseUser
 from django.contrib.sessions.backends.base import SessionBase
+from django.core.cache import cache
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 from django.utils.functional import SimpleLazyObject
 
 from allauth.account.internal.userkit import str_to_user_id, user_id_to_str
@@ -20,7 +23,9 @@ from allauth.core.internal import jwkkit
 from allauth.core.internal.deferred import cryptography, jwt
 from allauth.core.internal.sessionkit import get_session_user
 from allauth.headless import app_settings
+from allauth.headless.internal import usercache
 from allauth.headless.internal.sessionkit import lookup_session
+from allauth.headless.tokens.strategies.jwt import revocation
 
 
 @dataclass
@@ -31,26 +36,58 @@ class JWTConfig:
     jwk_dict: dict[str, Any] | None = None
 
 
+# The (non-RSA) asymmetric algorithms, and the key type/curve they require.
+ASYMMETRIC_KEY_TYPES = {
+    "ES256": ("EC", "P-256"),
+    "ES384": ("EC", "P-384"),
+    "EdDSA": ("OKP", "Ed25519"),
+}
+
+# Parsing the key material (PEM, JWK thumbprint) is costly, and needed for each
+# and every token created or validated, so it is done once per process.
+_jwt_config: JWTConfig | None = None
+_session_key_cipher_key: bytes | None = None
+
+
+@receiver(setting_changed)
+def clear_jwt_config(**kwargs: Any) -> None:
+    global _jwt_config, _session_key_cipher_key
+    _jwt_config = None
+    _session_key_cipher_key = None
+
+
 def validate_access_token(token: str) -> tuple[Any, dict[str, Any]] | None:
     payload = decode_token(token, "access")
     if payload is None:
         return None
     if app_settings.JWT_STATEFUL_VALIDATION_ENABLED:
-        session = get_token_session(payload)
-        if session is None:
+        session_key = session_key_from_sid(payload["sid"])
+        if not session_key or not revocation.is_session_alive(
+            session_key, lambda: lookup_session(session_key) is not None
+        ):
             return None
     sub = payload["sub"]
     pk = str_to_user_id(sub)
-    lazy_user = SimpleLazyObject(lambda: get_user_model().objects.get(pk=pk))
-    return lazy_user, payload
+
+    def load_user():
+        user = usercache.get_user(pk)
+        if user is None:
+            raise get_user_model().DoesNotExist
+        return user
+
+    return SimpleLazyObject(load_user), payload
 
 
 def get_session_key_cipher(
     initialization_vector: bytes,
 ) -> cryptography.hazmat.primitives.ciphers.Cipher:
+    global _session_key_cipher_key
     ciphers = cryptography.hazmat.primitives.ciphers
-    secret_key = settings.SECRET_KEY
-    key = hashlib.sha256(secret_key.encode()).digest()
+    key = _session_key_cipher_key
+    if key is None:
+        key = _session_key_cipher_key = hashlib.sha256(
+            settings.SECRET_KEY.encode()
+        ).digest()
     algorithm = ciphers.algorithms.AES(key)
     mode = ciphers.modes.CTR(initialization_vector)
     cipher = ciphers.Cipher(algorithm, mode)
@@ -135,14 +172,26 @@ def get_token_session(payload: dict[str, Any]) -> SessionBase | None:
 
 
 def _get_jwt_config() -> JWTConfig:
+    global _jwt_config
+    config = _jwt_config
+    if config is None:
+        config = _jwt_config = _build_jwt_config()
+    return config
+
+
+def _build_jwt_config() -> JWTConfig:
     algorithm = app_settings.JWT_ALGORITHM
     jwk_dict = None
     if algorithm.startswith("HS"):
         key = app_settings.JWT_PRIVATE_KEY or settings.SECRET_KEY
         signing_key = key
         verifying_key = key
-    elif algorithm.startswith("RS"):
-        jwk_dict, signing_key = jwkkit.load_jwk_from_pem(app_settings.JWT_PRIVATE_KEY)
+    elif algorithm.startswith("RS") or algorithm in ASYMMETRIC_KEY_TYPES:
+        signing_key = jwkkit.load_private_key(app_settings.JWT_PRIVATE_KEY)
+        jwk_dict = jwkkit.private_key_to_jwk(signing_key)
+        kty, crv = ASYMMETRIC_KEY_TYPES.get(algorithm, ("RSA", None))
+        if jwk_dict["kty"] != kty or jwk_dict.get("crv") != crv:
+            raise ValueError(f"JWT private key is not suitable for: {algorithm}")
         verifying_key = signing_key.public_key()
     else:
         raise ValueError(f"Unsupported JWT algorithm: {algorithm}")
@@ -224,8 +273,51 @@ def create_token(
     )
 
 
+def _refresh_token_state_cache_key(session: SessionBase) -> str:
+    assert session.session_key  # nosec
+    digest = hashlib.sha256(session.session_key.encode()).hexdigest()
+    return f"allauth.headless.jwt.refresh_tokens[{digest}]"
+
+
 def get_refresh_token_state(session: SessionBase) -> dict[str, int]:
-    return session.setdefault("headless_refresh_tokens", {})
+    """
+    Returns the (live) refresh tokens of the session, as a mapping of ``jti``
+    to expiration time, oldest first.
+    """
+    if app_settings.JWT_REFRESH_TOKEN_STATE_STORAGE == "cache":
+        state = cache.get(_refresh_token_state_cache_key(session))
+    else:
+        state = session.get("headless_refresh_tokens")
+    return dict(state) if isinstance(state, dict) else {}
+
+
+def set_refresh_token_state(session: SessionBase, state: dict[str, int]) -> None:
+    if app_settings.JWT_REFRESH_TOKEN_STATE_STORAGE == "cache":
+        cache.set(
+            _refresh_token_state_cache_key(session),
+            state,
+            timeout=app_settings.JWT_REFRESH_TOKEN_EXPIRES_IN,
+        )
+    else:
+        session["headless_refresh_tokens"] = state
+
+
+def add_refresh_token(session: SessionBase, jti: str, exp: int) -> None:
+    """
+    Records the refresh token, pruning the expired ones, and evicting the
+    oldest ones beyond ``JWT_MAX_REFRESH_TOKENS_PER_SESSION``.
+    """
+    now = time.time()
+    state = {
+        other_jti: other_exp
+        for other_jti, other_exp in get_refresh_token_state(session).items()
+        if other_exp > now
+    }
+    state[jti] = exp
+    max_tokens = app_settings.JWT_MAX_REFRESH_TOKENS_PER_SESSION
+    if max_tokens and len(state) > max_tokens:
+        state = dict(list(state.items())[-max_tokens:])
+    set_refresh_token_state(session, state)
 
 
 def create_refresh_token(user: AbstractBaseUser, session: SessionBase) -> str:
@@ -239,8 +331,7 @@ def create_refresh_token(user: AbstractBaseUser, session: SessionBase) -> str:
         sid=sid,
         expires_in=app_settings.JWT_REFRESH_TOKEN_EXPIRES_IN,
     )
-    refresh_token_jti_to_exp = get_refresh_token_state(session)
-    refresh_token_jti_to_exp[payload["jti"]] = payload["exp"]
+    add_refresh_token(session, payload["jti"], payload["exp"])
     return token
 
 
@@ -261,6 +352,6 @@ def create_access_token(
 
 
 def invalidate_refresh_token(session: SessionBase, token: dict[str, Any]) -> None:
-    refresh_token_jti_to_exp = get_refresh_token_state(session)
-    jti = token["jti"]
-    refresh_token_jti_to_exp.pop(jti, None)
+    state = get_refresh_token_state(session)
+    if state.pop(token["jti"], None) is not None:
+        set_refresh_token_state(session, state)
@@ -0,0 +1,131 @@
+"""
+Stateful validation requires the session of an access token to (still) be
+alive. Looking up that session on each and every API request defeats the
+purpose of JWT access tokens, so with
+``HEADLESS_JWT_STATEFUL_VALIDATION_CACHE_TIMEOUT`` set, sessions found to be
+alive are remembered in process for that many seconds.
+
+Ending a session (logging out) is broadcast to all processes by means of the
+(shared) Django cache: the session is added to the revocation set, and the
+revocation version is changed. As long as the version is unchanged, the
+sessions remembered locally are still alive, which takes one cache read per
+request. Only once the version moves, the revocation set is consulted.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable
+
+from django.core.cache import cache
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.crypto import get_random_string
+
+from allauth.headless import app_settings
+
+
+VERSION_KEY = "allauth.headless.jwt.revocations"
+_MAX_ENTRIES = 4096
+# Session key digest -> (expires at, revocation version seen).
+_alive: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+_lock = threading.Lock()
+
+
+def _digest(session_key: str) -> str:
+    # Session keys are credentials, keep them out of the (shared) cache keys.
+    return hashlib.sha256(session_key.encode()).hexdigest()
+
+
+def _revoked_key(digest: str) -> str:
+    return f"allauth.headless.jwt.revoked[{digest}]"
+
+
+def _forget(digest: str) -> None:
+    with _lock:
+        _alive.pop(digest, None)
+
+
+def _get_version() -> Any:
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        # Seeded, so that the sessions remembered as of now are checked
+        # against the revocation set once the version is evicted (again).
+        cache.add(VERSION_KEY, get_random_string(12), timeout=None)
+        version = cache.get(VERSION_KEY)
+    return version
+
+
+def is_session_alive(session_key: str, lookup: Callable[[], bool]) -> bool:
+    """
+    Returns whether the session is alive, using ``lookup()`` to find out in
+    case that is not known (any more).
+    """
+    timeout = app_settings.JWT_STATEFUL_VALIDATION_CACHE_TIMEOUT
+    if timeout <= 0:
+        return lookup()
+    digest = _digest(session_key)
+    version = _get_version()
+    now = time.monotonic()
+    with _lock:
+        entry = _alive.get(digest)
+    if entry is not None and entry[0] > now:
+        # Without a version (e.g. a dummy cache) nothing can be told, so the
+        # revocation set is consulted.
+        if version is not None and entry[1] == version:
+            return True
+        if cache.get(_revoked_key(digest)):
+            _forget(digest)
+            return False
+        with _lock:
+            _alive[digest] = (entry[0], version)
+        return True
+    # The session is revoked before it is actually ended, so a lookup racing
+    # the revocation may still find it.
+    if not lookup() or cache.get(_revoked_key(digest)):
+        _forget(digest)
+        return False
+    with _lock:
+        _alive[digest] = (now + timeout, version)
+        _alive.move_to_end(digest)
+        while len(_alive) > _MAX_ENTRIES:
+            _alive.popitem(last=False)
+    return True
+
+
+def revoke_session(session_key: str) -> None:
+    """
+    Broadcasts that the session has ended, so that access tokens belonging to
+    it are no longer accepted by any process.
+    """
+    timeout = app_settings.JWT_STATEFUL_VALIDATION_CACHE_TIMEOUT
+    if timeout <= 0:
+        return
+    digest = _digest(session_key)
+    _forget(digest)
+    # Remembered sessions are forgotten after the timeout anyway, so the
+    # revocation need not outlive that.
+    cache.set(_revoked_key(digest), True, timeout=timeout + 1)
+    # A random version, rather than a counter, as a counter that got evicted
+    # would restart at a version that some process may have seen already.
+    cache.set(VERSION_KEY, get_random_string(12), timeout=None)
+
+
+def on_user_logged_out(sender, request, **kwargs) -> None:
+    session_key = getattr(getattr(request, "session", None), "session_key", None)
+    if session_key:
+        revoke_session(session_key)
+
+
+def on_sessions_ended(sender, sessions, **kwargs) -> None:
+    for session in sessions:
+        revoke_session(session.session_key)
+
+
+@receiver(setting_changed)
+def clear(**kwargs: Any) -> None:
+    with _lock:
+        _alive.clear()
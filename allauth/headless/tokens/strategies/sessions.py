@@ -17,7 +17,4 @@ class SessionTokenStrategy(AbstractTokenStrategy):
         return key
 
     def lookup_session(self, session_token: str) -> SessionBase | None:
-        session_key = session_token
-        if sessionkit.session_store().exists(session_key):
-            return sessionkit.session_store(session_key)
-        return None
+        return sessionkit.lookup_session(session_token)
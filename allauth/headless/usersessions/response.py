@@ -7,8 +7,14 @@ from allauth.usersessions import app_settings
 
 
 class SessionsResponse(APIResponse):
-    def __init__(self, request: HttpRequest, sessions) -> None:
-        super().__init__(request, data=[self._session_data(s) for s in sessions])
+    def __init__(
+        self, request: HttpRequest, sessions, session_meta: dict | None = None
+    ) -> None:
+        super().__init__(
+            request,
+            data=[self._session_data(s) for s in sessions],
+            session_meta=session_meta,
+        )
 
     def _session_data(self, session) -> dict:
         data = {
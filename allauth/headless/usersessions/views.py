@@ -7,6 +7,7 @@ from django.http import HttpRequest, HttpResponseBase
 from allauth.core.internal.httpkit import authenticated_user
 from allauth.headless.base.response import AuthenticationResponse
 from allauth.headless.base.views import AuthenticatedAPIView
+from allauth.headless.internal import etagkit
 from allauth.headless.usersessions.inputs import SelectSessionsInput
 from allauth.headless.usersessions.response import SessionsResponse
 from allauth.usersessions.internal import flows
@@ -26,11 +27,15 @@ class SessionsView(AuthenticatedAPIView):
         return AuthenticationResponse(request)
 
     def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponseBase:
-        return self._respond_session_list()
+        # Sessions expire (and, are purged) without notice, so they are
+        # listed regardless.
+        return etagkit.respond_by_content(request, self._respond_session_list)
 
-    def _respond_session_list(self) -> SessionsResponse:
+    def _respond_session_list(
+        self, session_meta: dict | None = None
+    ) -> SessionsResponse:
         sessions = UserSession.objects.purge_and_list(authenticated_user(self.request))
-        return SessionsResponse(self.request, sessions)
+        return SessionsResponse(self.request, sessions, session_meta=session_meta)
 
     def get_input_kwargs(self) -> dict:
         return {"user": self.request.user}
@@ -22,6 +22,7 @@ from allauth.account.models import EmailAddress
 from allauth.core.internal.adapter import BaseAdapter
 from allauth.core.internal.cryptokit import generate_user_code
 from allauth.idp.oidc import app_settings
+from allauth.idp.oidc.internal import claimscache
 from allauth.idp.oidc.internal.private_keys import filter_keys, pick_signing_key
 
 
@@ -111,7 +112,42 @@ class DefaultOIDCAdapter(BaseAdapter):
     ) -> dict[str, Any]:
         """
         Return the claims to be included in the ID token or userinfo response.
+        When ``IDP_OIDC_CLAIMS_CACHE_TIMEOUT`` is set, the claims are cached.
+        """
+        return claimscache.get_or_build(
+            (purpose, user.pk, client.pk, sorted(scopes), email),
+            [
+                claimscache.user_key(user.pk),
+                *self.get_claims_cache_keys(user, client),
+            ],
+            lambda: self._build_claims(user, client, scopes, email),
+        )
+
+    def get_claims_cache_keys(
+        self, user: AbstractBaseUser, client: Client
+    ) -> list[str]:
+        """
+        Returns the (additional) keys the cached claims of the given user
+        depend on.  The cache is already invalidated when the user or one of
+        its email addresses is saved. If your claims depend on other data,
+        return a key for it here, and call ``invalidate_claims_cache(key)``
+        whenever that data changes.
+        """
+        return []
+
+    def invalidate_claims_cache(self, key: str) -> None:
+        """
+        Invalidates all cached claims depending on the given key.
         """
+        claimscache.invalidate(key)
+
+    def _build_claims(
+        self,
+        user: AbstractBaseUser,
+        client: Client,
+        scopes: Iterable[str],
+        email: str | None,
+    ) -> dict[str, Any]:
         claims: dict[str, Any] = {"sub": self.get_user_sub(client, user)}
         if "email" in scopes:
             address: EmailAddress | None = None
@@ -202,7 +238,9 @@ class DefaultOIDCAdapter(BaseAdapter):
         """
         Allows for customizing the ``/.well-known/openid-configuration``
         payload, as specified in `RFC 8414`_ (OAuth 2.0 Authorization Server
-        Metadata).
+        Metadata).  The resulting document is computed once per host (and
+        issuer), and served from memory from then on, so the metadata should
+        not vary from request to request.
 
         .. _RFC 8414: https://www.rfc-editor.org/info/rfc8414
         """
@@ -294,6 +332,30 @@ class DefaultOIDCAdapter(BaseAdapter):
         """
         return True
 
+    def revoke_tokens(
+        self,
+        *,
+        user: AbstractBaseUser | None = None,
+        client: Client | None = None,
+        chunk_size: int | None = None,
+    ) -> int:
+        """
+        Revokes all tokens of the given user, of the given client, or, if both
+        are passed, the tokens the user granted to the client, in chunks of
+        ``chunk_size`` (by default, ``REVOKE_CHUNK_SIZE``). Returns the number
+        of tokens revoked.
+        """
+        from allauth.idp.oidc.models import REVOKE_CHUNK_SIZE, Token
+
+        if user is None and client is None:
+            raise ValueError("Pass a user and/or a client.")
+        qs = Token.objects.all()
+        if user is not None:
+            qs = qs.filter(user_id=user.pk)
+        if client is not None:
+            qs = qs.filter(client_id=client.pk)
+        return qs.revoke(chunk_size=chunk_size or REVOKE_CHUNK_SIZE).deleted
+
 
 def get_adapter() -> DefaultOIDCAdapter:
     return import_string(app_settings.ADAPTER)()
@@ -4,6 +4,7 @@ from django.contrib import admin, messages
 from django.http import HttpRequest
 from django.utils.html import escape
 from django.utils.safestring import mark_safe
+from django.utils.translation import gettext_lazy as _, ngettext
 
 from allauth.idp.oidc.adapter import get_adapter
 from allauth.idp.oidc.models import Client, Token
@@ -24,6 +25,7 @@ class ClientAdmin(admin.ModelAdmin):
     readonly_fields = ("secret", "created_at")
     list_filter = ("type", "skip_consent", "allow_uri_wildcards")
     search_fields = ("id", "name")
+    actions = ["revoke_tokens"]
 
     def save_model(self, request: HttpRequest, obj, form, change) -> None:
         if not change:
@@ -39,6 +41,11 @@ class ClientAdmin(admin.ModelAdmin):
             )
         return super().save_model(request, obj, form, change)
 
+    @admin.action(description=_("Revoke all tokens of the selected clients"))
+    def revoke_tokens(self, request: HttpRequest, queryset) -> None:
+        progress = Token.objects.filter(client__in=queryset).revoke()
+        _message_revoked(self, request, progress.deleted)
+
 
 @admin.register(Token)
 class TokenAdmin(admin.ModelAdmin):
@@ -51,3 +58,18 @@ class TokenAdmin(admin.ModelAdmin):
         "expires_at",
     )
     list_filter = ("type",)
+    actions = ["revoke_tokens"]
+
+    @admin.action(description=_("Revoke selected tokens"))
+    def revoke_tokens(self, request: HttpRequest, queryset) -> None:
+        progress = queryset.revoke()
+        _message_revoked(self, request, progress.deleted)
+
+
+def _message_revoked(model_admin, request: HttpRequest, count: int) -> None:
+    model_admin.message_user(
+        request,
+        ngettext("%(count)d token revoked.", "%(count)d tokens revoked.", count)
+        % {"count": count},
+        level=messages.SUCCESS,
+    )
@@ -86,10 +86,18 @@ class AppSettings:
     def ACCESS_TOKEN_EXPIRES_IN(self) -> int:
         return self._setting("ACCESS_TOKEN_EXPIRES_IN", 3600)
 
+    @property
+    def ACCESS_TOKEN_CACHE_TIMEOUT(self) -> int:
+        return self._setting("ACCESS_TOKEN_CACHE_TIMEOUT", 0)
+
     @property
     def ACCESS_TOKEN_FORMAT(self) -> str:
         return self._setting("ACCESS_TOKEN_FORMAT", "opaque")
 
+    @property
+    def ACCESS_TOKEN_STATELESS(self) -> bool:
+        return self._setting("ACCESS_TOKEN_STATELESS", False)
+
     @property
     def AUTH_METHODS(self) -> tuple[str, ...]:
         return tuple(
@@ -182,6 +190,10 @@ class AppSettings:
         """
         return self._setting("USERINFO_ENDPOINT", None)
 
+    @property
+    def CLAIMS_CACHE_TIMEOUT(self) -> int:
+        return self._setting("CLAIMS_CACHE_TIMEOUT", 0)
+
     @property
     def DCR_ENABLED(self) -> bool:
         """
@@ -1,4 +1,5 @@
 from django.apps import AppConfig
+from django.conf import settings
 
 from allauth import app_settings
 
@@ -10,3 +11,16 @@ class OIDCConfig(AppConfig):
     default_auto_field = (
         app_settings.DEFAULT_AUTO_FIELD or "django.db.models.BigAutoField"
     )
+
+    def ready(self) -> None:
+        from django.db.models.signals import post_delete, post_save
+
+        from allauth.account.models import EmailAddress
+        from allauth.idp.oidc import signals
+        from allauth.idp.oidc.models import Client
+
+        post_save.connect(signals.on_user_saved, sender=settings.AUTH_USER_MODEL)
+        post_delete.connect(signals.on_user_deleted, sender=settings.AUTH_USER_MODEL)
+        for signal in [post_save, post_delete]:
+            signal.connect(signals.on_client_changed, sender=Client)
+            signal.connect(signals.on_email_address_changed, sender=EmailAddress)
@@ -1,14 +1,18 @@
+import contextvars
 import json
 import logging
 import posixpath
 import requests
+import threading
 import time
+from dataclasses import dataclass
 from http import HTTPStatus
 from typing import Any
 from urllib.parse import ParseResult, urlparse
 
 from django.core.cache import cache
 from django.core.exceptions import ValidationError
+from django.db import connections
 
 from allauth.core import context
 from allauth.core.internal import ratelimit
@@ -21,6 +25,12 @@ logger = logging.getLogger(__name__)
 
 FETCH_TIMEOUT = 1
 MAX_RESPONSE_SIZE = 2 * 1024
+# How long to wait for a fetch in progress elsewhere.
+WAIT_TIMEOUT = FETCH_TIMEOUT + 1
+WAIT_INTERVAL = 0.05
+# Failed fetches are retried after an exponentially growing delay (seconds).
+FAILURE_BACKOFF = 10
+FAILURE_BACKOFF_MAX = 60 * 60
 
 
 def is_cimd_url(client_id: str) -> bool:
@@ -57,7 +67,40 @@ def validate_client_id(client_id: str) -> ParseResult:
     return parsed
 
 
-def fetch_metadata_safely(client_id: str) -> Any:
+@dataclass
+class Document:
+    metadata: Any = None
+    etag: str | None = None
+    max_age: int | None = None
+    stale_while_revalidate: int | None = None
+    # ``no-store``/``no-cache``: never to be used without fetching it first.
+    no_store: bool = False
+    not_modified: bool = False
+
+
+def parse_cache_control(value: str) -> tuple[int | None, int | None, bool]:
+    """
+    Returns the ``max-age`` and ``stale-while-revalidate`` directives, and
+    whether ``no-store``/``no-cache`` is present, in which case the document
+    is to be fetched each time (a ``max-age`` of 0, and no stale window).
+    """
+    max_age = stale_while_revalidate = None
+    no_store = False
+    for directive in value.lower().split(","):
+        name, _, arg = directive.strip().partition("=")
+        arg = arg.strip().strip('"')
+        if name in ("no-store", "no-cache"):
+            no_store = True
+        elif name == "max-age" and arg.isdigit():
+            max_age = int(arg)
+        elif name == "stale-while-revalidate" and arg.isdigit():
+            stale_while_revalidate = int(arg)
+    if no_store:
+        return 0, 0, True
+    return max_age, stale_while_revalidate, False
+
+
+def fetch_document_safely(client_id: str, etag: str | None = None) -> Document:
     if not ratelimit.consume(
         context.request,
         action="cimd_fetch",
@@ -65,25 +108,39 @@ def fetch_metadata_safely(client_id: str) -> Any:
         limit_get=True,
     ):
         raise ValidationError("CIMD fetch rate limited.")
-    lock_key = f"allauth.cimd.fetch:{client_id}"
-    if not cache.add(lock_key, True, timeout=FETCH_TIMEOUT + 5):
-        raise ValidationError("CIMD fetch already in progress.")
-    try:
-        return fetch_metadata(client_id)
-    finally:
-        cache.delete(lock_key)
+    return fetch_document(client_id, etag=etag)
 
 
 def fetch_metadata(client_id: str) -> Any:
+    return fetch_document(client_id).metadata
+
+
+def fetch_document(client_id: str, etag: str | None = None) -> Document:
+    headers = {"Accept": "application/json"}
+    if etag:
+        headers["If-None-Match"] = etag
     resp = requests.get(
         client_id,
         timeout=FETCH_TIMEOUT,
-        headers={"Accept": "application/json"},
+        headers=headers,
         stream=True,
         allow_redirects=False,
     )
 
     try:
+        max_age, stale_while_revalidate, no_store = parse_cache_control(
+            resp.headers.get("Cache-Control", "")
+        )
+        document = Document(
+            etag=resp.headers.get("ETag") or None,
+            max_age=max_age,
+            stale_while_revalidate=stale_while_revalidate,
+            no_store=no_store,
+        )
+        if etag and resp.status_code == HTTPStatus.NOT_MODIFIED:
+            document.etag = document.etag or etag
+            document.not_modified = True
+            return document
         if resp.status_code != HTTPStatus.OK:
             raise ValidationError(f"CIMD fetch returned HTTP {resp.status_code}.")
 
@@ -102,24 +159,44 @@ def fetch_metadata(client_id: str) -> Any:
         resp.close()
 
     try:
-        return json.loads(body)
+        document.metadata = json.loads(body)
     except (ValueError, TypeError) as e:
         raise ValidationError(f"CIMD response is not valid JSON: {e}") from e
+    return document
 
 
-def fetch_client(client_id: str) -> Client:
+def fetch_client(client_id: str, client: Client | None = None) -> Client:
     """
     Fetch a Client ID Metadata Document (CIMD) and return a Client instance.
 
     The ``client_id`` is expected to be an HTTPS URL pointing at a JSON metadata
-    document whose ``client_id`` field matches the URL.
+    document whose ``client_id`` field matches the URL. If the (previously
+    fetched) ``client`` is passed, the document is conditionally revalidated,
+    returning that same client in case the document was not modified.
 
     Raises ``ValidationError`` for invalid client_id URLs or metadata, and
     ``requests.RequestException`` if the HTTP fetch fails.
     """
     parsed = validate_client_id(client_id)
-    metadata = fetch_metadata_safely(client_id)
-    return validate_metadata(client_id, parsed, metadata)
+    data = (client.data if client else None) or {}
+    etag = data.get("etag") if data.get("client_metadata") else None
+    document = fetch_document_safely(client_id, etag=etag)
+    if document.not_modified and client:
+        updated_client = client
+    else:
+        updated_client = validate_metadata(client_id, parsed, document.metadata)
+    updated_client.data = {
+        "cimd": True,
+        "client_metadata": updated_client.data["client_metadata"],
+        "updated_at": int(time.time()),
+    }
+    for key in ("etag", "max_age", "stale_while_revalidate"):
+        value = getattr(document, key)
+        if value is not None:
+            updated_client.data[key] = value
+    if document.no_store:
+        updated_client.data["no_store"] = True
+    return updated_client
 
 
 def _get_list_of_str(
@@ -175,9 +252,124 @@ def validate_metadata(client_id: str, parsed: ParseResult, metadata: Any) -> Cli
     return client
 
 
-def is_outdated(client: Client) -> bool:
+def _get_age(client: Client) -> float:
     updated_at = (client.data or {}).get("updated_at", 0)
-    return time.time() - updated_at > app_settings.CIMD_CACHE_TIMEOUT
+    return time.time() - updated_at
+
+
+def _get_max_age(client: Client) -> int:
+    max_age = (client.data or {}).get("max_age")
+    if not isinstance(max_age, int):
+        return app_settings.CIMD_CACHE_TIMEOUT
+    return min(max_age, app_settings.CIMD_CACHE_TIMEOUT)
+
+
+def is_outdated(client: Client) -> bool:
+    return _get_age(client) > _get_max_age(client)
+
+
+def is_servable_while_revalidating(client: Client) -> bool:
+    """
+    Outdated documents are only served (while being revalidated in the
+    background) if the publisher allowed so (``stale-while-revalidate``).
+    """
+    data = client.data or {}
+    stale_while_revalidate = data.get("stale_while_revalidate")
+    if data.get("no_store") or not isinstance(stale_while_revalidate, int):
+        return False
+    return _get_age(client) <= _get_max_age(client) + stale_while_revalidate
+
+
+def _stale(client: Client | None) -> Client | None:
+    """
+    The (outdated) client to fall back to in case it cannot be refreshed,
+    unless the document is not to be used without fetching it.
+    """
+    if client and (client.data or {}).get("no_store"):
+        return None
+    return client
+
+
+def _failure_key(client_id: str) -> str:
+    return f"allauth.cimd.failures:{client_id}"
+
+
+def _is_backing_off(client_id: str) -> bool:
+    failures = cache.get(_failure_key(client_id))
+    return bool(failures) and time.time() < failures["retry_at"]
+
+
+def _record_failure(client_id: str) -> None:
+    key = _failure_key(client_id)
+    count = (cache.get(key) or {}).get("count", 0) + 1
+    backoff = min(FAILURE_BACKOFF * 2 ** (count - 1), FAILURE_BACKOFF_MAX)
+    cache.set(
+        key,
+        {"count": count, "retry_at": time.time() + backoff},
+        timeout=backoff + FAILURE_BACKOFF_MAX,
+    )
+
+
+def _wait_for_unlock(lock_key: str) -> bool:
+    deadline = time.monotonic() + WAIT_TIMEOUT
+    while time.monotonic() < deadline:
+        time.sleep(WAIT_INTERVAL)
+        if not cache.get(lock_key):
+            return True
+    return False
+
+
+def refresh_client(
+    client_id: str, client: Client | None, *, wait: bool = True
+) -> Client | None:
+    """
+    (Re)fetches the CIMD document, and stores the resulting client. In case
+    the document is already being fetched, we wait for that fetch to complete
+    and share its outcome (unless ``wait`` is ``False``). Failures are backed
+    off exponentially, during which the (stale) client, if any, is returned.
+    """
+    if _is_backing_off(client_id):
+        return _stale(client)
+    lock_key = f"allauth.cimd.fetch:{client_id}"
+    if not cache.add(lock_key, True, timeout=FETCH_TIMEOUT + 5):
+        if wait and _wait_for_unlock(lock_key):
+            refreshed = Client.objects.filter(id=client_id).first()
+            if refreshed and (client is None or refreshed.data != client.data):
+                return refreshed
+            # The fetch we waited for failed.
+            return _stale(refreshed or client)
+        logger.warning("CIMD fetch already in progress for client_id: %s", client_id)
+        return _stale(client)
+    try:
+        try:
+            updated_client = fetch_client(client_id, client)
+        except (ValidationError, requests.RequestException):
+            logger.warning("Failed to fetch CIMD for client_id: %s", client_id)
+            _record_failure(client_id)
+            return _stale(client)
+        cache.delete(_failure_key(client_id))
+        updated_client._state.adding = client is None
+        updated_client.save()
+        return updated_client
+    finally:
+        cache.delete(lock_key)
+
+
+def _revalidate(client_id: str, client: Client) -> None:
+    try:
+        refresh_client(client_id, client, wait=False)
+    finally:
+        # This runs in its own thread, and hence, its own connection.
+        connections.close_all()
+
+
+def revalidate_in_background(client_id: str, client: Client) -> None:
+    if cache.get(f"allauth.cimd.fetch:{client_id}") or _is_backing_off(client_id):
+        return
+    ctx = contextvars.copy_context()
+    threading.Thread(
+        target=ctx.run, args=(_revalidate, client_id, client), daemon=True
+    ).start()
 
 
 def lookup_client(client_id: str, client: Client | None) -> Client | None:
@@ -185,11 +377,7 @@ def lookup_client(client_id: str, client: Client | None) -> Client | None:
         return client
     if client and not is_outdated(client):
         return client
-    try:
-        updated_client = fetch_client(client_id)
-    except (ValidationError, requests.RequestException):
-        logger.warning("Failed to fetch CIMD for client_id: %s", client_id)
+    if client and is_servable_while_revalidating(client):
+        revalidate_in_background(client_id, client)
         return client
-    updated_client._state.adding = client is None
-    updated_client.save()
-    return updated_client
+    return refresh_client(client_id, client)
@@ -0,0 +1,63 @@
+"""
+A cache of the claims as assembled by the adapter.  Entries carry the
+versions of the keys they depend on (the user, and any additional keys as
+provided by the adapter).  Bumping the version of a key (``invalidate()``)
+invalidates all of the entries depending on it.  The version is bumped once
+more when the transaction at hand commits, as claims built by concurrent
+requests in the meantime would otherwise carry the new version.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Any, Callable, Iterable
+
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.crypto import get_random_string
+
+from allauth.idp.oidc import app_settings
+
+
+def _version_key(key: str) -> str:
+    return f"allauth.idp.oidc.claims.version[{key}]"
+
+
+def user_key(user_id) -> str:
+    return f"user:{user_id}"
+
+
+def get_or_build(
+    parts: Iterable[Any],
+    keys: list[str],
+    build: Callable[[], dict[str, Any]],
+) -> dict[str, Any]:
+    timeout = app_settings.CLAIMS_CACHE_TIMEOUT
+    if not timeout:
+        return build()
+    digest = hashlib.sha256(repr(tuple(parts)).encode("utf8")).hexdigest()
+    entry_key = f"allauth.idp.oidc.claims[{digest}]"
+    version_keys = [_version_key(key) for key in keys]
+    hits = cache.get_many([entry_key, *version_keys])
+    versions = [hits.get(key) for key in version_keys]
+    entry = hits.get(entry_key)
+    if entry is not None and None not in versions and entry[0] == versions:
+        return dict(entry[1])
+    if None in versions:
+        for key, version in zip(version_keys, versions):
+            if version is None:
+                cache.add(key, get_random_string(12), timeout=None)
+        hits = cache.get_many(version_keys)
+        versions = [hits.get(key) for key in version_keys]
+    claims = build()
+    cache.set(entry_key, (versions, claims), timeout=timeout)
+    return dict(claims)
+
+
+def _bump(key: str) -> None:
+    cache.set(_version_key(key), get_random_string(12), timeout=None)
+
+
+def invalidate(key: str) -> None:
+    _bump(key)
+    transaction.on_commit(lambda: _bump(key))
@@ -3,6 +3,7 @@ from __future__ import annotations
 from django.http import HttpRequest
 
 from allauth.account.internal.flows.logout import logout
+from allauth.idp.oidc.internal import tokencache
 from allauth.idp.oidc.models import Client, Token
 
 
@@ -21,6 +22,7 @@ def rp_initiated_logout(
             client=client,
             type__in=[Token.Type.ACCESS_TOKEN, Token.Type.REFRESH_TOKEN],
         ).delete()
+        tokencache.invalidate_user(request.user.pk)
     if from_op:
         has_redirect_uri = bool(post_logout_redirect_uri)
         logout(request, show_message=not has_redirect_uri)
@@ -0,0 +1,45 @@
+"""
+The ``.well-known/openid-configuration`` document is polled by each and every
+relying party, yet, it only varies by the host it is served on, and by the
+settings.  Hence, it is serialized once and served from memory from then on.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable
+
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.http import HttpRequest
+
+from allauth.core.internal.httpkit import JSONDocument
+from allauth.idp.oidc.adapter import get_adapter
+from allauth.utils import build_absolute_uri
+
+
+# Bounded, as the host is (partially) client controlled.
+_MAX_DOCUMENTS = 32
+_documents: dict[tuple[str, str], JSONDocument] = {}
+_lock = threading.Lock()
+
+
+def get_server_metadata_document(
+    request: HttpRequest, build: Callable[[], dict[str, Any]]
+) -> JSONDocument:
+    key = (build_absolute_uri(request, "/"), get_adapter().get_issuer())
+    with _lock:
+        document = _documents.get(key)
+    if document is None:
+        document = JSONDocument.from_data(build())
+        with _lock:
+            if len(_documents) >= _MAX_DOCUMENTS:
+                _documents.clear()
+            _documents[key] = document
+    return document
+
+
+@receiver(setting_changed)
+def clear_server_metadata_documents(**kwargs: Any) -> None:
+    with _lock:
+        _documents.clear()
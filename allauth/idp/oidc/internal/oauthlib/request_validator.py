@@ -5,15 +5,17 @@ from datetime import timedelta
 from typing import Any
 
 from django.utils import timezone
+from django.utils.functional import SimpleLazyObject
 
 from oauthlib.common import Request
 from oauthlib.openid import RequestValidator
 
 from allauth.core import context
-from allauth.core.internal import httpkit, jwkkit, ratelimit
+from allauth.core.internal import httpkit, ratelimit
 from allauth.core.internal.deferred import jwt
 from allauth.idp.oidc import app_settings
 from allauth.idp.oidc.adapter import get_adapter
+from allauth.idp.oidc.internal import tokencache
 from allauth.idp.oidc.internal.clientkit import (
     is_origin_allowed,
     is_redirect_uri_allowed,
@@ -24,8 +26,15 @@ from allauth.idp.oidc.internal.oauthlib.utils import (
     ValidatorContext,
     get_validator_context,
 )
+from allauth.idp.oidc.internal.private_keys import load_key
 from allauth.idp.oidc.internal.resources import InvalidTargetError, is_resources_subset
-from allauth.idp.oidc.internal.tokens import decode_jwt_token, determine_token_type
+from allauth.idp.oidc.internal.tokens import (
+    decode_jwt_token,
+    determine_token_type,
+    is_stateless,
+    load_stateless_access_token,
+    revoke_stateless_access_token,
+)
 from allauth.idp.oidc.models import Client, Token
 
 
@@ -168,7 +177,11 @@ class OAuthLibRequestValidator(RequestValidator):
         if types is None:
             return None
 
-        instance = Token.objects.lookup_by_value(types, token)
+        instance = None
+        if is_stateless():
+            instance = load_stateless_access_token(token)
+        if not instance:
+            instance = Token.objects.lookup_by_value(types, token)
         if not instance and fallback_types:
             instance = Token.objects.lookup_by_value(fallback_types, token)
         if not instance:
@@ -260,7 +273,8 @@ class OAuthLibRequestValidator(RequestValidator):
                     0, int((rt.expires_at - timezone.now()).total_seconds())
                 )
         access_token = self._prep_access_token(ctx, token, request)
-        tokens.append(access_token)
+        if not is_stateless():
+            tokens.append(access_token)
         for t in tokens:
             t.set_scopes(request.scopes)
             if ctx.email:
@@ -428,9 +442,9 @@ class OAuthLibRequestValidator(RequestValidator):
             )
         )
         adapter.populate_id_token(id_token, request.client, request.scopes)
-        jwk_dict, private_key = jwkkit.load_jwk_from_pem(adapter.get_signing_key().pem)
+        key = load_key(adapter.get_signing_key())
         return jwt.encode(
-            id_token, private_key, algorithm="RS256", headers={"kid": jwk_dict["kid"]}
+            id_token, key.private_key, algorithm="RS256", headers={"kid": key.kid}
         )
 
     def validate_bearer_token(self, token, scopes, request: Request) -> bool:
@@ -442,15 +456,24 @@ class OAuthLibRequestValidator(RequestValidator):
             # query parameters, such tokens may leak to log files and the HTTP
             # 'referer'.
             return False
-        instance = Token.objects.lookup(Token.Type.ACCESS_TOKEN, token)
+        instance = None
+        cached = False
+        if is_stateless():
+            instance = load_stateless_access_token(token)
+        if not instance:
+            instance, cached = tokencache.lookup_access_token(token)
         if not instance:
             return False
-        if instance.user and not instance.user.is_active:
+        if not cached and instance.user and not instance.user.is_active:
             return False
         granted_scopes = instance.get_scopes()
         if not set(scopes).issubset(set(granted_scopes)):
             return False
-        request.user = instance.user
+        if instance.user_id is None:
+            request.user = None
+        else:
+            # Cached tokens defer loading the user until it is needed.
+            request.user = SimpleLazyObject(lambda: instance.user)
         if not instance.client:
             return False
         ctx = get_validator_context()
@@ -472,7 +495,11 @@ class OAuthLibRequestValidator(RequestValidator):
             types = [Token.Type.REFRESH_TOKEN]
         else:
             types = [Token.Type.ACCESS_TOKEN, Token.Type.REFRESH_TOKEN]
+        if is_stateless():
+            # Regardless of the hint, as stateless tokens are self-describing.
+            revoke_stateless_access_token(token)
         Token.objects.by_value(token).filter(type__in=types).delete()
+        tokencache.invalidate_token(token)
 
     def get_userinfo_claims(self, request: Request) -> dict:
         access_token = get_validator_context().access_token
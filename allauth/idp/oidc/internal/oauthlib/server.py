@@ -12,7 +12,6 @@ from oauthlib.oauth2.rfc8628.endpoints import DeviceApplicationServer
 from oauthlib.openid import Server
 
 from allauth.core import context
-from allauth.core.internal import jwkkit
 from allauth.core.internal.deferred import jwt
 from allauth.idp.oidc import app_settings
 from allauth.idp.oidc.adapter import get_adapter
@@ -20,6 +19,7 @@ from allauth.idp.oidc.internal.oauthlib.request_validator import (
     OAuthLibRequestValidator,
 )
 from allauth.idp.oidc.internal.oauthlib.utils import get_validator_context
+from allauth.idp.oidc.internal.private_keys import load_key
 
 
 def generate_opaque_token(request: Request) -> str:
@@ -53,9 +53,9 @@ def generate_jwt_access_token(request: Request) -> str:
     adapter.populate_access_token(
         access_token, user=request.user, client=request.client, scopes=request.scopes
     )
-    jwk_dict, private_key = jwkkit.load_jwk_from_pem(adapter.get_signing_key().pem)
+    key = load_key(adapter.get_signing_key())
     return jwt.encode(
-        access_token, private_key, algorithm="RS256", headers={"kid": jwk_dict["kid"]}
+        access_token, key.private_key, algorithm="RS256", headers={"kid": key.kid}
     )
 
 
@@ -73,35 +73,75 @@ def generate_refresh_token(request: Request) -> str:
     return generate_opaque_token(request)
 
 
+def _run_pre_token_hooks(request: Request) -> None:
+    for hook in get_validator_context().pre_token:
+        hook(request)
+
+
+def _get_access_token_expires_in(request: Request) -> int:
+    return app_settings.ACCESS_TOKEN_EXPIRES_IN
+
+
 class OAuthLibServer(Server):
     def __init__(self, **kwargs: Any) -> None:
+        kwargs.setdefault("pre_token", [_run_pre_token_hooks])
         super().__init__(
             token_generator=generate_access_token,
             refresh_token_generator=generate_refresh_token,
             request_validator=OAuthLibRequestValidator(),
-            token_expires_in=app_settings.ACCESS_TOKEN_EXPIRES_IN,
+            token_expires_in=_get_access_token_expires_in,
             **kwargs,
         )
 
 
 class DeviceOAuthLibServer(DeviceApplicationServer):
+    """
+    The request (and settings) specific parameters are resolved lazily, so
+    that the server can be reused across requests.
+    """
+
     def __init__(self) -> None:
-        verification_uri = context.request.build_absolute_uri(
-            reverse("idp:oidc:device_authorization")
-        )
         super().__init__(
             request_validator=OAuthLibRequestValidator(),
-            verification_uri=verification_uri,
-            verification_uri_complete=f"{verification_uri}?code={{user_code}}",
-            interval=app_settings.DEVICE_CODE_INTERVAL,
+            verification_uri="",
             user_code_generator=lambda: get_adapter().generate_user_code(),
         )
-        self._expires_in = app_settings.DEVICE_CODE_EXPIRES_IN
+
+    @property
+    def interval(self) -> int:
+        return app_settings.DEVICE_CODE_INTERVAL
+
+    @property
+    def expires_in(self) -> int:
+        return app_settings.DEVICE_CODE_EXPIRES_IN
+
+    @property
+    def verification_uri(self) -> str:
+        return context.request.build_absolute_uri(
+            reverse("idp:oidc:device_authorization")
+        )
+
+    def verification_uri_complete(self, user_code: str) -> str:
+        return f"{self.verification_uri}?code={user_code}"
+
+
+# Constructing the servers wires up a dozen of endpoints and grant types, so
+# they are constructed once and reused.
+_server: OAuthLibServer | None = None
+_device_server: DeviceOAuthLibServer | None = None
 
 
 def get_server(**kwargs: Any) -> OAuthLibServer:
-    return OAuthLibServer(**kwargs)
+    global _server
+    if kwargs:
+        return OAuthLibServer(**kwargs)
+    if _server is None:
+        _server = OAuthLibServer()
+    return _server
 
 
 def get_device_server() -> DeviceOAuthLibServer:
-    return DeviceOAuthLibServer()
+    global _device_server
+    if _device_server is None:
+        _device_server = DeviceOAuthLibServer()
+    return _device_server
@@ -1,14 +1,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable
 from urllib.parse import urlparse, urlunparse
 
 from django.forms import Form
 from django.http import HttpRequest, HttpResponse, JsonResponse
 from django.shortcuts import render
 
-from oauthlib.common import quote, urlencode, urlencoded
+from oauthlib.common import Request, quote, urlencode, urlencoded
 from oauthlib.oauth2.rfc6749.errors import OAuth2Error
 
 from allauth.account import app_settings as account_settings
@@ -107,6 +107,9 @@ class ValidatorContext:
     codes: dict[tuple[str, str], dict[str, Any] | None] = field(default_factory=dict)
     requested_resources: list[str] | None = None
     granted_resources: list[str] | None = None
+    # Per request hooks, run by the (shared) server before the token request
+    # is validated.
+    pre_token: list[Callable[[Request], None]] = field(default_factory=list)
 
 
 def get_validator_context() -> ValidatorContext:
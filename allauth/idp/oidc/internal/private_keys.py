@@ -1,9 +1,17 @@
 from __future__ import annotations
 
+import hashlib
 import math
-from typing import TYPE_CHECKING, Literal
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Literal
 
 from django.utils import timezone
+from django.utils.functional import cached_property
+
+from allauth.core.internal import jwkkit
+from allauth.core.internal.httpkit import JSONDocument
 
 
 if TYPE_CHECKING:
@@ -43,3 +51,95 @@ def pick_signing_key(keys: list[PrivateKey]) -> PrivateKey | None:
 def _signing_priority(key: PrivateKey) -> float:
     ts = key.issued_at or key.not_before
     return ts.timestamp() if ts is not None else -math.inf
+
+
+@dataclass(frozen=True)
+class LoadedKey:
+    """
+    A parsed private key, along with its (public) JWK.  The JWK dictionary is
+    shared, do not modify it.
+    """
+
+    kid: str
+    jwk: dict[str, Any]
+    private_key: Any
+    public_key: Any
+
+
+class KeyRing:
+    def __init__(self, keys: list[LoadedKey]) -> None:
+        self.keys = keys
+        self._by_kid = {key.kid: key for key in keys}
+
+    def get(self, kid: str) -> LoadedKey | None:
+        return self._by_kid.get(kid)
+
+    def get_jwks(self) -> list[dict[str, Any]]:
+        return [key.jwk for key in self.keys]
+
+    @cached_property
+    def jwks_document(self) -> JSONDocument:
+        return JSONDocument.from_data({"keys": self.get_jwks()})
+
+
+# Parsing a PEM is expensive (milliseconds), so the parsed keys are kept
+# around, keyed by the digest of the PEM.
+_MAX_LOADED_KEYS = 32
+_MAX_KEY_RINGS = 8
+_loaded_keys: OrderedDict[str, LoadedKey] = OrderedDict()
+_key_rings: OrderedDict[tuple[str, ...], KeyRing] = OrderedDict()
+_lock = threading.Lock()
+
+
+def _pem_digest(pem: str) -> str:
+    return hashlib.sha256(pem.encode("utf8")).hexdigest()
+
+
+def _load_key(digest: str, pem: str) -> LoadedKey:
+    with _lock:
+        key = _loaded_keys.get(digest)
+        if key is not None:
+            _loaded_keys.move_to_end(digest)
+            return key
+    jwk_dict, private_key = jwkkit.load_jwk_from_pem(pem)
+    key = LoadedKey(
+        kid=jwk_dict["kid"],
+        jwk=jwk_dict,
+        private_key=private_key,
+        public_key=private_key.public_key(),
+    )
+    with _lock:
+        _loaded_keys[digest] = key
+        while len(_loaded_keys) > _MAX_LOADED_KEYS:
+            _loaded_keys.popitem(last=False)
+    return key
+
+
+def load_key(key: PrivateKey) -> LoadedKey:
+    return _load_key(_pem_digest(key.pem), key.pem)
+
+
+def get_key_ring(keys: list[PrivateKey]) -> KeyRing:
+    """
+    Returns the key ring for the given keys, which is only (re)built when the
+    set of keys changes, e.g. when ``IDP_OIDC_PRIVATE_KEYS`` is altered or
+    when a key expires.
+    """
+    digests = tuple(_pem_digest(key.pem) for key in keys)
+    with _lock:
+        ring = _key_rings.get(digests)
+        if ring is not None:
+            _key_rings.move_to_end(digests)
+            return ring
+    ring = KeyRing([_load_key(digest, key.pem) for digest, key in zip(digests, keys)])
+    with _lock:
+        _key_rings[digests] = ring
+        while len(_key_rings) > _MAX_KEY_RINGS:
+            _key_rings.popitem(last=False)
+    return ring
+
+
+def clear_key_cache() -> None:
+    with _lock:
+        _loaded_keys.clear()
+        _key_rings.clear()
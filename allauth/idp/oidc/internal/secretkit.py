@@ -0,0 +1,77 @@
+"""
+Client secrets are generated by us (see ``generate_client_secret()``), and
+are high-entropy random values. Hence, there is no need for a slow password
+hashing algorithm such as PBKDF2 -- which would otherwise be executed on each
+and every confidential client request to the token, introspection and
+revocation endpoints.  Instead, secrets are hashed using HMAC-SHA256, keyed
+with the ``SECRET_KEY``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+from django.contrib.auth.hashers import check_password
+from django.utils.crypto import constant_time_compare, get_random_string, salted_hmac
+
+
+ALGORITHM = "allauth_hmac_sha256"
+_KEY_SALT = "allauth.idp.oidc.client_secret"
+
+# Bounded in-process cache of (digests of) verified secret/hash pairs.
+_VERIFIED_MAX_SIZE = 1024
+_verified: OrderedDict[str, bool] = OrderedDict()
+_verified_lock = threading.Lock()
+
+
+def _digest(secret: str, salt: str, key: str) -> str:
+    return salted_hmac(
+        _KEY_SALT + salt, secret, secret=key, algorithm="sha256"
+    ).hexdigest()
+
+
+def hash_secret(secret: str) -> str:
+    salt = get_random_string(12)
+    return f"{ALGORITHM}${salt}${_digest(secret, salt, settings.SECRET_KEY)}"
+
+
+def _verify(secret: str, encoded: str) -> tuple[bool, bool]:
+    algorithm, _, rest = encoded.partition("$")
+    if algorithm != ALGORITHM:
+        # A hash created by Django's ``make_password()``, as used previously.
+        valid = check_password(secret, encoded)
+        return valid, valid
+    salt, _, digest = rest.partition("$")
+    keys = [settings.SECRET_KEY, *getattr(settings, "SECRET_KEY_FALLBACKS", [])]
+    for idx, key in enumerate(keys):
+        if constant_time_compare(_digest(secret, salt, key), digest):
+            return True, idx > 0
+    return False, False
+
+
+def verify_secret(secret: str, encoded: str) -> tuple[bool, bool]:
+    """
+    Verifies the secret against the encoded hash. Returns a tuple
+    ``(valid, must_update)``, where ``must_update`` indicates that the secret
+    is valid, but should be rehashed, e.g. because it was hashed using a (slow)
+    password hasher, or an old ``SECRET_KEY``.
+    """
+    keys = [settings.SECRET_KEY, *getattr(settings, "SECRET_KEY_FALLBACKS", [])]
+    cache_key = hashlib.sha256(
+        "\0".join([encoded, secret, *keys]).encode("utf-8")
+    ).hexdigest()
+    with _verified_lock:
+        must_update = _verified.get(cache_key)
+        if must_update is not None:
+            _verified.move_to_end(cache_key)
+            return True, must_update
+    valid, must_update = _verify(secret, encoded)
+    if valid:
+        with _verified_lock:
+            _verified[cache_key] = must_update
+            while len(_verified) > _VERIFIED_MAX_SIZE:
+                _verified.popitem(last=False)
+    return valid, must_update
@@ -0,0 +1,134 @@
+"""
+A short lived cache of validated access tokens, keyed by token hash, so that
+APIs hammered with the same access token do not need to look it up over and
+over again.  Each entry carries the versions of its user and client at the
+time it was cached.  Bumping a version (see ``invalidate_user()`` and
+``invalidate_client()``) invalidates all of the entries of that user/client at
+once.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+from django.utils.crypto import get_random_string
+
+from allauth.idp.oidc import app_settings
+from allauth.idp.oidc.adapter import get_adapter
+from allauth.idp.oidc.models import Token
+
+
+def _token_key(token_hash: str) -> str:
+    return f"allauth.idp.oidc.bearer[{token_hash}]"
+
+
+def _user_version_key(user_id) -> str:
+    return f"allauth.idp.oidc.bearer.user[{user_id}]"
+
+
+def _client_version_key(client_id) -> str:
+    return f"allauth.idp.oidc.bearer.client[{client_id}]"
+
+
+def _version_keys(token: Token) -> list[str]:
+    keys = [_client_version_key(token.client_id)]
+    if token.user_id is not None:
+        keys.append(_user_version_key(token.user_id))
+    return keys
+
+
+def _get_versions(keys: list[str]) -> list[str]:
+    versions = cache.get_many(keys)
+    missing = [key for key in keys if key not in versions]
+    if missing:
+        for key in missing:
+            cache.add(key, get_random_string(12), timeout=None)
+        versions = cache.get_many(keys)
+    return [versions.get(key) for key in keys]
+
+
+def _get(token_hash: str) -> Token | None:
+    entry = cache.get(_token_key(token_hash))
+    if entry is None:
+        return None
+    token, versions = entry
+    if token.expires_at is not None and token.expires_at <= timezone.now():
+        return None
+    keys = _version_keys(token)
+    current = cache.get_many(keys)
+    if [current.get(key) for key in keys] != versions:
+        return None
+    return token
+
+
+def _set(token: Token) -> None:
+    timeout = app_settings.ACCESS_TOKEN_CACHE_TIMEOUT
+    if token.expires_at is not None:
+        timeout = min(timeout, int((token.expires_at - timezone.now()).total_seconds()))
+    if timeout <= 0:
+        return
+    # Only the token (and its client) is cached, the user is loaded lazily.
+    fields = Token._meta.concrete_fields
+    entry = Token.from_db(
+        token._state.db,
+        [field.attname for field in fields],
+        [getattr(token, field.attname) for field in fields],
+    )
+    entry.client = token.client
+    versions = _get_versions(_version_keys(token))
+    cache.set(_token_key(token.hash), (entry, versions), timeout=timeout)
+
+
+def lookup_access_token(value: str) -> tuple[Token | None, bool]:
+    """
+    Looks up the (valid) access token, returning a tuple ``(token, cached)``.
+    The token returned from the cache has its user loaded lazily. Only tokens
+    of active users are cached.
+    """
+    token_hash = get_adapter().hash_token(value)
+    enabled = app_settings.ACCESS_TOKEN_CACHE_TIMEOUT > 0
+    if enabled:
+        token = _get(token_hash)
+        if token is not None:
+            return token, True
+    token = (
+        Token.objects.valid()
+        .filter(type=Token.Type.ACCESS_TOKEN, hash=token_hash)
+        .select_related("client", "user")
+        .first()
+    )
+    if (
+        enabled
+        and token is not None
+        and token.client is not None
+        and (token.user is None or token.user.is_active)
+    ):
+        _set(token)
+    return token, False
+
+
+def invalidate_token(value: str) -> None:
+    cache.delete(_token_key(get_adapter().hash_token(value)))
+
+
+def invalidate_user(user_id) -> None:
+    cache.set(_user_version_key(user_id), get_random_string(12), timeout=None)
+
+
+def invalidate_client(client_id) -> None:
+    cache.set(_client_version_key(client_id), get_random_string(12), timeout=None)
+
+
+def invalidate_token_hashes(token_hashes: Iterable[str]) -> None:
+    """
+    Drops the given (hashed) access tokens from the cache, using a single
+    ``delete_many()``. This is repeated once the transaction at hand (if any)
+    is committed, as concurrent lookups may have cached them again meanwhile.
+    """
+    keys = [_token_key(token_hash) for token_hash in token_hashes]
+    if keys:
+        cache.delete_many(keys)
+        transaction.on_commit(lambda: cache.delete_many(keys))
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import time
+from datetime import datetime, timezone
 from typing import Any
 
-from allauth.core.internal import jwkkit
+from django.core.cache import cache
+
 from allauth.core.internal.deferred import jwt
+from allauth.idp.oidc import app_settings
 from allauth.idp.oidc.adapter import get_adapter
-from allauth.idp.oidc.models import Token
+from allauth.idp.oidc.internal.private_keys import get_key_ring
+from allauth.idp.oidc.models import Client, Token
 
 
 def decode_jwt_token(
@@ -20,11 +25,10 @@ def decode_jwt_token(
             return None
 
         adapter = get_adapter()
-        for key in adapter.list_private_keys(is_active=True):
-            jwk_dict, private_key = jwkkit.load_jwk_from_pem(key.pem)
-            if jwk_dict["kid"] == headers["kid"]:
-                break
-        else:
+        key = get_key_ring(adapter.list_private_keys(is_active=True)).get(
+            headers["kid"]
+        )
+        if key is None:
             return None
 
         issuer: str | None = None
@@ -35,7 +39,7 @@ def decode_jwt_token(
             issuer = adapter.get_issuer()
         return jwt.decode(
             value,
-            key=private_key.public_key(),
+            key=key.public_key,
             algorithms=["RS256"],
             options={
                 "verify_signature": True,
@@ -50,6 +54,80 @@ def decode_jwt_token(
         return None
 
 
+def is_stateless() -> bool:
+    """
+    Whether or not access tokens are JWTs that are not persisted.
+    """
+    return (
+        app_settings.ACCESS_TOKEN_FORMAT == "jwt"
+        and app_settings.ACCESS_TOKEN_STATELESS
+    )
+
+
+def _denylist_key(jti: str) -> str:
+    return f"allauth.idp.oidc.jti[{jti}]"
+
+
+def _decode_stateless_access_token(value: str) -> dict[str, Any] | None:
+    if not is_jwt_token(value):
+        return None
+    payload = decode_jwt_token(value, verify_exp=True, verify_iss=True)
+    if not payload or payload.get("token_use") != "access":
+        return None
+    jti = payload.get("jti")
+    if not isinstance(jti, str) or not all(
+        isinstance(payload.get(claim), int) for claim in ("iat", "exp")
+    ):
+        return None
+    return payload
+
+
+def load_stateless_access_token(value: str) -> Token | None:
+    """
+    Validates the (stateless) JWT access token, returning an unsaved ``Token``
+    reconstructed from its claims.  Returns ``None`` in case the token is
+    invalid, revoked, or its client or (active) user no longer exists.
+    """
+    payload = _decode_stateless_access_token(value)
+    if not payload or cache.get(_denylist_key(payload["jti"])):
+        return None
+    client = Client.objects.filter(id=payload.get("client_id")).first()
+    if not client:
+        return None
+    user = None
+    if "sub" in payload:
+        user = get_adapter().get_user_by_sub(client, payload["sub"])
+        if not user:
+            return None
+    token = Token(
+        type=Token.Type.ACCESS_TOKEN,
+        client=client,
+        user=user,
+        hash=get_adapter().hash_token(value),
+        created_at=datetime.fromtimestamp(payload["iat"], tz=timezone.utc),
+        expires_at=datetime.fromtimestamp(payload["exp"], tz=timezone.utc),
+    )
+    token.set_scopes(payload.get("scope", "").split())
+    aud = payload.get("aud")
+    if aud:
+        token.set_resources([aud] if isinstance(aud, str) else aud)
+    return token
+
+
+def revoke_stateless_access_token(value: str) -> bool:
+    """
+    Stateless access tokens cannot be deleted. Instead, their ``jti`` is put
+    on a denylist (in the cache) until the token expires.
+    """
+    payload = _decode_stateless_access_token(value)
+    if not payload:
+        return False
+    timeout = payload["exp"] - int(time.time())
+    if timeout > 0:
+        cache.set(_denylist_key(payload["jti"]), 1, timeout=timeout)
+    return True
+
+
 def is_jwt_token(token: str) -> bool:
     # Same check as done by the `JWTToken` class of `oauthlib`
     # count == "2" should be sufficient as currently only JWS as AccessTokens is supported,
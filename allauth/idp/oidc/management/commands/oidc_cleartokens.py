@@ -2,12 +2,50 @@ from __future__ import annotations
 
 from django.core.management.base import BaseCommand
 
+from allauth.core.internal.modelkit import ChunkedDeleteProgress
 from allauth.idp.oidc.models import Token
 
 
 class Command(BaseCommand):
     help = "Deletes expired OpenID Connect tokens."
 
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--chunk-size", type=int, default=1000)
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=0,
+            help="Seconds to sleep in between chunks.",
+        )
+        parser.add_argument(
+            "--max-runtime",
+            type=float,
+            default=None,
+            help="Stop (after the current chunk) once this many seconds have passed.",
+        )
+        parser.add_argument(
+            "--raw",
+            action="store_true",
+            help="Delete each chunk using a single statement, bypassing signals.",
+        )
+
     def handle(self, *args, **options) -> None:
-        count, _ = Token.objects.expired().delete()
-        self.stdout.write(f"{count} expired token(s) deleted.")
+        def on_chunk(progress: ChunkedDeleteProgress) -> None:
+            if options["verbosity"] > 1:
+                self.stdout.write(
+                    f"{progress.deleted} deleted in {progress.elapsed:.1f}s "
+                    f"({progress.rate:.1f} rows/s)."
+                )
+
+        progress = Token.objects.delete_expired(
+            chunk_size=options["chunk_size"],
+            raw=options["raw"],
+            sleep=options["sleep"],
+            max_runtime=options["max_runtime"],
+            on_chunk=on_chunk,
+        )
+        self.stdout.write(f"{progress.deleted} expired token(s) deleted.")
+        if not progress.finished:
+            self.stdout.write(
+                "Maximum runtime exceeded, remaining expired tokens are left for the next run."
+            )
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from allauth.core.internal.modelkit import ChunkedDeleteProgress
+from allauth.idp.oidc.models import REVOKE_CHUNK_SIZE, Client, Token
+
+
+class Command(BaseCommand):
+    help = "Revokes the OpenID Connect tokens of a user and/or a client."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--user", help="The primary key of the user.")
+        parser.add_argument("--client", help="The ID of the client.")
+        parser.add_argument("--chunk-size", type=int, default=REVOKE_CHUNK_SIZE)
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=0,
+            help="Seconds to sleep in between chunks.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        if not options["user"] and not options["client"]:
+            raise CommandError("Pass --user and/or --client.")
+        tokens = Token.objects.all()
+        if options["user"]:
+            User = get_user_model()
+            try:
+                user = User._default_manager.get(pk=options["user"])
+            except (User.DoesNotExist, ValueError):
+                raise CommandError(f"Unknown user: {options['user']}")
+            tokens = tokens.filter(user_id=user.pk)
+        if options["client"]:
+            if not Client.objects.filter(id=options["client"]).exists():
+                raise CommandError(f"Unknown client: {options['client']}")
+            tokens = tokens.filter(client_id=options["client"])
+
+        def on_chunk(progress: ChunkedDeleteProgress) -> None:
+            if options["verbosity"] > 1:
+                self.stdout.write(
+                    f"{progress.deleted} revoked in {progress.elapsed:.1f}s "
+                    f"({progress.rate:.1f} rows/s)."
+                )
+
+        progress = tokens.revoke(
+            chunk_size=options["chunk_size"],
+            sleep=options["sleep"],
+            on_chunk=on_chunk,
+        )
+        self.stdout.write(f"{progress.deleted} token(s) revoked.")
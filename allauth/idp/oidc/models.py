@@ -1,23 +1,28 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Collection, Iterable
+import time
+from collections.abc import Callable, Collection, Iterable
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
 from django.conf import settings
-from django.contrib.auth.hashers import check_password, make_password
 from django.db import models
 from django.db.models import Q
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
+from allauth.core.internal.modelkit import ChunkedDeleteProgress, delete_in_chunks
 from allauth.idp.oidc.adapter import get_adapter
+from allauth.idp.oidc.internal import secretkit
 
 
 logger = logging.getLogger(__name__)
 
+# Tokens are revoked in chunks of this many, keeping transactions short.
+REVOKE_CHUNK_SIZE = 1000
+
 
 def default_client_id() -> str:
     adapter = get_adapter()
@@ -28,7 +33,7 @@ def default_client_id() -> str:
 def default_client_secret() -> str:
     adapter = get_adapter()
     client_secret = adapter.generate_client_secret()
-    return make_password(client_secret)
+    return secretkit.hash_secret(client_secret)
 
 
 def _values_from_text(text: str) -> list[str]:
@@ -212,10 +217,15 @@ class Client(models.Model):
         self.grant_types = _values_to_text(grant_types)
 
     def set_secret(self, secret: str) -> None:
-        self.secret = make_password(secret)
+        self.secret = secretkit.hash_secret(secret)
 
     def check_secret(self, secret: str) -> bool:
-        return check_password(secret, self.secret)
+        valid, must_update = secretkit.verify_secret(secret, self.secret)
+        if valid and must_update and self.pk:
+            # Transparently upgrade legacy (slow) hashes.
+            self.set_secret(secret)
+            self.save(update_fields=["secret"])
+        return valid
 
     def clean_redirect_uris(self) -> list[str]:
         from allauth.idp.oidc.internal.clientkit import _validate_uri_wildcard_format
@@ -251,6 +261,120 @@ class TokenQuerySet(models.query.QuerySet["Token"]):
     def expired(self) -> TokenQuerySet:
         return self.filter(expires_at__isnull=False, expires_at__lte=timezone.now())
 
+    def delete_expired(
+        self,
+        *,
+        chunk_size: int | None = None,
+        raw: bool = False,
+        sleep: float = 0,
+        max_runtime: float | None = None,
+        on_chunk: Callable[[ChunkedDeleteProgress], None] | None = None,
+    ) -> ChunkedDeleteProgress:
+        """
+        Deletes the expired tokens. By default, this is done in a single
+        statement. Pass ``chunk_size`` to delete in bounded chunks instead,
+        one token type at a time, ordered by ``expires_at`` (which is
+        indexed). See ``modelkit.delete_in_chunks()`` for the other options.
+        """
+        if chunk_size is None:
+            _, deleted = self.expired().delete()
+            return ChunkedDeleteProgress(
+                deleted=deleted.get(Token._meta.label, 0), chunks=1, finished=True
+            )
+        progress = ChunkedDeleteProgress(finished=True)
+        started_at = time.monotonic()
+
+        def on_type_chunk(type_progress: ChunkedDeleteProgress) -> None:
+            if on_chunk:
+                on_chunk(
+                    ChunkedDeleteProgress(
+                        deleted=progress.deleted + type_progress.deleted,
+                        chunks=progress.chunks + type_progress.chunks,
+                        elapsed=time.monotonic() - started_at,
+                    )
+                )
+
+        for type in Token.Type:
+            remaining = None
+            if max_runtime is not None:
+                remaining = max_runtime - (time.monotonic() - started_at)
+                if remaining <= 0 and progress.chunks:
+                    progress.finished = False
+                    break
+            type_progress = delete_in_chunks(
+                self.expired().filter(type=type),
+                chunk_size=chunk_size,
+                order_by="expires_at",
+                raw=raw,
+                sleep=sleep,
+                max_runtime=remaining,
+                on_chunk=on_type_chunk,
+            )
+            progress.deleted += type_progress.deleted
+            progress.chunks += type_progress.chunks
+            if not type_progress.finished:
+                progress.finished = False
+                break
+        progress.elapsed = time.monotonic() - started_at
+        return progress
+
+    def revoke(
+        self,
+        *,
+        chunk_size: int = REVOKE_CHUNK_SIZE,
+        sleep: float = 0,
+        on_chunk: Callable[[ChunkedDeleteProgress], None] | None = None,
+    ) -> ChunkedDeleteProgress:
+        """
+        Revokes (deletes) all of the tokens in this queryset, in chunks of
+        (at most) ``chunk_size`` tokens, see ``modelkit.delete_in_chunks()``.
+        The cached access tokens among these are dropped from the cache as
+        each chunk is deleted. Afterwards, a single ``tokens_revoked`` signal
+        is sent, covering all of the tokens revoked.
+
+        Note that stateless access tokens are not stored, and can therefore not
+        be revoked in bulk -- these remain valid until they expire.
+        """
+        from allauth.idp.oidc import signals
+        from allauth.idp.oidc.internal import tokencache
+
+        user_ids: set = set()
+        client_ids: set = set()
+        access_token_hashes: list[str] = []
+
+        def before_chunk(chunk: TokenQuerySet) -> None:
+            access_token_hashes.clear()
+            for hash, type, user_id, client_id in chunk.values_list(
+                "hash", "type", "user_id", "client_id"
+            ):
+                if type == Token.Type.ACCESS_TOKEN:
+                    access_token_hashes.append(hash)
+                if user_id is not None:
+                    user_ids.add(user_id)
+                if client_id is not None:
+                    client_ids.add(client_id)
+
+        def after_chunk(progress: ChunkedDeleteProgress) -> None:
+            tokencache.invalidate_token_hashes(list(access_token_hashes))
+            if on_chunk:
+                on_chunk(progress)
+
+        progress = delete_in_chunks(
+            self,
+            chunk_size=chunk_size,
+            sleep=sleep,
+            on_chunk=after_chunk,
+            before_chunk=before_chunk,
+        )
+        if progress.deleted:
+            signals.tokens_revoked.send(
+                sender=Token,
+                count=progress.deleted,
+                user_ids=user_ids,
+                client_ids=client_ids,
+            )
+        return progress
+
     def by_value(self, value: str) -> TokenQuerySet:
         return self.filter(hash=get_adapter().hash_token(value))
 
@@ -0,0 +1,36 @@
+from django.dispatch import Signal
+
+from allauth.idp.oidc import app_settings
+from allauth.idp.oidc.internal import claimscache, tokencache
+
+
+# Emitted once after tokens have been revoked in bulk.
+# Arguments:
+# - count: int, the number of tokens revoked
+# - user_ids: set, the IDs of the users whose tokens were revoked
+# - client_ids: set, the IDs of the clients whose tokens were revoked
+tokens_revoked = Signal()
+
+
+def on_user_saved(sender, instance, **kwargs) -> None:
+    if app_settings.ACCESS_TOKEN_CACHE_TIMEOUT and not getattr(
+        instance, "is_active", True
+    ):
+        tokencache.invalidate_user(instance.pk)
+    if app_settings.CLAIMS_CACHE_TIMEOUT:
+        claimscache.invalidate(claimscache.user_key(instance.pk))
+
+
+def on_user_deleted(sender, instance, **kwargs) -> None:
+    if app_settings.ACCESS_TOKEN_CACHE_TIMEOUT:
+        tokencache.invalidate_user(instance.pk)
+
+
+def on_email_address_changed(sender, instance, **kwargs) -> None:
+    if app_settings.CLAIMS_CACHE_TIMEOUT:
+        claimscache.invalidate(claimscache.user_key(instance.user_id))
+
+
+def on_client_changed(sender, instance, **kwargs) -> None:
+    if app_settings.ACCESS_TOKEN_CACHE_TIMEOUT:
+        tokencache.invalidate_client(instance.pk)
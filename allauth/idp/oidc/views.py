@@ -36,11 +36,12 @@ from allauth.account import app_settings as account_settings
 from allauth.account.adapter import get_adapter as get_account_adapter
 from allauth.account.internal.decorators import login_not_required
 from allauth.core.exceptions import ImmediateHttpResponse, RateLimited
-from allauth.core.internal import jwkkit, ratelimit
+from allauth.core.internal import ratelimit
 from allauth.core.internal.httpkit import (
     add_query_params,
     authenticated_user,
     del_query_params,
+    json_document_response,
 )
 from allauth.idp.oidc import app_settings
 from allauth.idp.oidc.adapter import get_adapter
@@ -52,6 +53,7 @@ from allauth.idp.oidc.forms import (
     RPInitiatedLogoutForm,
 )
 from allauth.idp.oidc.internal import flows
+from allauth.idp.oidc.internal.metadata import get_server_metadata_document
 from allauth.idp.oidc.internal.oauthlib import device_codes
 from allauth.idp.oidc.internal.oauthlib.server import get_device_server, get_server
 from allauth.idp.oidc.internal.oauthlib.utils import (
@@ -61,6 +63,7 @@ from allauth.idp.oidc.internal.oauthlib.utils import (
     respond_html_error,
     respond_json_error,
 )
+from allauth.idp.oidc.internal.private_keys import get_key_ring
 from allauth.idp.oidc.internal.resources import get_resources
 from allauth.idp.oidc.models import Client, Token
 from allauth.utils import build_absolute_uri
@@ -92,7 +95,15 @@ def _enforce_csrf(request: HttpRequest) -> HttpResponseForbidden | None:
 
 @method_decorator(login_not_required, name="dispatch")
 class ConfigurationView(View):
-    def get(self, request: HttpRequest) -> JsonResponse:
+    def get(self, request: HttpRequest) -> HttpResponse:
+        document = get_server_metadata_document(
+            request, lambda: self._get_server_metadata(request)
+        )
+        return json_document_response(
+            request, document, {"Access-Control-Allow-Origin": "*"}
+        )
+
+    def _get_server_metadata(self, request: HttpRequest) -> dict[str, Any]:
         userinfo_endpoint = app_settings.USERINFO_ENDPOINT
         if not userinfo_endpoint:
             userinfo_endpoint = build_absolute_uri(
@@ -135,9 +146,7 @@ class ConfigurationView(View):
             )
 
         get_adapter().populate_server_metadata(data)
-        response = JsonResponse(data)
-        response["Access-Control-Allow-Origin"] = "*"
-        return response
+        return data
 
     def _get_supported_types(self) -> dict[str, list[str]]:
         scopes_supported = ["openid", "profile", "email"]
@@ -426,9 +435,10 @@ class TokenView(View):
         data: dict[str, Any] | None = None,
     ) -> HttpResponse:
         orequest = extract_params(request)
-        oresponse = get_server(
-            pre_token=[lambda orequest: self._pre_token(orequest, user, data)],
-        ).create_token_response(*orequest)
+        get_validator_context().pre_token.append(
+            lambda orequest: self._pre_token(orequest, user, data)
+        )
+        oresponse = get_server().create_token_response(*orequest)
         return convert_response(*oresponse)
 
     def _pre_token(
@@ -485,25 +495,23 @@ user_info = UserInfoView.as_view()
 
 @method_decorator(login_not_required, name="dispatch")
 class JwksView(View):
-    def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> JsonResponse:
-        keys = []
+    def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
         adapter = get_adapter()
         # Deliberately not filtering on ``did_activate``: keys whose
         # ``not_before`` still lies in the future are published ahead of time.
         # That way clients have already fetched and cached the next key before
         # it starts signing, avoiding a window where a freshly activated key
         # signs tokens that verifiers cannot yet validate.
-        for key in adapter.list_private_keys(is_active=True):
-            jwk, _ = jwkkit.load_jwk_from_pem(key.pem)
-            keys.append(jwk)
-        response = JsonResponse({"keys": keys})
-        response["Access-Control-Allow-Origin"] = "*"
-        response["Cache-Control"] = (
-            f"max-age={adapter.get_jwks_cache_control()}, must-revalidate"
+        key_ring = get_key_ring(adapter.list_private_keys(is_active=True))
+        return json_document_response(
+            request,
+            key_ring.jwks_document,
+            {
+                "Access-Control-Allow-Origin": "*",
+                "Cache-Control": f"max-age={adapter.get_jwks_cache_control()}, must-revalidate",
+            },
         )
 
-        return response
-
 
 jwks = JwksView.as_view()
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from io import BytesIO
+from typing import TYPE_CHECKING
 from urllib.parse import quote, urlencode
 
 from django.contrib.auth.base_user import AbstractBaseUser
@@ -21,6 +22,10 @@ from allauth.mfa import app_settings
 from allauth.mfa.models import Authenticator
 
 
+if TYPE_CHECKING:
+    from allauth.core.internal.mailkit import BulkMailProgress
+
+
 class DefaultMFAAdapter(BaseAdapter):
     """The adapter class allows you to override various functionality of the
     ``allauth.mfa`` app.  To do so, point ``settings.MFA_ADAPTER`` to your own
@@ -121,6 +126,9 @@ class DefaultMFAAdapter(BaseAdapter):
     def send_notification_mail(self, *args, **kwargs) -> None:
         return get_account_adapter().send_notification_mail(*args, **kwargs)
 
+    def send_bulk_notification_mail(self, *args, **kwargs) -> BulkMailProgress:
+        return get_account_adapter().send_bulk_notification_mail(*args, **kwargs)
+
     def is_mfa_enabled(self, user: AbstractBaseUser, types=None) -> bool:
         """
         Returns ``True`` if (and only if) the user has 2FA enabled.
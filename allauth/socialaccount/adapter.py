@@ -14,6 +14,7 @@ from django.utils.translation import gettext_lazy as _
 
 
 if TYPE_CHECKING:
+    from allauth.core.internal.mailkit import BulkMailProgress
     from allauth.socialaccount.models import SocialLogin, SocialApp
     from allauth.socialaccount.providers.base.provider import Provider
 
@@ -345,6 +346,9 @@ class DefaultSocialAccountAdapter(BaseAdapter):
     def send_notification_mail(self, *args, **kwargs) -> None:
         return get_account_adapter().send_notification_mail(*args, **kwargs)
 
+    def send_bulk_notification_mail(self, *args, **kwargs) -> BulkMailProgress:
+        return get_account_adapter().send_bulk_notification_mail(*args, **kwargs)
+
     def get_requests_session(self):
         import requests
 
@@ -29,6 +29,21 @@ class AppSettings:
         """
         return self._setting("TRACK_ACTIVITY", False)
 
+    @property
+    def TRACK_ACTIVITY_INTERVAL(self) -> int:
+        """The minimum number of seconds in between updates of the last seen
+        timestamp of a session. A change of IP address or user agent is always
+        recorded immediately.
+        """
+        return self._setting("TRACK_ACTIVITY_INTERVAL", 0)
+
+    @property
+    def TRACK_ACTIVITY_BUFFER_SIZE(self) -> int:
+        """When set, last seen timestamp updates are buffered in memory and
+        written in bulk, once this many are pending.
+        """
+        return self._setting("TRACK_ACTIVITY_BUFFER_SIZE", 0)
+
 
 _app_settings = AppSettings("USERSESSIONS_")
 
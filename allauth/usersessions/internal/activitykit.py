@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from datetime import datetime
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpRequest
+from django.utils import timezone
+
+from allauth.account.adapter import get_adapter
+from allauth.usersessions import app_settings
+from allauth.usersessions.models import UserSession
+
+
+# Pending ``last_seen_at`` updates, by session key (buffered mode only).
+_buffer: dict[str, datetime] = {}
+_buffer_lock = threading.Lock()
+_buffer_flushed_at = time.monotonic()
+
+
+def _cache_key(session_key: str) -> str:
+    return f"allauth.usersessions.seen[{session_key}]"
+
+
+def _fingerprint(request: HttpRequest) -> str:
+    ua = request.META.get("HTTP_USER_AGENT", "")[
+        0 : UserSession._meta.get_field("user_agent").max_length
+    ]
+    ip = get_adapter().get_client_ip(request)
+    value = f"{request.user.pk}|{ip}|{ua}"
+    return hashlib.sha256(value.encode("utf8")).hexdigest()
+
+
+def track_activity(request: HttpRequest) -> None:
+    """
+    Keeps the user session of the request up to date. Without an activity
+    interval, every request results in the user session being written.
+    Otherwise, the user session is written only if the client (IP address,
+    user agent) changed, or if its ``last_seen_at`` was last updated more than
+    the interval ago.  In buffered mode, such ``last_seen_at``-only updates are
+    collected in memory and written in bulk.
+    """
+    interval = app_settings.TRACK_ACTIVITY_INTERVAL
+    if not interval:
+        UserSession.objects.create_from_request(request)
+        return
+    if not request.session.session_key:
+        request.session.save()
+    session_key = request.session.session_key
+    cache_key = _cache_key(session_key)
+    fingerprint = _fingerprint(request)
+    seen = cache.get(cache_key)
+    now = time.time()
+    if seen and seen["fingerprint"] == fingerprint:
+        if now - seen["at"] < interval:
+            return
+        if app_settings.TRACK_ACTIVITY_BUFFER_SIZE:
+            buffer_last_seen(session_key, timezone.now())
+        else:
+            UserSession.objects.filter(session_key=session_key).update(
+                last_seen_at=timezone.now()
+            )
+    else:
+        UserSession.objects.create_from_request(request)
+    # The entry needs to outlive the interval, otherwise, the interval having
+    # passed would be indistinguishable from the session not having been seen
+    # at all. Past the age of the session, the entry is of no use any more.
+    cache.set(
+        cache_key,
+        {"fingerprint": fingerprint, "at": now},
+        timeout=max(2 * interval, settings.SESSION_COOKIE_AGE),
+    )
+
+
+def buffer_last_seen(session_key: str, last_seen_at: datetime) -> None:
+    with _buffer_lock:
+        _buffer[session_key] = last_seen_at
+        flush = (
+            len(_buffer) >= app_settings.TRACK_ACTIVITY_BUFFER_SIZE
+            or time.monotonic() - _buffer_flushed_at
+            >= app_settings.TRACK_ACTIVITY_INTERVAL
+        )
+    if flush:
+        flush_last_seen()
+
+
+def flush_last_seen() -> int:
+    """
+    Writes the pending ``last_seen_at`` updates to the database, returning
+    the number of user sessions updated.
+    """
+    global _buffer_flushed_at
+
+    with _buffer_lock:
+        pending = dict(_buffer)
+        _buffer.clear()
+        _buffer_flushed_at = time.monotonic()
+    if not pending:
+        return 0
+    sessions = list(
+        UserSession.objects.filter(session_key__in=pending.keys()).only(
+            "pk", "session_key"
+        )
+    )
+    for session in sessions:
+        session.last_seen_at = pending[session.session_key]
+    UserSession.objects.bulk_update(sessions, ["last_seen_at"])
+    return len(sessions)
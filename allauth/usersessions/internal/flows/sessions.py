@@ -4,6 +4,7 @@ from django.http import HttpRequest
 from allauth.account.internal import flows
 from allauth.usersessions.adapter import get_adapter
 from allauth.usersessions.models import UserSession
+from allauth.usersessions.signals import sessions_ended
 
 
 def end_other_sessions(request: HttpRequest, user: AbstractBaseUser) -> None:
@@ -18,5 +19,6 @@ def end_other_sessions(request: HttpRequest, user: AbstractBaseUser) -> None:
 def end_sessions(request: HttpRequest, sessions) -> None:
     has_current = any([session.is_current() for session in sessions])
     get_adapter().end_sessions(sessions)
+    sessions_ended.send(sender=UserSession, request=request, sessions=sessions)
     if has_current:
         flows.logout.logout(request)
@@ -1,7 +1,7 @@
 from django.http import HttpRequest
 
 from allauth.usersessions import app_settings
-from allauth.usersessions.models import UserSession
+from allauth.usersessions.internal import activitykit
 
 
 class UserSessionsMiddleware:
@@ -16,6 +16,6 @@ class UserSessionsMiddleware:
             and hasattr(request, "user")
             and request.user.is_authenticated
         ):
-            UserSession.objects.create_from_request(request)
+            activitykit.track_activity(request)
         response = self.get_response(request)
         return response
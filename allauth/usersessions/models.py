@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-from importlib import import_module
-
 from django.conf import settings
 from django.contrib.auth.base_user import AbstractBaseUser
 from django.core.exceptions import ImproperlyConfigured
@@ -14,7 +12,11 @@ from allauth import app_settings as allauth_settings
 from allauth.account.adapter import get_adapter
 from allauth.core import context
 from allauth.core.internal.httpkit import HTTP_USER_AGENT_MAX_LENGTH
-from allauth.core.internal.sessionkit import get_session_user
+from allauth.core.internal.sessionkit import (
+    get_session_store_class,
+    get_session_user,
+    load_sessions,
+)
 
 
 if not allauth_settings.USERSESSIONS_ENABLED:
@@ -26,10 +28,20 @@ if not allauth_settings.USERSESSIONS_ENABLED:
 class UserSessionManager(models.Manager):
     def purge_and_list(self, user: AbstractBaseUser) -> list["UserSession"]:
         ret = []
-        sessions = UserSession.objects.filter(user_id=user.pk)
-        for session in sessions.iterator():
-            if not session.purge():
+        sessions = list(UserSession.objects.filter(user_id=user.pk))
+        stores = load_sessions([session.session_key for session in sessions])
+        purge = []
+        for session in sessions:
+            store = stores.get(session.session_key)
+            # Even if the session still exists, it might be the case that the
+            # user session hash is out of sync. So, let's see if
+            # `django.contrib.auth` can find a user...
+            if store is None or not get_session_user(store):
+                purge.append(session.pk)
+            else:
                 ret.append(session)
+        if purge:
+            UserSession.objects.filter(pk__in=purge).delete()
         return ret
 
     def create_from_request(self, request: HttpRequest) -> None:
@@ -102,8 +114,7 @@ class UserSession(models.Model):
         return f"{self.ip} ({self.user_agent})"
 
     def _session_store(self, *args):
-        engine = import_module(settings.SESSION_ENGINE)
-        return engine.SessionStore(*args)
+        return get_session_store_class()(*args)
 
     def exists(self) -> bool:
         return self._session_store().exists(self.session_key)
@@ -125,7 +136,6 @@ class UserSession(models.Model):
         return self.session_key == context.request.session.session_key
 
     def end(self) -> None:
-        engine = import_module(settings.SESSION_ENGINE)
-        store = engine.SessionStore()
+        store = self._session_store()
         store.delete(self.session_key)
         self.delete()
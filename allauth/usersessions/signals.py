@@ -12,6 +12,12 @@ from .models import UserSession
 # - to_session: UserSession
 session_client_changed = Signal()
 
+# Emitted after sessions have been ended (e.g. signing out other sessions).
+# Arguments:
+# - request: HttpRequest
+# - sessions: list[UserSession]
+sessions_ended = Signal()
+
 
 def on_user_logged_in(sender, **kwargs) -> None:
     request = kwargs["request"]
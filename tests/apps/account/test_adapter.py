@@ -1,5 +1,6 @@
 import sys
 from http import HTTPStatus
+from unittest.mock import patch
 
 from django.core.exceptions import PermissionDenied
 from django.http import HttpResponseRedirect
@@ -7,7 +8,7 @@ from django.urls import reverse
 
 import pytest
 
-from allauth.account.adapter import DefaultAccountAdapter
+from allauth.account.adapter import DefaultAccountAdapter, get_adapter
 from allauth.core.exceptions import ImmediateHttpResponse
 
 
@@ -94,3 +95,38 @@ def test_get_client_ip_vs_invalid_x_forwarded_for(rf, x_forwarded_for, settings)
     request = rf.get("/", HTTP_X_FORWARDED_FOR=x_forwarded_for)
     with pytest.raises(PermissionDenied):
         DefaultAccountAdapter(request=request).get_client_ip(request)
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_send_bulk_notification_mail(
+    settings, user_factory, mailoutbox, django_assert_num_queries, workers
+):
+    settings.ACCOUNT_EMAIL_NOTIFICATIONS = True
+    users = [user_factory() for _ in range(5)]
+    batches = []
+    with patch("django.core.mail.backends.locmem.EmailBackend.open") as open_mock:
+        # One query for the current site, and one per batch to fetch the
+        # primary email addresses.
+        with django_assert_num_queries(4):
+            progress = get_adapter().send_bulk_notification_mail(
+                "account/email/password_changed",
+                iter(users),
+                batch_size=2,
+                workers=workers,
+                on_batch=lambda p: batches.append(p.last_pk),
+            )
+    assert open_mock.call_count == 1
+    assert progress.sent == 5
+    assert progress.batches == 3
+    assert batches == [users[1].pk, users[3].pk, users[4].pk]
+    assert [m.to[0] for m in mailoutbox] == [u.email for u in users]
+    assert "Your password has been changed." in mailoutbox[0].body
+
+
+def test_send_bulk_notification_mail_disabled(settings, user, mailoutbox):
+    settings.ACCOUNT_EMAIL_NOTIFICATIONS = False
+    progress = get_adapter().send_bulk_notification_mail(
+        "account/email/password_changed", [user]
+    )
+    assert progress.sent == 0
+    assert len(mailoutbox) == 0
@@ -1,7 +1,100 @@
+import json
+from datetime import timedelta
+
 from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.utils import timezone
+
+import pytest
+
+from allauth.account.models import EmailAddress, EmailConfirmation
 
 
 def test_unset_multipleprimaryemails(db):
     # This command needs to be dropped, in favor of having a conditional
     # constraint.
     call_command("account_unsetmultipleprimaryemails")
+
+
+def test_sendnotificationmail(settings, user_factory, mailoutbox, tmp_path):
+    settings.ACCOUNT_EMAIL_NOTIFICATIONS = True
+    users = [user_factory() for _ in range(5)]
+    user_factory(with_email=False)
+    state_file = tmp_path / "state.json"
+
+    call_command(
+        "account_sendnotificationmail",
+        "account/email/password_changed",
+        "--batch-size=2",
+        f"--state-file={state_file}",
+    )
+
+    assert sorted(m.to[0] for m in mailoutbox) == sorted(u.email for u in users)
+    state = json.loads(state_file.read_text())
+    assert state["sent"] == 5
+    assert state["skipped"] == 1
+
+    # Resuming a completed run does not resend anything.
+    mailoutbox.clear()
+    call_command(
+        "account_sendnotificationmail",
+        "account/email/password_changed",
+        f"--state-file={state_file}",
+    )
+    assert len(mailoutbox) == 0
+
+
+def test_sendnotificationmail_resume(settings, user_factory, mailoutbox, tmp_path):
+    settings.ACCOUNT_EMAIL_NOTIFICATIONS = True
+    users = [user_factory() for _ in range(3)]
+    state_file = tmp_path / "state.json"
+    state_file.write_text(
+        json.dumps(
+            {
+                "template_prefix": "account/email/password_changed",
+                "last_pk": users[0].pk,
+                "sent": 1,
+                "skipped": 0,
+            }
+        )
+    )
+    call_command(
+        "account_sendnotificationmail",
+        "account/email/password_changed",
+        f"--state-file={state_file}",
+    )
+    assert [m.to[0] for m in mailoutbox] == [u.email for u in users[1:]]
+    assert json.loads(state_file.read_text())["sent"] == 3
+
+    with pytest.raises(CommandError):
+        call_command(
+            "account_sendnotificationmail",
+            "account/email/password_set",
+            f"--state-file={state_file}",
+        )
+
+
+def test_clearexpiredconfirmations(user, capsys, django_assert_num_queries):
+    email_address = EmailAddress.objects.get(user=user)
+    now = timezone.now()
+    expired = [
+        EmailConfirmation.objects.create(
+            email_address=email_address, key=f"expired{i}", sent=now - timedelta(days=7)
+        )
+        for i in range(5)
+    ]
+    valid = EmailConfirmation.objects.create(
+        email_address=email_address, key="valid", sent=now
+    )
+    unsent = EmailConfirmation.objects.create(email_address=email_address, key="unsent")
+
+    # Three chunks, each consisting of one select and one (raw) delete.
+    with django_assert_num_queries(6):
+        call_command("account_clearexpiredconfirmations", "--chunk-size=2")
+
+    assert not EmailConfirmation.objects.filter(pk__in=[c.pk for c in expired]).exists()
+    assert set(EmailConfirmation.objects.values_list("pk", flat=True)) == {
+        valid.pk,
+        unsent.pk,
+    }
+    assert "5 expired email confirmation(s) deleted." in capsys.readouterr().out
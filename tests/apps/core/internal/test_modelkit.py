@@ -3,7 +3,11 @@ from datetime import date, datetime
 from django.contrib.postgres.fields import ArrayField
 from django.core.files.base import ContentFile
 from django.db import models
+from django.db.models.signals import post_delete
 
+import pytest
+
+from allauth.account.models import EmailAddress
 from allauth.core.internal import modelkit
 
 
@@ -95,3 +99,32 @@ def test_serializer_binary_field():
     assert serialized["bb_empty"] == ""
     assert deserialized.bb == b"some binary data"
     assert deserialized.bb_empty == b""
+
+
+@pytest.mark.parametrize("with_receiver", [False, True])
+def test_delete_in_chunks(db, user_factory, with_receiver):
+    users = [user_factory() for _ in range(5)]
+    deleted = []
+
+    def receiver(sender, instance, **kwargs):
+        deleted.append(instance.pk)
+
+    qs = EmailAddress.objects.filter(user__in=users[:4])
+    if with_receiver:
+        post_delete.connect(receiver, sender=EmailAddress)
+    try:
+        chunks = []
+        before = []
+        progress = modelkit.delete_in_chunks(
+            qs,
+            chunk_size=3,
+            on_chunk=lambda p: chunks.append(p.deleted),
+            before_chunk=lambda chunk: before.append(chunk.count()),
+        )
+    finally:
+        post_delete.disconnect(receiver, sender=EmailAddress)
+    assert progress.deleted == 4
+    assert chunks == [3, 4]
+    assert before == [3, 1]
+    assert list(EmailAddress.objects.values_list("user", flat=True)) == [users[4].pk]
+    assert len(deleted) == (4 if with_receiver else 0)
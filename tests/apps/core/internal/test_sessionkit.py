@@ -0,0 +1,53 @@
+from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY
+
+import pytest
+
+from allauth.core.internal import sessionkit
+
+
+@pytest.fixture(
+    params=[
+        "django.contrib.sessions.backends.db",
+        "django.contrib.sessions.backends.cache",
+        "django.contrib.sessions.backends.cached_db",
+        "django.contrib.sessions.backends.file",
+    ]
+)
+def session_engine(request, settings, enable_cache, db, tmp_path):
+    settings.SESSION_ENGINE = request.param
+    settings.SESSION_FILE_PATH = str(tmp_path)
+    return request.param
+
+
+def test_load_sessions(session_engine, user):
+    SessionStore = sessionkit.get_session_store_class()
+    keys = []
+    for i in range(3):
+        store = SessionStore()
+        store[SESSION_KEY] = str(user.pk)
+        store[BACKEND_SESSION_KEY] = "django.contrib.auth.backends.ModelBackend"
+        store[HASH_SESSION_KEY] = user.get_session_auth_hash()
+        store["i"] = i
+        store.create()
+        keys.append(store.session_key)
+    SessionStore().delete(keys[1])
+
+    stores = sessionkit.load_sessions(keys + ["unknown", None])
+
+    assert set(stores.keys()) == {keys[0], keys[2]}
+    assert stores[keys[0]]["i"] == 0
+    assert stores[keys[2]]["i"] == 2
+    assert sessionkit.get_session_user(stores[keys[2]]) == user
+
+
+def test_load_sessions_db_queries(settings, db, django_assert_num_queries):
+    settings.SESSION_ENGINE = "django.contrib.sessions.backends.db"
+    SessionStore = sessionkit.get_session_store_class()
+    keys = []
+    for i in range(5):
+        store = SessionStore()
+        store.create()
+        keys.append(store.session_key)
+    with django_assert_num_queries(1):
+        stores = sessionkit.load_sessions(keys)
+    assert len(stores) == 5
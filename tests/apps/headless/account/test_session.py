@@ -1,5 +1,7 @@
 from http import HTTPStatus
+from unittest.mock import patch
 
+from django.core.cache import caches
 from django.test.client import Client
 from django.urls import reverse
 
@@ -33,3 +35,34 @@ def test_logout_no_token(app_client, user):
     resp = app_client.delete(reverse("headless:app:account:current_session"))
     assert resp.status_code == HTTPStatus.UNAUTHORIZED
     assert "session_token" not in resp.json()["meta"]
+
+
+def test_app_session_loaded_once(app_client, user, django_assert_num_queries):
+    app_client.force_login(user)
+    # The session, the user, and the pending login stage check.
+    with django_assert_num_queries(3):
+        resp = app_client.get(reverse("headless:app:account:current_session"))
+    assert resp.status_code == HTTPStatus.OK
+
+
+def test_app_session_loaded_once_from_cache(
+    app_client, user, settings, enable_cache, django_assert_num_queries
+):
+    settings.SESSION_ENGINE = "django.contrib.sessions.backends.cache"
+    app_client.force_login(user)
+    session_cache = caches[settings.SESSION_CACHE_ALIAS]
+    with (
+        patch.object(session_cache, "get", wraps=session_cache.get) as cache_get,
+        patch.object(
+            session_cache, "has_key", wraps=session_cache.has_key
+        ) as cache_has_key,
+        django_assert_num_queries(2),
+    ):
+        resp = app_client.get(reverse("headless:app:account:current_session"))
+    assert resp.status_code == HTTPStatus.OK
+    session_ops = [
+        call
+        for call in cache_get.call_args_list + cache_has_key.call_args_list
+        if app_client.session_token in call.args[0]
+    ]
+    assert len(session_ops) == 1
@@ -1,4 +1,14 @@
 from http import HTTPStatus
+from unittest.mock import patch
+
+from django.contrib.sites.models import Site
+from django.core.cache import cache
+
+import pytest
+
+from allauth.headless.internal import configcache
+from allauth.headless.internal.restkit import response as restkit_response
+from allauth.socialaccount.models import SocialApp
 
 
 def test_config(db, client, headless_reverse):
@@ -11,3 +21,99 @@ def test_config(db, client, headless_reverse):
         "socialaccount",
         "usersessions",
     }
+
+
+def test_config_not_modified(db, client, headless_reverse):
+    resp = client.get(headless_reverse("headless:config"))
+    assert "no-store" in resp["Cache-Control"]
+    resp = client.get(
+        headless_reverse("headless:config"), HTTP_IF_NONE_MATCH=resp["ETag"]
+    )
+    assert resp.status_code == HTTPStatus.NOT_MODIFIED
+
+
+@pytest.mark.parametrize(
+    "max_age,cache_control", [(0, "no-cache"), (300, "max-age=300")]
+)
+def test_config_max_age(db, settings, client, headless_reverse, max_age, cache_control):
+    settings.HEADLESS_CONFIG_MAX_AGE = max_age
+    resp = client.get(headless_reverse("headless:config"))
+    assert resp["Cache-Control"] == cache_control
+
+
+def test_config_cached(
+    db, settings, enable_cache, client, headless_reverse, django_assert_num_queries
+):
+    settings.HEADLESS_CONFIG_CACHE_TIMEOUT = 60
+
+    def provider_ids():
+        resp = client.get(headless_reverse("headless:config"))
+        return {p["id"] for p in resp.json()["data"]["socialaccount"]["providers"]}
+
+    assert "google" not in provider_ids()
+    with django_assert_num_queries(0):
+        client.get(headless_reverse("headless:config"))
+
+    app = SocialApp.objects.create(
+        provider="google", client_id="client-id", secret="secret"
+    )
+    app.sites.add(Site.objects.get_current())
+    assert "google" in provider_ids()
+
+
+def test_config_exposes_tokens_once(db, client, headless_reverse):
+    with patch(
+        "allauth.headless.internal.authkit.expose_access_token",
+        return_value={"access_token": "token"},
+    ) as expose_access_token:
+        resp = client.get(headless_reverse("headless:config"))
+    assert expose_access_token.call_count == 1
+    assert resp.json()["meta"]["access_token"] == "token"
+    assert "ETag" not in resp
+
+
+def test_config_version_evicted(
+    db, settings, enable_cache, client, headless_reverse, django_assert_num_queries
+):
+    settings.HEADLESS_CONFIG_CACHE_TIMEOUT = 60
+    configcache.invalidate()
+    client.get(headless_reverse("headless:config"))
+    # The version got evicted, and the social apps are changed in (and,
+    # invalidated by) another process.
+    cache.delete(configcache.VERSION_KEY)
+    key, entry = next(iter(configcache._documents.items()))
+    configcache.invalidate()
+    configcache._documents[key] = entry
+    with django_assert_num_queries(1):
+        client.get(headless_reverse("headless:config"))
+
+
+def test_bootstrap_unauthenticated(db, client, headless_reverse):
+    resp = client.get(headless_reverse("headless:bootstrap"))
+    assert resp.status_code == HTTPStatus.OK
+    data = resp.json()["data"]
+    assert set(data.keys()) == {"config", "session"}
+    assert data["config"] == client.get(headless_reverse("headless:config")).json()
+    assert data["session"]["status"] == HTTPStatus.UNAUTHORIZED
+
+
+def test_bootstrap_authenticated(auth_client, headless_reverse):
+    data = auth_client.get(headless_reverse("headless:bootstrap")).json()["data"]
+    for key, viewname in [
+        ("session", "headless:account:current_session"),
+        ("email", "headless:account:manage_email"),
+        ("authenticators", "headless:mfa:authenticators"),
+        ("sessions", "headless:usersessions:sessions"),
+    ]:
+        assert data[key] == auth_client.get(headless_reverse(viewname)).json()
+
+
+def test_bootstrap_session_meta_once(auth_client, headless_reverse):
+    with patch.object(
+        restkit_response, "get_session_meta", return_value={"session_token": "new"}
+    ) as get_session_meta:
+        resp = auth_client.get(headless_reverse("headless:bootstrap"))
+    get_session_meta.assert_called_once()
+    body = resp.json()
+    assert body["meta"]["session_token"] == "new"
+    assert all("session_token" not in d.get("meta", {}) for d in body["data"].values())
@@ -25,7 +25,7 @@ class AppClient(Client):
         if self.session_token:
             kwargs["HTTP_X_SESSION_TOKEN"] = self.session_token
         resp = super().generic(*args, **kwargs)
-        if resp["content-type"] == "application/json":
+        if resp.get("content-type") == "application/json":
             data = resp.json()
             session_token = data.get("meta", {}).get("session_token")
             if session_token:
@@ -18,3 +18,13 @@ def test_invalid_authentication(rf, user, headless_client, auth_client):
     request = rf.get("/", HTTP_X_SESSION_TOKEN="wrong")
     result = XSessionTokenAuthentication().authenticate(request)
     assert result is None
+
+
+def test_authenticate_cached_per_request(
+    rf, user, app_client, django_assert_num_queries
+):
+    app_client.force_login(user)
+    request = rf.get("/", HTTP_X_SESSION_TOKEN=app_client.session_token)
+    auth_user, _ = XSessionTokenAuthentication().authenticate(request)
+    with django_assert_num_queries(0):
+        assert XSessionTokenAuthentication().authenticate(request)[0] == auth_user
@@ -0,0 +1,101 @@
+from http import HTTPStatus
+from unittest.mock import patch
+
+from django.db import transaction
+
+import pytest
+
+from allauth.account.models import EmailAddress
+from allauth.headless.internal import etagkit
+from allauth.mfa.models import Authenticator
+from allauth.socialaccount.models import SocialAccount
+
+
+@pytest.fixture(autouse=True)
+def conditional_requests(settings, enable_cache):
+    settings.HEADLESS_CONDITIONAL_REQUESTS = True
+
+
+def _get(client, url, etag=None):
+    if etag:
+        return client.get(url, HTTP_IF_NONE_MATCH=etag)
+    return client.get(url)
+
+
+def test_email(auth_client, user, headless_reverse, django_assert_max_num_queries):
+    url = headless_reverse("headless:account:manage_email")
+    resp = _get(auth_client, url)
+    assert resp.status_code == HTTPStatus.OK
+    assert resp["Cache-Control"] == "private, no-cache"
+    etag = resp["ETag"]
+    # Only the session and the user are loaded.
+    with django_assert_max_num_queries(2):
+        resp = _get(auth_client, url, etag)
+    assert resp.status_code == HTTPStatus.NOT_MODIFIED
+
+    EmailAddress.objects.create(user=user, email="other@example.com")
+    resp = _get(auth_client, url, etag)
+    assert resp.status_code == HTTPStatus.OK
+    assert len(resp.json()["data"]) == 2
+    assert resp["ETag"] != etag
+
+
+def test_email_changed_in_transaction(
+    auth_client, user, headless_reverse, django_capture_on_commit_callbacks
+):
+    url = headless_reverse("headless:account:manage_email")
+    with django_capture_on_commit_callbacks(execute=True):
+        with transaction.atomic():
+            EmailAddress.objects.create(user=user, email="other@example.com")
+            # A concurrent request, listing the email addresses before the
+            # commit.
+            etag = _get(auth_client, url)["ETag"]
+    resp = _get(auth_client, url, etag)
+    assert resp.status_code == HTTPStatus.OK
+    assert resp["ETag"] != etag
+
+
+def test_authenticators(user_with_totp, auth_client, headless_reverse):
+    url = headless_reverse("headless:mfa:authenticators")
+    etag = _get(auth_client, url)["ETag"]
+    assert _get(auth_client, url, etag).status_code == HTTPStatus.NOT_MODIFIED
+    Authenticator.objects.filter(user=user_with_totp).delete()
+    resp = _get(auth_client, url, etag)
+    assert resp.status_code == HTTPStatus.OK
+    assert resp.json()["data"] == []
+
+
+def test_provider_accounts(auth_client, user, headless_reverse):
+    url = headless_reverse("headless:socialaccount:manage_providers")
+    etag = _get(auth_client, url)["ETag"]
+    assert _get(auth_client, url, etag).status_code == HTTPStatus.NOT_MODIFIED
+    SocialAccount.objects.create(user=user, provider="dummy", uid="123")
+    resp = _get(auth_client, url, etag)
+    assert resp.status_code == HTTPStatus.OK
+    assert len(resp.json()["data"]) == 1
+
+
+def test_sessions(auth_client, headless_reverse):
+    url = headless_reverse("headless:usersessions:sessions")
+    etag = _get(auth_client, url)["ETag"]
+    assert _get(auth_client, url, etag).status_code == HTTPStatus.NOT_MODIFIED
+
+
+def test_exposed_session_token(auth_client, headless_reverse):
+    url = headless_reverse("headless:account:manage_email")
+    etag = _get(auth_client, url)["ETag"]
+    with patch.object(
+        etagkit, "get_session_meta", return_value={"session_token": "new"}
+    ) as get_session_meta:
+        resp = _get(auth_client, url, etag)
+    get_session_meta.assert_called_once()
+    assert resp.status_code == HTTPStatus.OK
+    assert resp.json()["meta"]["session_token"] == "new"
+    assert "ETag" not in resp
+
+
+def test_disabled(settings, auth_client, headless_reverse):
+    settings.HEADLESS_CONDITIONAL_REQUESTS = False
+    resp = _get(auth_client, headless_reverse("headless:account:manage_email"))
+    assert "ETag" not in resp
+    assert "no-store" in resp["Cache-Control"]
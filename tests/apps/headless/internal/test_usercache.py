@@ -0,0 +1,74 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+
+import pytest
+
+from allauth.headless.internal import usercache
+from allauth.headless.internal.sessionkit import authenticate_by_x_session_token
+
+
+@pytest.fixture(autouse=True)
+def user_cache_enabled(settings, enable_cache):
+    settings.HEADLESS_USER_CACHE_TIMEOUT = 60
+
+
+def test_get_user(user, django_assert_num_queries):
+    assert usercache.get_user(user.pk) == user
+    with django_assert_num_queries(0):
+        assert usercache.get_user(user.pk) == user
+
+
+def test_get_user_disabled(settings, user, django_assert_num_queries):
+    settings.HEADLESS_USER_CACHE_TIMEOUT = 0
+    usercache.get_user(user.pk)
+    with django_assert_num_queries(1):
+        assert usercache.get_user(user.pk) == user
+
+
+def test_saving_user_invalidates(user, django_assert_num_queries):
+    usercache.get_user(user.pk)
+    user.is_active = False
+    user.save()
+    with django_assert_num_queries(1):
+        assert not usercache.get_user(user.pk).is_active
+
+
+def test_saving_user_in_transaction_invalidates(
+    user, django_capture_on_commit_callbacks
+):
+    usercache.get_user(user.pk)
+    with django_capture_on_commit_callbacks(execute=True):
+        with transaction.atomic():
+            user.is_active = False
+            user.save()
+            # A concurrent request, not seeing the change yet, caches the
+            # user as it was before.
+            stale = get_user_model()._default_manager.get(pk=user.pk)
+            stale.is_active = True
+            version = cache.get(usercache._version_key(user.pk))
+            cache.set(usercache._user_key(user.pk), (version, stale))
+            assert usercache.get_user(user.pk).is_active
+    assert not usercache.get_user(user.pk).is_active
+
+
+def test_password_change_invalidates(user):
+    usercache.get_user(user.pk)
+    user.set_password("new-password")
+    user.save()
+    assert usercache.get_user(user.pk).check_password("new-password")
+
+
+def test_deleting_user_invalidates(user):
+    pk = user.pk
+    usercache.get_user(pk)
+    user.delete()
+    assert usercache.get_user(pk) is None
+
+
+def test_x_session_token_authentication(user, app_client, django_assert_num_queries):
+    app_client.force_login(user)
+    assert authenticate_by_x_session_token(app_client.session_token)[0] == user
+    # Only the session is loaded.
+    with django_assert_num_queries(1):
+        assert authenticate_by_x_session_token(app_client.session_token)[0] == user
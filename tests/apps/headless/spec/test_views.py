@@ -1,8 +1,15 @@
+import gzip
+import json
 from http import HTTPStatus
+from unittest.mock import patch
 
 from django import forms
 from django.urls import reverse
 
+import pytest
+
+from allauth.headless.spec.internal import documents
+
 
 def test_openapi_json(client):
     resp = client.get(reverse("headless:openapi_json"))
@@ -82,3 +89,51 @@ def test_openapi_json_with_custom_signup_form(settings, client):
         "pattern": r"^\d+(\.\d+)?$",
     }
     assert "hobbies" in base_signup["required"]
+
+
+@pytest.mark.parametrize("name", ["headless:openapi_json", "headless:openapi_yaml"])
+def test_openapi_not_modified(client, name):
+    resp = client.get(reverse(name))
+    assert resp.status_code == HTTPStatus.OK
+    assert "max-age=3600" in resp["Cache-Control"]
+    resp = client.get(reverse(name), HTTP_IF_NONE_MATCH=resp["ETag"])
+    assert resp.status_code == HTTPStatus.NOT_MODIFIED
+
+
+@pytest.mark.parametrize(
+    "accept_encoding,gzipped",
+    [
+        ("gzip", True),
+        ("br, gzip;q=0.5", True),
+        ("*", True),
+        ("gzip;q=0", False),
+        ("gzip; q=0.0, deflate", False),
+        ("*;q=0", False),
+        ("*, gzip;q=0", False),
+        ("identity", False),
+        ("", False),
+    ],
+)
+def test_openapi_gzip_negotiation(client, accept_encoding, gzipped):
+    resp = client.get(
+        reverse("headless:openapi_json"), HTTP_ACCEPT_ENCODING=accept_encoding
+    )
+    assert (resp.get("Content-Encoding") == "gzip") == gzipped
+
+
+def test_openapi_gzip(client):
+    plain = client.get(reverse("headless:openapi_json"))
+    resp = client.get(reverse("headless:openapi_json"), HTTP_ACCEPT_ENCODING="gzip")
+    assert resp["Content-Encoding"] == "gzip"
+    assert resp["ETag"] != plain["ETag"]
+    assert json.loads(gzip.decompress(resp.content)) == plain.json()
+
+
+def test_openapi_generated_once(client):
+    documents.clear_spec_documents()
+    with patch.object(
+        documents, "get_schema", wraps=documents.get_schema
+    ) as get_schema:
+        client.get(reverse("headless:openapi_json"))
+        client.get(reverse("headless:openapi_json"))
+    assert get_schema.call_count == 1
@@ -1,4 +1,6 @@
+import time
 from http import HTTPStatus
+from unittest.mock import patch
 
 from django.test.client import Client
 from django.urls import reverse, reverse_lazy
@@ -327,3 +329,265 @@ def test_hs256_fallback_to_secret_key(
         options={"verify_signature": True, "verify_iss": False, "verify_aud": False},
     )
     assert payload["sub"] == str(user.pk)
+
+
+def test_jwt_config_is_cached(settings):
+    from allauth.headless.tokens.strategies.jwt import internal
+
+    internal.clear_jwt_config()
+    with patch.object(
+        internal.jwkkit, "load_private_key", wraps=internal.jwkkit.load_private_key
+    ) as load_private_key:
+        config = internal._get_jwt_config()
+        assert internal._get_jwt_config() is config
+    assert load_private_key.call_count == 1
+    assert config.algorithm == "RS256"
+
+    settings.HEADLESS_JWT_ALGORITHM = "HS256"
+    settings.HEADLESS_JWT_PRIVATE_KEY = "super-secret"
+    config = internal._get_jwt_config()
+    assert config.algorithm == "HS256"
+    assert config.signing_key == "super-secret"
+
+
+def test_session_key_cipher_follows_secret_key(settings):
+    from allauth.headless.tokens.strategies.jwt import internal
+
+    sid = internal.session_key_to_sid("session-key")
+    assert internal.session_key_from_sid(sid) == "session-key"
+    settings.SECRET_KEY = "another-secret"
+    assert internal.session_key_from_sid(sid) != "session-key"
+
+
+def _generate_private_key_pem(algorithm: str) -> str:
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+
+    if algorithm == "ES256":
+        key = ec.generate_private_key(ec.SECP256R1())
+    elif algorithm == "ES384":
+        key = ec.generate_private_key(ec.SECP384R1())
+    elif algorithm == "EdDSA":
+        key = ed25519.Ed25519PrivateKey.generate()
+    else:
+        key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    return key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    ).decode()
+
+
+@pytest.mark.parametrize("algorithm", ["ES256", "ES384", "EdDSA"])
+def test_asymmetric_algorithms(
+    algorithm,
+    headless_client,
+    headless_reverse,
+    client,
+    settings,
+    user,
+    obtain_tokens,
+):
+    if headless_client == "browser":
+        return
+    from allauth.core.internal import jwkkit
+
+    pem = _generate_private_key_pem(algorithm)
+    settings.HEADLESS_JWT_ALGORITHM = algorithm
+    settings.HEADLESS_JWT_PRIVATE_KEY = pem
+    settings.HEADLESS_TOKEN_STRATEGY = (
+        "allauth.headless.tokens.strategies.jwt.JWTTokenStrategy"
+    )
+
+    access_token, _ = obtain_tokens(client)
+
+    header = jwt.get_unverified_header(access_token)
+    assert header["alg"] == algorithm
+    private_key = jwkkit.load_private_key(pem)
+    assert header["kid"] == jwkkit.private_key_to_jwk(private_key)["kid"]
+    payload = jwt.decode(
+        access_token,
+        key=private_key.public_key(),
+        algorithms=[algorithm],
+        options={"verify_signature": True, "verify_iss": False, "verify_aud": False},
+    )
+    assert payload["sub"] == str(user.pk)
+
+    at_client = Client(HTTP_AUTHORIZATION=f"Bearer {access_token}")
+    resp = at_client.get(headless_reverse("headless:account:current_session"))
+    assert resp.status_code == HTTPStatus.OK
+
+
+@pytest.mark.parametrize(
+    "algorithm,key_algorithm",
+    [("ES256", "ES384"), ("ES384", "EdDSA"), ("EdDSA", "RS256"), ("RS256", "ES256")],
+)
+def test_private_key_must_match_algorithm(settings, algorithm, key_algorithm):
+    from allauth.headless.tokens.strategies.jwt import internal
+
+    settings.HEADLESS_JWT_ALGORITHM = algorithm
+    settings.HEADLESS_JWT_PRIVATE_KEY = _generate_private_key_pem(key_algorithm)
+    with pytest.raises(ValueError, match="not suitable"):
+        internal._get_jwt_config()
+
+
+@pytest.fixture
+def cached_stateful_validation(settings, enable_cache):
+    settings.HEADLESS_TOKEN_STRATEGY = (
+        "allauth.headless.tokens.strategies.jwt.JWTTokenStrategy"
+    )
+    settings.HEADLESS_JWT_STATEFUL_VALIDATION_ENABLED = True
+    settings.HEADLESS_JWT_STATEFUL_VALIDATION_CACHE_TIMEOUT = 60
+
+
+def test_stateful_validation_cached(
+    headless_client,
+    client,
+    obtain_tokens,
+    django_assert_num_queries,
+    cached_stateful_validation,
+):
+    if headless_client == "browser":
+        return
+    from allauth.headless.tokens.strategies.jwt import internal
+
+    access_token, _ = obtain_tokens(client)
+    with django_assert_num_queries(1):
+        assert internal.validate_access_token(access_token)
+    with django_assert_num_queries(0):
+        assert internal.validate_access_token(access_token)
+
+
+def test_stateful_validation_cached_logout(
+    headless_client,
+    headless_reverse,
+    client,
+    obtain_tokens,
+    django_assert_num_queries,
+    cached_stateful_validation,
+):
+    if headless_client == "browser":
+        return
+    from allauth.headless.tokens.strategies.jwt import internal, revocation
+
+    access_token, _ = obtain_tokens(client)
+    other_access_token, _ = obtain_tokens(Client())
+    assert internal.validate_access_token(access_token)
+    assert internal.validate_access_token(other_access_token)
+
+    resp = Client(HTTP_AUTHORIZATION=f"Bearer {access_token}").delete(
+        headless_reverse("headless:account:current_session")
+    )
+    assert resp.status_code == HTTPStatus.UNAUTHORIZED
+    # Pretend another process still remembers the session as alive.
+    session_key = internal.session_key_from_sid(
+        jwt.decode(access_token, options={"verify_signature": False})["sid"]
+    )
+    revocation._alive[revocation._digest(session_key)] = (float("inf"), None)
+    assert internal.validate_access_token(access_token) is None
+    # Other sessions remain remembered as alive.
+    with django_assert_num_queries(0):
+        assert internal.validate_access_token(other_access_token)
+
+
+def test_stateful_validation_revoked_before_session_ends(
+    headless_client, client, obtain_tokens, cached_stateful_validation
+):
+    if headless_client == "browser":
+        return
+    from allauth.headless.tokens.strategies.jwt import internal, revocation
+
+    access_token, _ = obtain_tokens(client)
+    session_key = internal.session_key_from_sid(
+        jwt.decode(access_token, options={"verify_signature": False})["sid"]
+    )
+    revocation.revoke_session(session_key)
+    assert internal.validate_access_token(access_token) is None
+
+
+def test_stateful_validation_revoked_after_version_evicted(
+    headless_client, client, obtain_tokens, cached_stateful_validation
+):
+    if headless_client == "browser":
+        return
+    from django.core.cache import cache
+
+    from allauth.headless.tokens.strategies.jwt import internal, revocation
+
+    access_token, _ = obtain_tokens(client)
+    session_key = internal.session_key_from_sid(
+        jwt.decode(access_token, options={"verify_signature": False})["sid"]
+    )
+    revocation.revoke_session("some-other-session")
+    # Remembered as alive, as of the current revocation version.
+    assert internal.validate_access_token(access_token)
+    digest = revocation._digest(session_key)
+    entry = revocation._alive[digest]
+    cache.delete(revocation.VERSION_KEY)
+    revocation.revoke_session(session_key)
+    # Pretend another process still remembers the session as alive.
+    revocation._alive[digest] = entry
+    assert internal.validate_access_token(access_token) is None
+
+
+@pytest.mark.parametrize("seeded", [True, False])
+def test_stateful_validation_without_version(
+    headless_client, client, obtain_tokens, cached_stateful_validation, seeded
+):
+    if headless_client == "browser":
+        return
+    from django.core.cache import cache
+
+    from allauth.headless.tokens.strategies.jwt import internal, revocation
+
+    access_token, _ = obtain_tokens(client)
+    session_key = internal.session_key_from_sid(
+        jwt.decode(access_token, options={"verify_signature": False})["sid"]
+    )
+    assert internal.validate_access_token(access_token)
+    digest = revocation._digest(session_key)
+    expires_at = revocation._alive[digest][0]
+    revocation.revoke_session(session_key)
+    cache.delete(revocation.VERSION_KEY)
+    # Pretend another process remembered the session while there was no
+    # version.
+    revocation._alive[digest] = (expires_at, None)
+    if seeded:
+        assert internal.validate_access_token(access_token) is None
+        assert cache.get(revocation.VERSION_KEY) is not None
+    else:
+        with patch.object(revocation, "_get_version", return_value=None):
+            assert internal.validate_access_token(access_token) is None
+
+
+@pytest.mark.parametrize("storage", ["session", "cache"])
+def test_refresh_token_state_bounded(db, settings, enable_cache, user, storage):
+    from django.contrib.sessions.backends.db import SessionStore
+
+    from allauth.headless.tokens.strategies.jwt import internal
+
+    settings.HEADLESS_JWT_REFRESH_TOKEN_STATE_STORAGE = storage
+    settings.HEADLESS_JWT_MAX_REFRESH_TOKENS_PER_SESSION = 3
+    session = SessionStore()
+    session.create()
+    tokens = [internal.create_refresh_token(user, session) for _ in range(5)]
+    session.save()
+    assert ("headless_refresh_tokens" in session) == (storage == "session")
+
+    # The oldest ones are evicted.
+    assert [internal.validate_refresh_token(token) for token in tokens[:2]] == [
+        None,
+        None,
+    ]
+    for token in tokens[2:]:
+        assert internal.validate_refresh_token(token) is not None
+
+    # Expired ones are pruned on write.
+    state = internal.get_refresh_token_state(session)
+    jti = next(iter(state))
+    state[jti] = int(time.time()) - 1
+    internal.set_refresh_token_state(session, state)
+    internal.create_refresh_token(user, session)
+    state = internal.get_refresh_token_state(session)
+    assert jti not in state
+    assert len(state) == 3
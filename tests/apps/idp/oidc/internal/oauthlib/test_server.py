@@ -0,0 +1,19 @@
+from allauth.core.context import request_context
+from allauth.idp.oidc.internal.oauthlib.server import get_device_server, get_server
+
+
+def test_servers_are_reused():
+    assert get_server() is get_server()
+    assert get_device_server() is get_device_server()
+
+
+def test_device_server_resolves_settings_lazily(rf, settings):
+    server = get_device_server()
+    settings.ALLOWED_HOSTS = ["idp.example.com"]
+    settings.IDP_OIDC_DEVICE_CODE_INTERVAL = 7
+    settings.IDP_OIDC_DEVICE_CODE_EXPIRES_IN = 42
+    assert server.interval == 7
+    assert server.expires_in == 42
+    with request_context(rf.get("/", HTTP_HOST="idp.example.com")):
+        assert server.verification_uri.startswith("http://idp.example.com/")
+        assert server.verification_uri_complete("ABCD").endswith("?code=ABCD")
@@ -0,0 +1,93 @@
+from django.db import transaction
+
+import pytest
+
+from allauth.account.models import EmailAddress
+from allauth.idp.oidc.adapter import DefaultOIDCAdapter, get_adapter
+
+
+SCOPES = ["openid", "email", "profile"]
+
+
+@pytest.fixture(autouse=True)
+def claims_cache_enabled(settings, enable_cache):
+    settings.IDP_OIDC_CLAIMS_CACHE_TIMEOUT = 60
+
+
+def test_claims_are_cached(db, oidc_client, user, django_assert_num_queries):
+    adapter = get_adapter()
+    claims = adapter.get_claims("userinfo", user, oidc_client, SCOPES)
+    assert claims["email"] == user.email
+    with django_assert_num_queries(0):
+        assert adapter.get_claims("userinfo", user, oidc_client, SCOPES) == claims
+
+
+def test_email_change_invalidates(db, oidc_client, user):
+    adapter = get_adapter()
+    adapter.get_claims("userinfo", user, oidc_client, SCOPES)
+    EmailAddress.objects.filter(user=user).delete()
+    EmailAddress.objects.create(
+        user=user, email="new@example.com", primary=True, verified=False
+    )
+    claims = adapter.get_claims("userinfo", user, oidc_client, SCOPES)
+    assert claims["email"] == "new@example.com"
+    assert claims["email_verified"] is False
+
+
+def test_user_change_invalidates(db, oidc_client, user):
+    adapter = get_adapter()
+    adapter.get_claims("userinfo", user, oidc_client, SCOPES)
+    user.first_name = "Changed"
+    user.save()
+    claims = adapter.get_claims("userinfo", user, oidc_client, SCOPES)
+    assert claims["given_name"] == "Changed"
+
+
+def test_user_change_in_transaction_invalidates(
+    db, oidc_client, user, django_capture_on_commit_callbacks
+):
+    adapter = get_adapter()
+    adapter.get_claims("userinfo", user, oidc_client, SCOPES)
+    with django_capture_on_commit_callbacks(execute=True):
+        with transaction.atomic():
+            user.first_name = "Changed"
+            user.save()
+            # A concurrent request, not seeing the change yet, caches the
+            # claims as they were before.
+            user.first_name = "Stale"
+            assert (
+                adapter.get_claims("userinfo", user, oidc_client, SCOPES)["given_name"]
+                == "Stale"
+            )
+            user.first_name = "Changed"
+    claims = adapter.get_claims("userinfo", user, oidc_client, SCOPES)
+    assert claims["given_name"] == "Changed"
+
+
+def test_selected_email_is_part_of_key(db, oidc_client, user):
+    EmailAddress.objects.create(user=user, email="other@example.com", verified=True)
+    adapter = get_adapter()
+    claims = adapter.get_claims("userinfo", user, oidc_client, SCOPES)
+    assert claims["email"] == user.email
+    claims = adapter.get_claims(
+        "userinfo", user, oidc_client, SCOPES, email="other@example.com"
+    )
+    assert claims["email"] == "other@example.com"
+
+
+def test_custom_cache_keys(db, oidc_client, user):
+    subs = {user.pk: "alpha"}
+
+    class Adapter(DefaultOIDCAdapter):
+        def get_claims_cache_keys(self, user, client):
+            return ["subs"]
+
+        def get_user_sub(self, client, user):
+            return subs[user.pk]
+
+    adapter = Adapter()
+    assert adapter.get_claims("userinfo", user, oidc_client, SCOPES)["sub"] == "alpha"
+    subs[user.pk] = "beta"
+    assert adapter.get_claims("userinfo", user, oidc_client, SCOPES)["sub"] == "alpha"
+    adapter.invalidate_claims_cache("subs")
+    assert adapter.get_claims("userinfo", user, oidc_client, SCOPES)["sub"] == "beta"
@@ -1,9 +1,19 @@
 from datetime import timedelta
+from unittest.mock import patch
 
 from django.utils import timezone
 
-from allauth.idp.oidc.internal.private_keys import filter_keys, pick_signing_key
+from allauth.core.internal import jwkkit
+from allauth.idp.oidc.internal.private_keys import (
+    clear_key_cache,
+    filter_keys,
+    get_key_ring,
+    load_key,
+    pick_signing_key,
+)
 from allauth.idp.oidc.models import PrivateKey
+from tests.apps.idp.oidc.internal.test_tokens import PREVIOUS_PRIVATE_KEY
+from tests.projects.common.settings import IDP_OIDC_PRIVATE_KEY
 
 
 def _key(pem="pem", **kwargs):
@@ -77,3 +87,38 @@ def test_pick_signing_key_dated_beats_undated():
     dated = _key(pem="dated", issued_at=now - timedelta(days=365))
     assert pick_signing_key([undated, dated]) is dated
     assert pick_signing_key([dated, undated]) is dated
+
+
+def test_load_key_parses_once():
+    clear_key_cache()
+    key = _key(pem=IDP_OIDC_PRIVATE_KEY)
+    with patch.object(
+        jwkkit, "load_jwk_from_pem", wraps=jwkkit.load_jwk_from_pem
+    ) as load_mock:
+        loaded = load_key(key)
+        assert load_key(_key(pem=IDP_OIDC_PRIVATE_KEY)) is loaded
+    assert load_mock.call_count == 1
+    jwk_dict, _ = jwkkit.load_jwk_from_pem(IDP_OIDC_PRIVATE_KEY)
+    assert loaded.jwk == jwk_dict
+    assert loaded.kid == jwk_dict["kid"]
+
+
+def test_get_key_ring():
+    clear_key_cache()
+    current = _key(pem=IDP_OIDC_PRIVATE_KEY)
+    previous = _key(pem=PREVIOUS_PRIVATE_KEY)
+    with patch.object(
+        jwkkit, "load_jwk_from_pem", wraps=jwkkit.load_jwk_from_pem
+    ) as load_mock:
+        ring = get_key_ring([current])
+        assert get_key_ring([_key(pem=IDP_OIDC_PRIVATE_KEY)]) is ring
+        assert load_mock.call_count == 1
+        # Adding a key rebuilds the ring, parsing only the new key.
+        new_ring = get_key_ring([current, previous])
+        assert new_ring is not ring
+        assert load_mock.call_count == 2
+    kids = [key.kid for key in new_ring.keys]
+    assert new_ring.get(kids[0]).jwk == ring.keys[0].jwk
+    assert new_ring.get(kids[1]).jwk["kid"] == kids[1]
+    assert new_ring.get("unknown") is None
+    assert [jwk["kid"] for jwk in new_ring.get_jwks()] == kids
@@ -0,0 +1,35 @@
+from django.contrib.auth.hashers import make_password
+
+from allauth.idp.oidc.internal import secretkit
+from allauth.idp.oidc.models import Client
+
+
+def test_hash_and_verify():
+    encoded = secretkit.hash_secret("s3cr3t")
+    assert encoded.startswith(f"{secretkit.ALGORITHM}$")
+    assert encoded != secretkit.hash_secret("s3cr3t")
+    assert secretkit.verify_secret("s3cr3t", encoded) == (True, False)
+    assert secretkit.verify_secret("wrong", encoded) == (False, False)
+
+
+def test_verify_with_rotated_secret_key(settings):
+    encoded = secretkit.hash_secret("s3cr3t")
+    settings.SECRET_KEY_FALLBACKS = [settings.SECRET_KEY]
+    settings.SECRET_KEY = "rotated"
+    assert secretkit.verify_secret("s3cr3t", encoded) == (True, True)
+    settings.SECRET_KEY_FALLBACKS = []
+    assert secretkit.verify_secret("s3cr3t", encoded) == (False, False)
+    assert secretkit.verify_secret("s3cr3t", secretkit.hash_secret("s3cr3t")) == (
+        True,
+        False,
+    )
+
+
+def test_legacy_hash_is_upgraded(db):
+    client = Client.objects.create(secret=make_password("s3cr3t"))
+    assert not client.check_secret("wrong")
+    assert not client.secret.startswith(secretkit.ALGORITHM)
+    assert client.check_secret("s3cr3t")
+    client.refresh_from_db()
+    assert client.secret.startswith(f"{secretkit.ALGORITHM}$")
+    assert client.check_secret("s3cr3t")
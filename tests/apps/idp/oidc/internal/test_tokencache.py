@@ -0,0 +1,92 @@
+from http import HTTPStatus
+
+from django.urls import reverse
+
+import pytest
+
+from allauth.idp.oidc.internal import tokencache
+
+
+@pytest.fixture(autouse=True)
+def cache_enabled(settings, enable_cache):
+    settings.IDP_OIDC_ACCESS_TOKEN_CACHE_TIMEOUT = 60
+
+
+@pytest.fixture
+def userinfo(client):
+    def f(token):
+        return client.get(
+            reverse("idp:oidc:userinfo"), HTTP_AUTHORIZATION=f"Bearer {token}"
+        )
+
+    return f
+
+
+def test_lookup_access_token(
+    db, oidc_client, user, access_token_factory, django_assert_num_queries
+):
+    token, instance = access_token_factory(oidc_client, user)
+    assert tokencache.lookup_access_token(token) == (instance, False)
+    with django_assert_num_queries(0):
+        cached, is_cached = tokencache.lookup_access_token(token)
+        assert cached.client == oidc_client
+    assert is_cached
+    assert cached == instance
+    with django_assert_num_queries(1):
+        assert cached.user == user
+
+
+def test_lookup_access_token_disabled(
+    settings, db, oidc_client, user, access_token_factory
+):
+    settings.IDP_OIDC_ACCESS_TOKEN_CACHE_TIMEOUT = 0
+    token, instance = access_token_factory(oidc_client, user)
+    assert tokencache.lookup_access_token(token) == (instance, False)
+    assert tokencache.lookup_access_token(token) == (instance, False)
+
+
+def test_inactive_user_not_cached(db, oidc_client, user, access_token_factory):
+    token, _ = access_token_factory(oidc_client, user)
+    user.is_active = False
+    user.save()
+    tokencache.lookup_access_token(token)
+    _, is_cached = tokencache.lookup_access_token(token)
+    assert not is_cached
+
+
+def test_revocation_invalidates(
+    client, oidc_client, oidc_client_secret, user, access_token_factory, userinfo
+):
+    token, _ = access_token_factory(oidc_client, user)
+    assert userinfo(token).status_code == HTTPStatus.OK
+    resp = client.post(
+        reverse("idp:oidc:revoke"),
+        data={
+            "client_id": oidc_client.id,
+            "client_secret": oidc_client_secret,
+            "token": token,
+        },
+    )
+    assert resp.status_code == HTTPStatus.OK
+    assert userinfo(token).status_code == HTTPStatus.UNAUTHORIZED
+
+
+def test_user_deactivation_invalidates(
+    oidc_client, user, access_token_factory, userinfo
+):
+    token, _ = access_token_factory(oidc_client, user)
+    assert userinfo(token).status_code == HTTPStatus.OK
+    user.is_active = False
+    user.save(update_fields=["is_active"])
+    assert userinfo(token).status_code == HTTPStatus.UNAUTHORIZED
+
+
+def test_client_change_invalidates(oidc_client, user, access_token_factory):
+    token, _ = access_token_factory(oidc_client, user)
+    tokencache.lookup_access_token(token)
+    assert tokencache.lookup_access_token(token)[1]
+    oidc_client.name = "Renamed"
+    oidc_client.save()
+    cached, is_cached = tokencache.lookup_access_token(token)
+    assert not is_cached
+    assert cached.client.name == "Renamed"
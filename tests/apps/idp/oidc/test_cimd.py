@@ -1,5 +1,6 @@
 import json
 import requests
+import time
 from http import HTTPStatus
 from unittest.mock import patch
 from urllib.parse import urlparse
@@ -199,17 +200,64 @@ def test_fetch_invalid_body(response_mock, body, error_match):
         cimd.fetch_metadata(CIMD_CLIENT_ID)
 
 
+def test_fetch_conditional(response_mock, requests_get_mock):
+    response_mock.status_code = HTTPStatus.NOT_MODIFIED
+    response_mock.headers = {"Cache-Control": "max-age=60"}
+    document = cimd.fetch_document(CIMD_CLIENT_ID, etag='"v1"')
+    assert document.not_modified
+    assert document.etag == '"v1"'
+    assert document.max_age == 60
+    assert requests_get_mock.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("", (None, None, False)),
+        ("public, max-age=300", (300, None, False)),
+        ("max-age=300, stale-while-revalidate=60", (300, 60, False)),
+        ("no-store", (0, 0, True)),
+        ("max-age=300, no-cache, stale-while-revalidate=60", (0, 0, True)),
+        ("max-age=bogus", (None, None, False)),
+    ],
+)
+def test_parse_cache_control(value, expected):
+    assert cimd.parse_cache_control(value) == expected
+
+
 def test_rate_limited(enable_cache, settings, request_context):
     settings.IDP_OIDC_RATE_LIMITS = {"cimd_fetch": "0/s/ip"}
     with pytest.raises(ValidationError, match="rate limited"):
-        cimd.fetch_metadata_safely(CIMD_CLIENT_ID)
+        cimd.fetch_document_safely(CIMD_CLIENT_ID)
 
 
-def test_thundering_herd_lock(enable_cache, request_context):
+def test_thundering_herd_lock(enable_cache, db, monkeypatch, request_context):
+    monkeypatch.setattr(cimd, "WAIT_TIMEOUT", 0.1)
     lock_key = f"allauth.cimd.fetch:{CIMD_CLIENT_ID}"
     cache.add(lock_key, True, timeout=10)
-    with pytest.raises(ValidationError, match="already in progress"):
-        cimd.fetch_metadata_safely(CIMD_CLIENT_ID)
+    with _mock_fetch() as mock_fetch:
+        assert cimd.refresh_client(CIMD_CLIENT_ID, None) is None
+    mock_fetch.assert_not_called()
+
+
+def test_thundering_herd_waiters_share_result(
+    cimd_enabled, enable_cache, db, monkeypatch, request_context
+):
+    lock_key = f"allauth.cimd.fetch:{CIMD_CLIENT_ID}"
+    cache.add(lock_key, True, timeout=10)
+
+    def fetch_elsewhere(key):
+        with _mock_fetch():
+            client = cimd.fetch_client(CIMD_CLIENT_ID)
+        client.save()
+        cache.delete(key)
+        return True
+
+    monkeypatch.setattr(cimd, "_wait_for_unlock", fetch_elsewhere)
+    with _mock_fetch() as mock_fetch:
+        client = cimd.refresh_client(CIMD_CLIENT_ID, None)
+    mock_fetch.assert_not_called()
+    assert client.id == CIMD_CLIENT_ID
 
 
 def test_lookup_non_cimd_returns_db_client(cimd_enabled, db):
@@ -223,12 +271,12 @@ def test_lookup_cimd_disabled(db, settings):
     assert result is None
 
 
-def _mock_fetch(metadata=None):
+def _mock_fetch(metadata=None, **kwargs):
     if metadata is None:
         metadata = _metadata_factory()
     return patch(
-        "allauth.idp.oidc.internal.cimd.fetch_metadata_safely",
-        return_value=metadata,
+        "allauth.idp.oidc.internal.cimd.fetch_document_safely",
+        return_value=cimd.Document(metadata=metadata, **kwargs),
     )
 
 
@@ -272,7 +320,7 @@ def test_lookup_fetch_failure_returns_stale(
 
     settings.IDP_OIDC_CIMD_CACHE_TIMEOUT = 0
     with patch(
-        "allauth.idp.oidc.internal.cimd.fetch_metadata_safely",
+        "allauth.idp.oidc.internal.cimd.fetch_document_safely",
         side_effect=requests.ConnectionError(),
     ):
         client = lookup_client(CIMD_CLIENT_ID)
@@ -284,8 +332,100 @@ def test_lookup_fetch_failure_no_existing(
     cimd_enabled, db, enable_cache, request_context
 ):
     with patch(
-        "allauth.idp.oidc.internal.cimd.fetch_metadata_safely",
+        "allauth.idp.oidc.internal.cimd.fetch_document_safely",
         side_effect=ValidationError("fail"),
     ):
         client = lookup_client(CIMD_CLIENT_ID)
     assert client is None
+
+
+def test_lookup_honors_max_age(cimd_enabled, db, enable_cache, request_context):
+    with _mock_fetch(max_age=0, stale_while_revalidate=60):
+        client = lookup_client(CIMD_CLIENT_ID)
+    client.data["updated_at"] -= 1
+    client.save()
+    with (
+        _mock_fetch() as mock_fetch,
+        patch.object(cimd, "revalidate_in_background") as mock_revalidate,
+    ):
+        client = lookup_client(CIMD_CLIENT_ID)
+    # Stale, but within the stale-while-revalidate window.
+    mock_fetch.assert_not_called()
+    mock_revalidate.assert_called_once()
+    assert client.name == "Example App"
+
+
+def test_lookup_stale_beyond_revalidate_window_blocks(
+    cimd_enabled, db, enable_cache, request_context
+):
+    with _mock_fetch(max_age=0, stale_while_revalidate=0):
+        lookup_client(CIMD_CLIENT_ID)
+    client = Client.objects.get(id=CIMD_CLIENT_ID)
+    client.data["updated_at"] -= 1
+    client.save()
+    with _mock_fetch(_metadata_factory(client_name="Updated App")):
+        client = lookup_client(CIMD_CLIENT_ID)
+    assert client.name == "Updated App"
+
+
+def test_lookup_without_stale_while_revalidate_blocks(
+    cimd_enabled, db, enable_cache, request_context
+):
+    with _mock_fetch(max_age=0):
+        lookup_client(CIMD_CLIENT_ID)
+    client = Client.objects.get(id=CIMD_CLIENT_ID)
+    client.data["updated_at"] -= 1
+    client.save()
+    with (
+        _mock_fetch(_metadata_factory(client_name="Updated App")),
+        patch.object(cimd, "revalidate_in_background") as mock_revalidate,
+    ):
+        client = lookup_client(CIMD_CLIENT_ID)
+    mock_revalidate.assert_not_called()
+    assert client.name == "Updated App"
+
+
+def test_lookup_no_store_never_stale(cimd_enabled, db, enable_cache, request_context):
+    with _mock_fetch(max_age=0, stale_while_revalidate=0, no_store=True):
+        lookup_client(CIMD_CLIENT_ID)
+    client = Client.objects.get(id=CIMD_CLIENT_ID)
+    assert client.data["no_store"]
+    client.data["updated_at"] -= 1
+    client.save()
+    with patch(
+        "allauth.idp.oidc.internal.cimd.fetch_document_safely",
+        side_effect=requests.ConnectionError(),
+    ):
+        assert lookup_client(CIMD_CLIENT_ID) is None
+
+
+def test_refresh_not_modified(cimd_enabled, db, enable_cache, request_context):
+    with _mock_fetch(etag='"v1"'):
+        client = lookup_client(CIMD_CLIENT_ID)
+    assert client.data["etag"] == '"v1"'
+    client.data["updated_at"] -= 100
+    client.save()
+    with patch(
+        "allauth.idp.oidc.internal.cimd.fetch_document_safely",
+        return_value=cimd.Document(etag='"v1"', not_modified=True),
+    ) as mock_fetch:
+        client = cimd.refresh_client(CIMD_CLIENT_ID, client)
+    mock_fetch.assert_called_once_with(CIMD_CLIENT_ID, etag='"v1"')
+    client.refresh_from_db()
+    assert client.name == "Example App"
+    assert client.data["updated_at"] >= int(time.time()) - 1
+
+
+def test_refresh_failure_backs_off(cimd_enabled, db, enable_cache, request_context):
+    with patch(
+        "allauth.idp.oidc.internal.cimd.fetch_document_safely",
+        side_effect=requests.ConnectionError(),
+    ) as mock_fetch:
+        assert cimd.refresh_client(CIMD_CLIENT_ID, None) is None
+        assert cimd.refresh_client(CIMD_CLIENT_ID, None) is None
+    mock_fetch.assert_called_once()
+
+    cache.delete(f"allauth.cimd.failures:{CIMD_CLIENT_ID}")
+    with _mock_fetch():
+        client = cimd.refresh_client(CIMD_CLIENT_ID, None)
+    assert client.id == CIMD_CLIENT_ID
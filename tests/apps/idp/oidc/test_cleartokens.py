@@ -3,6 +3,8 @@ from datetime import timedelta
 from django.core.management import call_command
 from django.utils import timezone
 
+import pytest
+
 from allauth.idp.oidc.models import Token
 
 
@@ -24,3 +26,48 @@ def test_cleartokens_deletes_only_expired(
     assert Token.objects.filter(pk=valid.pk).exists()
     assert Token.objects.filter(pk=never.pk).exists()
     assert "1 expired token(s) deleted." in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("raw", [False, True])
+def test_cleartokens_chunked(oidc_client, user, access_token_factory, capsys, raw):
+    now = timezone.now()
+    expired = [
+        access_token_factory(
+            oidc_client, user, expires_at=now - timedelta(seconds=i + 1)
+        )[1]
+        for i in range(5)
+    ]
+    valid = access_token_factory(
+        oidc_client, user, expires_at=now + timedelta(hours=1)
+    )[1]
+    expired_code = Token.objects.create(
+        type=Token.Type.AUTHORIZATION_CODE,
+        hash="expired-code",
+        client=oidc_client,
+        expires_at=now - timedelta(seconds=1),
+    )
+    args = ["--chunk-size=2", "-v2"]
+    if raw:
+        args.append("--raw")
+    call_command("oidc_cleartokens", *args)
+
+    assert not Token.objects.filter(
+        pk__in=[t.pk for t in expired + [expired_code]]
+    ).exists()
+    assert Token.objects.filter(pk=valid.pk).exists()
+    out = capsys.readouterr().out
+    assert "6 expired token(s) deleted." in out
+    assert "Maximum runtime exceeded" not in out
+
+
+def test_cleartokens_max_runtime(oidc_client, user, access_token_factory, capsys):
+    now = timezone.now()
+    for i in range(3):
+        access_token_factory(oidc_client, user, expires_at=now - timedelta(seconds=1))
+    call_command("oidc_cleartokens", "--chunk-size=1", "--max-runtime=0")
+    assert Token.objects.count() == 2
+    out = capsys.readouterr().out
+    assert "1 expired token(s) deleted." in out
+    assert "Maximum runtime exceeded" in out
+    call_command("oidc_cleartokens")
+    assert Token.objects.count() == 0
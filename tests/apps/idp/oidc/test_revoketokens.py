@@ -0,0 +1,135 @@
+from django.core.management import CommandError, call_command
+from django.urls import reverse
+
+import pytest
+
+from allauth.idp.oidc.adapter import get_adapter
+from allauth.idp.oidc.internal import tokencache
+from allauth.idp.oidc.models import Token
+from allauth.idp.oidc.signals import tokens_revoked
+
+
+@pytest.fixture
+def tokens(oidc_client_factory, user_factory, access_token_factory):
+    users = [user_factory(), user_factory()]
+    clients = [oidc_client_factory(), oidc_client_factory()]
+    return {
+        (user, client): access_token_factory(client, user)
+        for user in users
+        for client in clients
+    }
+
+
+@pytest.fixture
+def revoked_signals():
+    sent = []
+
+    def receiver(sender, **kwargs):
+        sent.append(kwargs)
+
+    tokens_revoked.connect(receiver)
+    yield sent
+    tokens_revoked.disconnect(receiver)
+
+
+def _remaining(tokens):
+    return {
+        key
+        for key, (_, instance) in tokens.items()
+        if Token.objects.filter(pk=instance.pk).exists()
+    }
+
+
+@pytest.mark.parametrize("chunk_size", [1, 1000])
+def test_revoke(tokens, revoked_signals, chunk_size):
+    (user, client), _ = next(iter(tokens.items()))
+    progress = Token.objects.filter(user=user).revoke(chunk_size=chunk_size)
+    assert progress.deleted == 2
+    assert progress.finished
+    assert _remaining(tokens) == {key for key in tokens if key[0] != user}
+    # A single signal, regardless of the number of chunks.
+    assert revoked_signals == [
+        {
+            "signal": tokens_revoked,
+            "count": 2,
+            "user_ids": {user.pk},
+            "client_ids": {c.pk for _, c in tokens},
+        }
+    ]
+
+
+def test_revoke_nothing(db, revoked_signals):
+    assert Token.objects.none().revoke().deleted == 0
+    assert revoked_signals == []
+
+
+@pytest.mark.parametrize("by", ["user", "client", "both"])
+def test_adapter_revoke_tokens(tokens, by):
+    (user, client), _ = next(iter(tokens.items()))
+    if by == "user":
+        count = get_adapter().revoke_tokens(user=user)
+        revoked = {key for key in tokens if key[0] == user}
+    elif by == "client":
+        count = get_adapter().revoke_tokens(client=client)
+        revoked = {key for key in tokens if key[1] == client}
+    else:
+        count = get_adapter().revoke_tokens(user=user, client=client)
+        revoked = {(user, client)}
+    assert count == len(revoked)
+    assert _remaining(tokens) == set(tokens) - revoked
+
+
+@pytest.mark.parametrize("chunk_size", [1, 1000])
+def test_revoke_invalidates_token_cache(settings, enable_cache, tokens, chunk_size):
+    settings.IDP_OIDC_ACCESS_TOKEN_CACHE_TIMEOUT = 60
+    (user, client), (value, _) = next(iter(tokens.items()))
+    assert tokencache.lookup_access_token(value)[0] is not None
+    assert tokencache.lookup_access_token(value)[1]
+    Token.objects.filter(client=client).revoke(chunk_size=chunk_size)
+    assert tokencache.lookup_access_token(value) == (None, False)
+
+
+def test_revoke_keeps_other_cached_tokens(settings, enable_cache, tokens):
+    settings.IDP_OIDC_ACCESS_TOKEN_CACHE_TIMEOUT = 60
+    (user, client), _ = next(iter(tokens.items()))
+    values = {key: value for key, (value, _) in tokens.items()}
+    for value in values.values():
+        assert tokencache.lookup_access_token(value)[0] is not None
+    Token.objects.filter(user=user, client=client).revoke()
+    for key, value in values.items():
+        if key == (user, client):
+            assert tokencache.lookup_access_token(value) == (None, False)
+        else:
+            # Still served from the cache.
+            assert tokencache.lookup_access_token(value)[1]
+
+
+def test_revoketokens_command(tokens, capsys):
+    (user, client), _ = next(iter(tokens.items()))
+    call_command("oidc_revoketokens", user=str(user.pk), client=client.pk)
+    assert _remaining(tokens) == set(tokens) - {(user, client)}
+    assert "1 token(s) revoked." in capsys.readouterr().out
+
+
+@pytest.mark.parametrize(
+    "kwargs,error",
+    [
+        ({}, "Pass --user and/or --client"),
+        ({"client": "unknown"}, "Unknown client"),
+        ({"user": "999999"}, "Unknown user"),
+    ],
+)
+def test_revoketokens_command_invalid(db, kwargs, error):
+    with pytest.raises(CommandError, match=error):
+        call_command("oidc_revoketokens", **kwargs)
+
+
+def test_admin_revoke_client_tokens(admin_client, tokens):
+    (_, client), _ = next(iter(tokens.items()))
+    resp = admin_client.post(
+        reverse("admin:allauth_idp_oidc_client_changelist"),
+        {"action": "revoke_tokens", "_selected_action": [client.pk]},
+        follow=True,
+    )
+    assert "2 tokens revoked." in resp.content.decode()
+    assert _remaining(tokens) == {key for key in tokens if key[1] != client}
@@ -0,0 +1,113 @@
+import base64
+from http import HTTPStatus
+
+from django.urls import reverse
+
+import pytest
+from oauthlib.common import Request
+
+from allauth.core.context import request_context
+from allauth.idp.oidc.internal.oauthlib.server import generate_jwt_access_token
+from allauth.idp.oidc.models import Token
+
+
+@pytest.fixture(autouse=True)
+def stateless(settings, enable_cache):
+    settings.IDP_OIDC_ACCESS_TOKEN_FORMAT = "jwt"
+    settings.IDP_OIDC_ACCESS_TOKEN_STATELESS = True
+
+
+@pytest.fixture
+def stateless_token(rf):
+    def f(client, user, scopes=["openid", "profile"]):
+        o_request = Request("/")
+        o_request.user = user
+        o_request.client = client
+        o_request.scopes = scopes
+        with request_context(rf.get("/")):
+            return generate_jwt_access_token(o_request)
+
+    return f
+
+
+def _userinfo(client, token):
+    return client.get(
+        reverse("idp:oidc:userinfo"), HTTP_AUTHORIZATION=f"Bearer {token}"
+    )
+
+
+def test_access_token_not_persisted(client, oidc_client, oidc_client_secret):
+    resp = client.post(
+        reverse("idp:oidc:token"),
+        data={
+            "grant_type": "client_credentials",
+            "scope": "profile",
+            "client_id": oidc_client.id,
+            "client_secret": oidc_client_secret,
+        },
+    )
+    assert resp.status_code == HTTPStatus.OK
+    assert resp.json()["access_token"].startswith("ey")
+    assert not Token.objects.filter(type=Token.Type.ACCESS_TOKEN).exists()
+
+
+def test_userinfo(client, oidc_client, user, stateless_token):
+    token = stateless_token(oidc_client, user)
+    resp = _userinfo(client, token)
+    assert resp.status_code == HTTPStatus.OK
+    assert resp.json()["sub"] == str(user.pk)
+
+
+def test_userinfo_inactive_user(client, oidc_client, user, stateless_token):
+    token = stateless_token(oidc_client, user)
+    user.is_active = False
+    user.save()
+    assert _userinfo(client, token).status_code == HTTPStatus.UNAUTHORIZED
+
+
+def test_userinfo_insufficient_scope(client, oidc_client, user, stateless_token):
+    token = stateless_token(oidc_client, user, scopes=["profile"])
+    assert _userinfo(client, token).status_code == HTTPStatus.UNAUTHORIZED
+
+
+def test_revoke(client, oidc_client, oidc_client_secret, user, stateless_token):
+    token = stateless_token(oidc_client, user)
+    resp = client.post(
+        reverse("idp:oidc:revoke"),
+        data={
+            "client_id": oidc_client.id,
+            "client_secret": oidc_client_secret,
+            "token": token,
+        },
+    )
+    assert resp.status_code == HTTPStatus.OK
+    assert _userinfo(client, token).status_code == HTTPStatus.UNAUTHORIZED
+    # Other tokens remain valid.
+    other_token = stateless_token(oidc_client, user)
+    assert _userinfo(client, other_token).status_code == HTTPStatus.OK
+
+
+def test_introspect(
+    client,
+    oidc_client,
+    oidc_client_secret,
+    user,
+    stateless_token,
+    settings_impacting_urls,
+):
+    token = stateless_token(oidc_client, user)
+    credentials = base64.b64encode(
+        f"{oidc_client.id}:{oidc_client_secret}".encode()
+    ).decode()
+    with settings_impacting_urls(IDP_OIDC_INTROSPECTION_ENABLED=True):
+        resp = client.post(
+            reverse("idp:oidc:introspect"),
+            data={"token": token},
+            HTTP_AUTHORIZATION=f"Basic {credentials}",
+        )
+    assert resp.status_code == HTTPStatus.OK
+    data = resp.json()
+    assert data["active"] is True
+    assert data["client_id"] == oidc_client.id
+    assert data["sub"] == str(user.pk)
+    assert data["scope"] == "openid profile"
@@ -360,3 +360,36 @@ def test_post_userinfo(
     assert resp.status_code == HTTPStatus.OK
     data = resp.json()
     assert data["sub"] == get_adapter().get_user_sub(oidc_client, user)
+
+
+@pytest.mark.parametrize("urlname", ["idp:oidc:jwks", "idp:oidc:configuration"])
+def test_well_known_not_modified(client, urlname):
+    url = reverse(urlname)
+    resp = client.get(url)
+    assert resp.status_code == HTTPStatus.OK
+    etag = resp["ETag"]
+    resp = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert resp.status_code == HTTPStatus.NOT_MODIFIED
+    assert resp["ETag"] == etag
+    assert resp["Access-Control-Allow-Origin"] == "*"
+    resp = client.get(url, HTTP_IF_NONE_MATCH='"stale"')
+    assert resp.status_code == HTTPStatus.OK
+
+
+def test_jwks_view_etag_changes_with_keys(client, settings):
+    etag = client.get(reverse("idp:oidc:jwks"))["ETag"]
+    settings.IDP_OIDC_PRIVATE_KEYS = [{"pem": PREVIOUS_PRIVATE_KEY}]
+    resp = client.get(reverse("idp:oidc:jwks"), HTTP_IF_NONE_MATCH=etag)
+    assert resp.status_code == HTTPStatus.OK
+    assert resp["ETag"] != etag
+    assert len(resp.json()["keys"]) == 2
+
+
+def test_configuration_view_etag_changes_with_settings(client, settings):
+    etag = client.get(reverse("idp:oidc:configuration"))["ETag"]
+    settings.IDP_OIDC_AUTH_METHODS = ["client_secret_basic"]
+    resp = client.get(reverse("idp:oidc:configuration"), HTTP_IF_NONE_MATCH=etag)
+    assert resp.status_code == HTTPStatus.OK
+    assert resp.json()["token_endpoint_auth_methods_supported"] == [
+        "client_secret_basic"
+    ]
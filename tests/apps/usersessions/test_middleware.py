@@ -1,10 +1,13 @@
-from unittest.mock import Mock
+import time
+from contextlib import contextmanager
+from unittest.mock import Mock, patch
 
 from django.contrib.auth.models import AnonymousUser
 from django.test.utils import override_settings
 
 import pytest
 
+from allauth.usersessions.internal import activitykit
 from allauth.usersessions.middleware import UserSessionsMiddleware
 from allauth.usersessions.models import UserSession
 from allauth.usersessions.signals import session_client_changed
@@ -91,3 +94,69 @@ def test_mw_change_ip_and_useragent(rf, db, user):
 
     # Clean up signal connection
     session_client_changed.disconnect(signal_handler)
+
+
+def _make_request(rf, user, session_key="sess-123", ip="1.1.1.1"):
+    request = rf.get("/")
+    request.user = user
+    request.session = Mock()
+    request.session.session_key = session_key
+    request.META["REMOTE_ADDR"] = ip
+    return request
+
+
+@contextmanager
+def _time_passed(seconds):
+    # Both the activity tracking and the (locmem) cache expiry go by
+    # ``time.time()``.
+    now = time.time()
+    with patch("time.time", return_value=now + seconds):
+        yield
+
+
+def test_mw_activity_interval(
+    rf, db, settings, user, enable_cache, django_assert_num_queries
+):
+    settings.USERSESSIONS_TRACK_ACTIVITY = True
+    settings.USERSESSIONS_TRACK_ACTIVITY_INTERVAL = 60
+    mw = UserSessionsMiddleware(lambda request: None)
+    mw(_make_request(rf, user))
+    last_seen_at = UserSession.objects.get(session_key="sess-123").last_seen_at
+
+    # Nothing changed, recently seen -- no need to touch the database.
+    with django_assert_num_queries(0):
+        mw(_make_request(rf, user))
+
+    # A change of client is recorded immediately.
+    mw(_make_request(rf, user, ip="2.2.2.2"))
+    session = UserSession.objects.get(session_key="sess-123")
+    assert session.ip == "2.2.2.2"
+    assert session.last_seen_at > last_seen_at
+
+    # Once the interval has passed, only last seen is updated.
+    last_seen_at = session.last_seen_at
+    with _time_passed(61), django_assert_num_queries(1):
+        mw(_make_request(rf, user, ip="2.2.2.2"))
+    assert UserSession.objects.get(session_key="sess-123").last_seen_at > last_seen_at
+
+
+def test_mw_activity_buffered(
+    rf, db, settings, user, enable_cache, django_assert_num_queries
+):
+    settings.USERSESSIONS_TRACK_ACTIVITY = True
+    settings.USERSESSIONS_TRACK_ACTIVITY_INTERVAL = 60
+    settings.USERSESSIONS_TRACK_ACTIVITY_BUFFER_SIZE = 2
+    mw = UserSessionsMiddleware(lambda request: None)
+    activitykit.flush_last_seen()
+    for key in ["sess-1", "sess-2"]:
+        mw(_make_request(rf, user, session_key=key))
+    last_seen = dict(UserSession.objects.values_list("session_key", "last_seen_at"))
+
+    with _time_passed(61):
+        with django_assert_num_queries(0):
+            mw(_make_request(rf, user, session_key="sess-1"))
+        # Buffer is full, flushed in one go.
+        with django_assert_num_queries(2):
+            mw(_make_request(rf, user, session_key="sess-2"))
+    for session in UserSession.objects.all():
+        assert session.last_seen_at > last_seen[session.session_key]
@@ -60,3 +60,20 @@ def test_change_password_updates_user_session(
     assert len(UserSession.objects.purge_and_list(user)) == (
         0 if logout_on_passwd_change else 1
     )
+
+
+def test_purge_and_list_queries(user, user_password, django_assert_max_num_queries):
+    clients = [Client(), Client(), Client()]
+    for client in clients:
+        resp = client.post(
+            reverse("account_login"),
+            {"login": user.username, "password": user_password},
+        )
+        assert resp.status_code == HTTPStatus.FOUND
+    clients[1].logout()
+    # One query for the user sessions, one for the Django sessions, one user
+    # lookup per session, and one to delete the purged session.
+    with django_assert_max_num_queries(5):
+        sessions = UserSession.objects.purge_and_list(user)
+    assert len(sessions) == 2
+    assert UserSession.objects.filter(user=user).count() == 2
@@ -0,0 +1,183 @@
+"""
+Shared plumbing for the (offline) benchmarks.  These are not part of the test
+suite, run them as a module against the test project instead, e.g.::
+
+    python -m tests.benchmarks.idp_discovery
+
+Pass ``--json <path>`` to (also) write the results as JSON, suitable for
+tracking regressions over time.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import time
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
+from typing import Callable, Iterator
+
+
+CACHE_METHODS = (
+    "add",
+    "get",
+    "set",
+    "touch",
+    "delete",
+    "get_many",
+    "get_or_set",
+    "has_key",
+    "incr",
+    "decr",
+    "set_many",
+    "delete_many",
+    "clear",
+)
+
+
+@dataclass
+class Result:
+    name: str
+    latencies: list[float]
+    # Requests performed per iteration, for benchmarks covering a flow.
+    requests: int = 1
+    queries: int = 0
+    cache_ops: int = 0
+
+    @property
+    def rps(self) -> float:
+        total = sum(self.latencies)
+        return self.requests * len(self.latencies) / total if total else 0.0
+
+    def percentile(self, pct: int) -> float:
+        return statistics.quantiles(self.latencies, n=100)[pct - 1]
+
+    @property
+    def queries_per_request(self) -> float:
+        return self.queries / (self.requests * len(self.latencies))
+
+    @property
+    def cache_ops_per_request(self) -> float:
+        return self.cache_ops / (self.requests * len(self.latencies))
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "iterations": len(self.latencies),
+            "requests": self.requests,
+            "rps": self.rps,
+            "p50": self.percentile(50),
+            "p99": self.percentile(99),
+            "queries_per_request": self.queries_per_request,
+            "cache_ops_per_request": self.cache_ops_per_request,
+        }
+
+
+class Counter:
+    def __init__(self) -> None:
+        self.queries = 0
+        self.cache_ops = 0
+        # Cache methods implemented in terms of other cache methods (e.g.
+        # ``get_many()``) count as a single operation.
+        self._cache_depth = 0
+
+    def count_query(self, execute, sql, params, many, context):
+        self.queries += 1
+        return execute(sql, params, many, context)
+
+    def wrap_cache_method(self, method):
+        def wrapped(*args, **kwargs):
+            if not self._cache_depth:
+                self.cache_ops += 1
+            self._cache_depth += 1
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self._cache_depth -= 1
+
+        return wrapped
+
+
+@contextmanager
+def count() -> Iterator[Counter]:
+    """
+    Counts the database queries and cache operations performed, on all of the
+    configured databases and caches.
+    """
+    from django.core.cache import caches
+    from django.db import connections
+
+    counter = Counter()
+    with ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(counter.count_query))
+        for backend in caches.all(initialized_only=False):
+            for name in CACHE_METHODS:
+                setattr(
+                    backend, name, counter.wrap_cache_method(getattr(backend, name))
+                )
+                stack.callback(delattr, backend, name)
+        yield counter
+
+
+def parse_args(description: str | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--json", metavar="PATH", help="Write the results as JSON.")
+    return parser.parse_args()
+
+
+def setup(settings_module: str = "tests.projects.regular.settings") -> None:
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", settings_module)
+    import django
+
+    django.setup()
+
+    from django.db import connection
+    from django.test.utils import setup_test_environment
+
+    setup_test_environment()
+    connection.creation.create_test_db(verbosity=0)
+
+
+def run(
+    name: str,
+    fn: Callable[[], object],
+    *,
+    iterations: int = 1000,
+    warmup: int = 10,
+    requests: int = 1,
+) -> Result:
+    for _ in range(warmup):
+        fn()
+    latencies = []
+    with count() as counter:
+        for _ in range(iterations):
+            started_at = time.perf_counter()
+            fn()
+            latencies.append(time.perf_counter() - started_at)
+    return Result(
+        name=name,
+        latencies=latencies,
+        requests=requests,
+        queries=counter.queries,
+        cache_ops=counter.cache_ops,
+    )
+
+
+def report(results: list[Result], json_path: str | None = None) -> None:
+    width = max(len(result.name) for result in results)
+    print(
+        f"{'benchmark':<{width}}  {'req/s':>10}  {'p50 (ms)':>9}  {'p99 (ms)':>9}"
+        f"  {'queries':>7}  {'cache':>7}"
+    )
+    for result in results:
+        print(
+            f"{result.name:<{width}}  {result.rps:>10.1f}  "
+            f"{result.percentile(50) * 1000:>9.3f}  {result.percentile(99) * 1000:>9.3f}"
+            f"  {result.queries_per_request:>7.2f}  {result.cache_ops_per_request:>7.2f}"
+        )
+    if json_path:
+        with open(json_path, "w") as f:
+            json.dump([result.to_dict() for result in results], f, indent=2)
@@ -0,0 +1,60 @@
+"""
+Start up cost of a (browser) frontend: fetching the configuration, the
+session, the email addresses, the authenticators and the user sessions using
+separate requests, versus fetching all of them using the bootstrap endpoint.
+"""
+
+from __future__ import annotations
+
+from tests.benchmarks import harness
+
+
+SEPARATE = [
+    "headless:browser:config",
+    "headless:browser:account:current_session",
+    "headless:browser:account:manage_email",
+    "headless:browser:mfa:authenticators",
+    "headless:browser:usersessions:sessions",
+]
+
+
+def main() -> None:
+    options = harness.parse_args(__doc__)
+    harness.setup()
+    harness.report(run(), json_path=options.json)
+
+
+def run() -> list[harness.Result]:
+    from django.contrib.auth import get_user_model
+    from django.test import Client
+    from django.urls import reverse
+
+    from allauth.account.models import EmailAddress
+
+    user = get_user_model().objects.create_user(
+        username="benchmark", email="benchmark@example.com"
+    )
+    EmailAddress.objects.create(
+        user=user, email=user.email, primary=True, verified=True
+    )
+    client = Client()
+    client.force_login(user)
+    urls = [reverse(name) for name in SEPARATE]
+    bootstrap_url = reverse("headless:browser:bootstrap")
+
+    def separate():
+        for url in urls:
+            assert client.get(url).status_code == 200  # nosec
+
+    def bootstrap():
+        assert client.get(bootstrap_url).status_code == 200  # nosec
+
+    # Per frontend start up, not per request, so that both are comparable.
+    return [
+        harness.run("separate requests", separate, iterations=200),
+        harness.run("bootstrap request", bootstrap, iterations=200),
+    ]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Throughput of the headless JWT token strategy: creating and validating access
+tokens, both with the key material parsed once (the default), and parsed
+again for each token, as used to be the case.
+"""
+
+from __future__ import annotations
+
+from tests.benchmarks import harness
+
+
+def main() -> None:
+    options = harness.parse_args(__doc__)
+    harness.setup()
+    harness.report(run(), json_path=options.json)
+
+
+def run() -> list[harness.Result]:
+    from django.contrib.auth import get_user_model
+    from django.contrib.sessions.backends.db import SessionStore
+
+    from allauth.headless.tokens.strategies.jwt import internal
+
+    user = get_user_model().objects.create_user(username="benchmark")
+    session = SessionStore()
+    session["benchmark"] = True
+    session.create()
+    access_token = internal.create_access_token(user, session, {})
+
+    def create():
+        internal.create_access_token(user, session, {})
+
+    def validate():
+        assert internal.validate_access_token(access_token)  # nosec
+
+    def uncached(fn):
+        def wrapped():
+            internal.clear_jwt_config()
+            fn()
+
+        return wrapped
+
+    return [
+        harness.run("create access token (uncached)", uncached(create), iterations=100),
+        harness.run("create access token", create),
+        harness.run(
+            "validate access token (uncached)", uncached(validate), iterations=100
+        ),
+        harness.run("validate access token", validate),
+    ]
+
+
+if __name__ == "__main__":
+    main()
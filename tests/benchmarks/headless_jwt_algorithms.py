@@ -0,0 +1,85 @@
+"""
+Signing and verification throughput, and the resulting access token size, of
+the algorithms supported by the headless JWT token strategy.
+"""
+
+from __future__ import annotations
+
+from tests.benchmarks import harness
+
+
+ALGORITHMS = ["HS256", "RS256", "ES256", "ES384", "EdDSA"]
+
+
+def main() -> None:
+    options = harness.parse_args(__doc__)
+    harness.setup()
+    results, sizes = run()
+    harness.report(results, json_path=options.json)
+    print()
+    for algorithm, size in sizes.items():
+        print(f"{algorithm:<6}  {size:>4} bytes per access token")
+
+
+def generate_private_key_pem(algorithm: str) -> str:
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+
+    if algorithm == "ES256":
+        key = ec.generate_private_key(ec.SECP256R1())
+    elif algorithm == "ES384":
+        key = ec.generate_private_key(ec.SECP384R1())
+    elif algorithm == "EdDSA":
+        key = ed25519.Ed25519PrivateKey.generate()
+    else:
+        key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    return key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    ).decode()
+
+
+def run() -> tuple[list[harness.Result], dict[str, int]]:
+    from django.contrib.auth import get_user_model
+    from django.contrib.sessions.backends.db import SessionStore
+    from django.test import override_settings
+
+    from allauth.headless.tokens.strategies.jwt import internal
+
+    user = get_user_model().objects.create_user(username="benchmark")
+    session = SessionStore()
+    session["benchmark"] = True
+    session.create()
+
+    results = []
+    sizes = {}
+    for algorithm in ALGORITHMS:
+        private_key = (
+            "benchmark-secret-" * 2
+            if algorithm.startswith("HS")
+            else generate_private_key_pem(algorithm)
+        )
+        with override_settings(
+            HEADLESS_JWT_ALGORITHM=algorithm, HEADLESS_JWT_PRIVATE_KEY=private_key
+        ):
+            access_token = internal.create_access_token(user, session, {})
+            sizes[algorithm] = len(access_token)
+
+            def sign():
+                internal.create_access_token(user, session, {})
+
+            def verify(access_token=access_token):
+                assert internal.decode_token(access_token, "access")  # nosec
+
+            results.extend(
+                [
+                    harness.run(f"{algorithm} sign", sign),
+                    harness.run(f"{algorithm} verify", verify),
+                ]
+            )
+    return results, sizes
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Requests per second served by the IdP ``.well-known`` endpoints (JWKS and
+OpenID configuration), both for regular and for conditional (``If-None-Match``)
+requests, compared to serving them without the precomputed documents.
+"""
+
+from __future__ import annotations
+
+from tests.benchmarks import harness
+
+
+def main() -> None:
+    options = harness.parse_args(__doc__)
+    harness.setup()
+
+    from django.test import Client
+    from django.urls import reverse
+
+    from allauth.idp.oidc.internal import metadata, private_keys
+
+    client = Client()
+    results = []
+    for urlname in ("idp:oidc:jwks", "idp:oidc:configuration"):
+        url = reverse(urlname)
+        etag = client.get(url)["ETag"]
+
+        def uncached(url=url):
+            private_keys.clear_key_cache()
+            metadata.clear_server_metadata_documents()
+            client.get(url)
+
+        results.extend(
+            [
+                harness.run(f"{urlname} (uncached)", uncached),
+                harness.run(urlname, lambda url=url: client.get(url)),
+                harness.run(
+                    f"{urlname} (304)",
+                    lambda url=url, etag=etag: client.get(url, HTTP_IF_NONE_MATCH=etag),
+                ),
+            ]
+        )
+    harness.report(results, json_path=options.json)
+
+
+if __name__ == "__main__":
+    main()
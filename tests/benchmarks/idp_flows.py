@@ -0,0 +1,189 @@
+"""
+Throughput of the IdP token endpoint and authorization flows, driven by
+oauthlib acting as the (local) client: authorization code (with PKCE),
+refresh token (with and without rotation), client credentials, device code
+polling, introspection and userinfo.
+"""
+
+from __future__ import annotations
+
+import base64
+from urllib.parse import urlencode
+
+from tests.benchmarks import harness
+
+
+REDIRECT_URI = "https://rp.example.com/callback"
+SCOPE = ["openid", "profile", "email"]
+SECRET = "secret"
+FORM = "application/x-www-form-urlencoded"
+
+
+def main() -> None:
+    options = harness.parse_args(__doc__)
+    harness.setup()
+
+    from django.test import override_settings
+
+    # Before the URLs are loaded, as the introspection URL is conditional.
+    with override_settings(
+        CACHES={
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+        },
+        IDP_OIDC_INTROSPECTION_ENABLED=True,
+        IDP_OIDC_RATE_LIMITS=False,
+        IDP_OIDC_DEVICE_CODE_INTERVAL=0,
+    ):
+        harness.report(run(), json_path=options.json)
+
+
+def create_client(*, public: bool, grant_types: list[str]):
+    from allauth.idp.oidc.models import Client
+
+    client = Client.objects.create(name="benchmark", skip_consent=True)
+    if public:
+        client.type = Client.Type.PUBLIC
+    else:
+        client.set_secret(SECRET)
+    client.set_redirect_uris([REDIRECT_URI])
+    client.set_scopes(SCOPE)
+    client.set_grant_types(grant_types)
+    client.set_response_types(["code"])
+    client.save()
+    return client
+
+
+def run() -> list[harness.Result]:
+    from django.contrib.auth import get_user_model
+    from django.test import Client as TestClient, override_settings
+    from django.urls import reverse
+
+    from oauthlib.oauth2 import (
+        BackendApplicationClient,
+        DeviceClient,
+        WebApplicationClient,
+    )
+
+    from allauth.idp.oidc.models import Client
+
+    user = get_user_model().objects.create_user(
+        username="benchmark", email="benchmark@example.com", password=SECRET
+    )
+    browser = TestClient()
+    browser.force_login(user)
+    api = TestClient()
+    token_url = reverse("idp:oidc:token")
+
+    web_client = create_client(
+        public=True,
+        grant_types=[
+            Client.GrantType.AUTHORIZATION_CODE,
+            Client.GrantType.REFRESH_TOKEN,
+        ],
+    )
+    service_client = create_client(
+        public=False, grant_types=[Client.GrantType.CLIENT_CREDENTIALS]
+    )
+    device_client = create_client(
+        public=True, grant_types=[Client.GrantType.DEVICE_CODE]
+    )
+    credentials = base64.b64encode(f"{service_client.id}:{SECRET}".encode())
+    service_auth = {"HTTP_AUTHORIZATION": f"Basic {credentials.decode()}"}
+
+    def post_token(body: str, **headers):
+        resp = api.post(token_url, body, content_type=FORM, **headers)
+        assert resp.status_code == 200, resp.content  # nosec
+        return resp.json()
+
+    def authorization_code() -> dict:
+        oauth = WebApplicationClient(web_client.id)
+        code_verifier = oauth.create_code_verifier(64)
+        uri = oauth.prepare_request_uri(
+            "https://testserver" + reverse("idp:oidc:authorization"),
+            redirect_uri=REDIRECT_URI,
+            scope=SCOPE,
+            state="state",
+            nonce="nonce",
+            code_challenge=oauth.create_code_challenge(code_verifier, "S256"),
+            code_challenge_method="S256",
+        )
+        resp = browser.get(uri)
+        assert resp.status_code == 302, resp.content  # nosec
+        oauth.parse_request_uri_response(resp["location"], state="state")
+        return post_token(
+            oauth.prepare_request_body(
+                code=oauth.code,
+                redirect_uri=REDIRECT_URI,
+                code_verifier=code_verifier,
+            )
+        )
+
+    def refresh_token(rotate: bool):
+        refresh = authorization_code()["refresh_token"]
+        oauth = WebApplicationClient(web_client.id)
+
+        def fn():
+            nonlocal refresh
+            with override_settings(IDP_OIDC_ROTATE_REFRESH_TOKEN=rotate):
+                data = post_token(
+                    oauth.prepare_refresh_body(
+                        refresh_token=refresh, client_id=web_client.id
+                    )
+                )
+            refresh = data.get("refresh_token", refresh)
+
+        return fn
+
+    def client_credentials():
+        oauth = BackendApplicationClient(service_client.id)
+        return post_token(
+            oauth.prepare_request_body(scope=["profile"], include_client_id=False),
+            **service_auth,
+        )
+
+    resp = api.post(
+        reverse("idp:oidc:device_code"),
+        urlencode({"client_id": device_client.id, "scope": "openid"}),
+        content_type=FORM,
+    )
+    device_code = resp.json()["device_code"]
+    device_body = DeviceClient(device_client.id).prepare_request_body(
+        device_code, include_client_id=True
+    )
+
+    def device_code_poll():
+        resp = api.post(token_url, device_body, content_type=FORM)
+        assert resp.json() == {"error": "authorization_pending"}  # nosec
+
+    access_token = authorization_code()["access_token"]
+    service_token = client_credentials()["access_token"]
+
+    def introspect():
+        api.post(
+            reverse("idp:oidc:introspect"),
+            urlencode({"token": service_token}),
+            content_type=FORM,
+            **service_auth,
+        )
+
+    def userinfo():
+        api.get(
+            reverse("idp:oidc:userinfo"),
+            HTTP_AUTHORIZATION=f"Bearer {access_token}",
+        )
+
+    return [
+        harness.run(
+            "authorization_code+pkce", authorization_code, iterations=300, requests=2
+        ),
+        harness.run("refresh_token (rotate)", refresh_token(True), iterations=300),
+        harness.run("refresh_token (no rotate)", refresh_token(False), iterations=300),
+        harness.run("client_credentials", client_credentials, iterations=300),
+        harness.run("device_code (pending)", device_code_poll),
+        harness.run("introspect", introspect),
+        harness.run("userinfo", userinfo),
+    ]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+The per request savings of reusing the oauthlib servers: the cost of
+constructing them, and the requests per second of the (client credentials)
+token and introspection endpoints.
+"""
+
+from __future__ import annotations
+
+import base64
+
+from tests.benchmarks import harness
+
+
+def main() -> None:
+    options = harness.parse_args(__doc__)
+    harness.setup()
+
+    from django.test import override_settings
+
+    # Before the URLs are loaded, as the introspection URL is conditional.
+    with override_settings(
+        IDP_OIDC_INTROSPECTION_ENABLED=True, IDP_OIDC_RATE_LIMITS=False
+    ):
+        harness.report(run(), json_path=options.json)
+
+
+def run() -> list[harness.Result]:
+    from django.test import Client as TestClient
+    from django.urls import reverse
+
+    from allauth.idp.oidc.internal.oauthlib import server
+    from allauth.idp.oidc.models import Client
+
+    secret = "secret"
+    client = Client.objects.create(name="benchmark")
+    client.set_secret(secret)
+    client.set_scopes(["openid", "profile"])
+    client.set_grant_types([Client.GrantType.CLIENT_CREDENTIALS])
+    client.save()
+    credentials = base64.b64encode(f"{client.id}:{secret}".encode()).decode()
+    auth = {"HTTP_AUTHORIZATION": f"Basic {credentials}"}
+    test_client = TestClient()
+
+    def token():
+        return test_client.post(
+            reverse("idp:oidc:token"),
+            {"grant_type": "client_credentials", "scope": "profile"},
+            **auth,
+        )
+
+    access_token = token().json()["access_token"]
+
+    def introspect():
+        test_client.post(
+            reverse("idp:oidc:introspect"), {"token": access_token}, **auth
+        )
+
+    def construct_servers():
+        server.OAuthLibServer()
+        server.DeviceOAuthLibServer()
+
+    def fresh(fn):
+        def wrapped():
+            server._server = server._device_server = None
+            fn()
+
+        return wrapped
+
+    return [
+        harness.run("construct servers", construct_servers),
+        harness.run("token (new server)", fresh(token), iterations=300),
+        harness.run("token (reused server)", token, iterations=300),
+        harness.run("introspect (new server)", fresh(introspect)),
+        harness.run("introspect (reused server)", introspect),
+    ]
+
+
+if __name__ == "__main__":
+    main()